@@ -8,6 +8,7 @@ from .kgrid import Kgrid
 from .gplot import Gplot
 from .prep import Calibrator
 from .kprofile import Kprofile, KprofileCSV, Pplot, ProfilePicker
+from .kpoints import KpointsCSV
 from . import utils
 
 Kdata.__module__ = "pygeko"
@@ -16,10 +17,11 @@ Kgrid.__module__ = "pygeko"
 Calibrator.__module__ = "pygeko"
 Kprofile.__module__ = "pygeko"
 KprofileCSV.__module__ = "pygeko"
+KpointsCSV.__module__ = "pygeko"
 ProfilePicker__module__ = "pygeko"
 Pplot.__module__ = "pygeko"
 utils.__module__ = "pygeko"
 
 
-__all__ = ["Kdata", "Gplot", "Kgrid", "Calibrator", "Kprofile", "KprofileCSV","Pplot", "utils", "__version__"]
+__all__ = ["Kdata", "Gplot", "Kgrid", "Calibrator", "Kprofile", "KprofileCSV", "KpointsCSV", "Pplot", "utils", "__version__"]
 
@@ -1,10 +1,132 @@
 """Extract and print information from `.gck` file"""
 
 import argparse
+import json
 import os
 
 import joblib
 
+HEADER_EXT = ".json"
+"""Extension of the metadata header written next to each `.gck` file"""
+
+
+def _json_default(obj):
+    """
+    Internal function to serialize NumPy values in JSON headers.
+
+    :param obj: object not serializable by `json`
+    :type obj: object
+    :return: serializable equivalent
+    :rtype: object
+    """
+    if hasattr(obj, "tolist"):  # NumPy arrays and scalars
+        return obj.tolist()
+    return str(obj)
+
+
+def write_gck_header(filename: str, metadata: dict, payload: dict):
+    """
+    Write the small uncompressed metadata header of a `.gck` file
+    (`<filename>.json`), so that `lsgck` and `catgck` do not need to
+    load and decompress the whole file.
+
+    Must be called after the `.gck` file is written: the header stores its
+    size and is ignored if it does not match.
+
+    :param filename: `.gck` filename
+    :type filename: str
+    :param metadata: checkpoint metadata
+    :type metadata: dict
+    :param payload: checkpoint payload
+    :type payload: dict
+    """
+    summary = {k: payload.get(k) for k in ("title", "x_col", "y_col", "z_col")}
+    summary["crossvaldata"] = [
+        {k: res.get(k) for k in ("model_idx", "zk", "mae", "rmse", "corr")}
+        for res in (payload.get("crossvaldata") or [])
+    ]
+    header = {
+        "gck_size": os.path.getsize(filename),
+        "metadata": metadata,
+        "payload": summary,
+    }
+    with open(filename + HEADER_EXT, "w") as f:
+        json.dump(header, f, default=_json_default)
+
+
+def read_gck_header(filename: str) -> dict:
+    """
+    Read the metadata header of a `.gck` file.
+
+    :param filename: `.gck` filename
+    :type filename: str
+    :return: header dict, or None if missing, unreadable or out of date
+    :rtype: dict
+    """
+    try:
+        with open(filename + HEADER_EXT) as f:
+            header = json.load(f)
+        if header.get("gck_size") != os.path.getsize(filename):
+            return None
+        return header
+    except (OSError, ValueError):
+        return None
+
+
+def load_gck(filename: str, mmap: bool = True) -> dict:
+    """
+    Load a GCK checkpoint. Uncompressed files (`Kdata.save(compress=0)`) are
+    opened with `mmap_mode='r'` when `mmap` is True, so their arrays are
+    paged in lazily and shared between processes through the OS page cache.
+    Uncompressed files are detected from the file itself (a plain pickle
+    stream), so the `.json` header is not needed.
+
+    :param filename: `.gck` filename
+    :type filename: str
+    :param mmap: memory-map the arrays of uncompressed files, defaults to True
+    :type mmap: bool, optional
+    :return: checkpoint
+    :rtype: dict
+    """
+    mmap_mode = None
+    if mmap:
+        # Compressed joblib files start with the compressor magic number,
+        # uncompressed ones with the pickle PROTO opcode
+        with open(filename, "rb") as f:
+            if f.read(1) == b"\x80":
+                mmap_mode = "r"
+    return joblib.load(filename, mmap_mode=mmap_mode)
+
+
+def read_gck_summary(filename: str) -> tuple[dict, dict]:
+    """
+    Reads the metadata and a payload summary (title, column mapping and
+    cross-validation results) of a GCK file, from its header when available.
+
+    :param filename: filename or filename base (without extension)
+    :type filename: str
+    :raises FileNotFoundError: file do not exist
+    :raises RuntimeError: run time error
+    :return: tuple with metadata and payload summary, (None, None) for old files without metadata
+    :rtype: tuple[dict, dict]
+    """
+    if not filename.endswith(".gck"):
+        filename += ".gck"
+
+    header = read_gck_header(filename)
+    if header is not None:
+        return header["metadata"], header["payload"]
+
+    if not os.path.exists(filename):
+        raise FileNotFoundError(f"File not found: {filename}")
+    try:
+        checkpoint = joblib.load(filename)
+    except Exception as e:
+        raise RuntimeError(f"Error reading GCK file: {e}")
+    if not isinstance(checkpoint, dict) or "metadata" not in checkpoint:
+        return None, None
+    return checkpoint["metadata"], checkpoint["payload"]
+
 
 def read_gck(filename: str) -> tuple[dict, dict]:
     """
@@ -41,10 +163,13 @@ def print_gck(filename: str, prec: bool = False):
     :type prec: bool, optional
     """
     try:
-        meta, payload = read_gck(filename)
+        meta, payload = read_gck_summary(filename)
     except Exception as e:
         print(f"Error: {e}")
         return
+    if meta is None:
+        print("Error: old file or file without metadata")
+        return
 
     # --- 1. Print header & metadata ---
     p = meta.get("params", {})
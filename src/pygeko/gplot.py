@@ -12,7 +12,7 @@ import plotly.graph_objects as go
 from matplotlib import cm  # noqa: F401
 from datetime import datetime
 
-from pygeko.utils import calc_res
+from pygeko.utils import build_pyramid, calc_res, read_pyramid
 from pygeko.kprofile import ProfilePicker
 
 plt.rcParams["savefig.directory"] = os.getcwd()
@@ -49,18 +49,19 @@ class Gplot:
     Plotting methods for grids
     """
 
-    def __init__(self, fnamebase: str):
+    def __init__(self, fnamebase: str, dtype: str = None):
         """
         Class constructor
 
         :param fnamebase: `grd` and `hdr` filename base
         :type fnamebase: str
+        :param dtype: dtype of the Z and SIGMA arrays ("float64" or "float32"),
+            defaults to None (the `dtype` of the `.hdr` file, or float64).
+            X and Y are always float64
+        :type dtype: str, optional
         """
         self.title = self.grd_file = os.path.basename(fnamebase)
 
-        # Load grid data
-        self.grid_df = pd.read_csv(fnamebase + ".grd", comment="#")
-
         # Load metadata
         self._meta = {}
         try:
@@ -72,6 +73,20 @@ class Gplot:
         except FileNotFoundError:
             print(f"Warning: Metadata file not found {fnamebase}.hdr")
 
+        # Load grid data
+        dtype = np.dtype(dtype or self._meta.get("dtype", "float64"))
+        self.grid_df = pd.read_csv(
+            fnamebase + ".grd",
+            comment="#",
+            dtype={
+                "X": np.float64,
+                "Y": np.float64,
+                "Z_ESTIM": dtype,
+                "SIGMA": dtype,
+                "SPREAD": dtype,
+            },
+        )
+
         # Extract dimensions and prepare 2D arrays for plotting
         # We use the column names defined in the exporter
         self.nx = int(self._meta.get("bins", 100))
@@ -81,7 +96,14 @@ class Gplot:
         self.X = self.grid_df["X"].values.reshape(self.ny, self.nx)
         self.Y = self.grid_df["Y"].values.reshape(self.ny, self.nx)
         self.Z = self.grid_df["Z_ESTIM"].values.reshape(self.ny, self.nx)
-        self.E = self.grid_df["SIGMA"].values.reshape(self.ny, self.nx)
+        # Z-only grids (estimated with return_sigma=False) have no SIGMA
+        self.E = (
+            self.grid_df["SIGMA"].values.reshape(self.ny, self.nx)
+            if "SIGMA" in self.grid_df
+            else None
+        )
+        # Overview pyramid for large grids (built on demand if there is no .ovr file)
+        self._pyramid = read_pyramid(fnamebase)
         # Other
         self._sealevel = None
         self.calib_dic = None
@@ -112,9 +134,80 @@ class Gplot:
         z_val = self.Z[iy, ix]
         if self._sealevel is not None:
             z_val -= self._sealevel
+        if self.E is None:
+            return f"X={x:.2f}, Y={y:.2f} | Z={z_val:.2f}"
         e_val = self.E[iy, ix]
         return f"X={x:.2f}, Y={y:.2f} | Z={z_val:.2f}, Err={e_val:.2f}"
 
+    def _lod(self, ax: plt.Axes, xlim: tuple = None, ylim: tuple = None) -> tuple:
+        """
+        Internal function to pick the overview pyramid level matching the axes
+        size in pixels and the visible window (level 1 is the full grid).
+
+        :param ax: plt.Axes object to plot on
+        :type ax: plt.Axes
+        :param xlim: visible X range, defaults to None (full grid)
+        :type xlim: tuple, optional
+        :param ylim: visible Y range, defaults to None (full grid)
+        :type ylim: tuple, optional
+        :return: x, y, Z and E (None for Z-only grids) arrays of the level cropped to the window
+        :rtype: tuple
+        """
+        if self._pyramid is None:
+            self._pyramid = build_pyramid(self.X[0, :], self.Y[:, 0], self.Z, self.E)
+
+        x, y = self.X[0, :], self.Y[:, 0]
+        x0, x1 = sorted(xlim) if xlim is not None else (x.min(), x.max())
+        y0, y1 = sorted(ylim) if ylim is not None else (y.min(), y.max())
+
+        # Visible nodes per axis and available pixels
+        span_x = (x.max() - x.min()) or 1.0
+        span_y = (y.max() - y.min()) or 1.0
+        cols = self.nx * min((x1 - x0) / span_x, 1.0)
+        rows = self.ny * min((y1 - y0) / span_y, 1.0)
+        width, height = ax.bbox.width, ax.bbox.height
+
+        # Coarsest level that still has at least one node per pixel
+        levels = {1: (x, y, self.Z, self.E), **self._pyramid}
+        f = max(
+            k for k in levels if k == 1 or (cols / k >= width and rows / k >= height)
+        )
+        x, y, Z, E = levels[f]
+
+        # Crop to the window with a margin of one node
+        ix = np.flatnonzero((x >= x0) & (x <= x1))
+        iy = np.flatnonzero((y >= y0) & (y <= y1))
+        if len(ix) == 0 or len(iy) == 0:
+            return x, y, Z, E
+        i0, i1 = max(ix[0] - 1, 0), min(ix[-1] + 2, len(x))
+        j0, j1 = max(iy[0] - 1, 0), min(iy[-1] + 2, len(y))
+        if E is not None:
+            E = E[j0:j1, i0:i1]
+        return x[i0:i1], y[j0:j1], Z[j0:j1, i0:i1], E
+
+    def _attach_lod(self, ax: plt.Axes, im, select):
+        """
+        Internal function to refresh an image with the right pyramid level
+        when the figure is zoomed or panned.
+
+        :param ax: plt.Axes object of the image
+        :type ax: plt.Axes
+        :param im: image returned by `imshow`
+        :type im: matplotlib.image.AxesImage
+        :param select: function (Z, E) -> array to display
+        :type select: callable
+        """
+
+        def update(_ax):
+            x, y, Z, E = self._lod(ax, ax.get_xlim(), ax.get_ylim())
+            im.set_data(select(Z, E))
+            # Do not let the new extent change the user limits
+            ax.set_autoscale_on(False)
+            im.set_extent([x.min(), x.max(), y.min(), y.max()])
+
+        ax.callbacks.connect("xlim_changed", update)
+        ax.callbacks.connect("ylim_changed", update)
+
     def contourc(
         self,
         v_min: float = None,
@@ -123,6 +216,7 @@ class Gplot:
     ):
         """
         Plot an interactive map of estimated Z and its errors with a continuous color map
+        (Z only for grids without SIGMA)
 
         :param v_min: minimum Z value to map, defaults to None
         :type v_min: float, optional
@@ -131,7 +225,6 @@ class Gplot:
         :param bad: bad pixels color, defaults to "red"
         :type bad: str, optional
         """
-        Z_plot = self.Z.copy()
         # print(f"{v_min=}, {v_max=}, {np.nanmin(self.Z)=}, {np.nanmax(self.Z)=}, ")
         if v_min is None:
             v_min = np.nanmin(self.Z)
@@ -139,9 +232,25 @@ class Gplot:
             v_max = np.nanmax(self.Z)
         # self.Z = np.clip(self.Z, v_min, v_max)
         # print(f"{v_min=}, {v_max=}, {np.nanmin(self.Z)=}, {np.nanmax(self.Z)=}, ")
-        Z_plot[Z_plot < v_min] = np.nan
 
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 7), sharex=True, sharey=True)
+        def z_plot(Z, E):
+            """Z with the values below v_min masked"""
+            Z_plot = Z.copy()
+            Z_plot[Z_plot < v_min] = np.nan
+            return Z_plot
+
+        fig, axes = plt.subplots(
+            1,
+            1 if self.E is None else 2,
+            figsize=(8 if self.E is None else 15, 7),
+            sharex=True,
+            sharey=True,
+            squeeze=False,
+        )
+        ax1 = axes[0, 0]
+
+        # Overview level matching the figure size (large grids)
+        x, y, Z, E = self._lod(ax1)
 
         # 1. Configure color map for Z (Relief)
         cmap_z = cm.terrain.copy()
@@ -154,8 +263,8 @@ class Gplot:
         # Draw Z Estimate
         # print(v_min, v_max)
         im1 = ax1.imshow(
-            Z_plot,
-            extent=[self.X.min(), self.X.max(), self.Y.min(), self.Y.max()],
+            z_plot(Z, E),
+            extent=[x.min(), x.max(), y.min(), y.max()],
             origin="lower",
             cmap=cmap_z,
             aspect="equal",
@@ -165,15 +274,21 @@ class Gplot:
         ax1.set_title("Estimated Z")
         fig.colorbar(im1, ax=ax1, label="Estimated Z")
 
+        # Zooming re-selects the pyramid level of the visible window
+        self._attach_lod(ax1, im1, z_plot)
+
         # Draw Standard Error
-        im2 = ax2.imshow(
-            self.E,
-            extent=[self.X.min(), self.X.max(), self.Y.min(), self.Y.max()],
-            origin="lower",
-            cmap=cmap_e,
-        )
-        ax2.set_title("Error")
-        fig.colorbar(im2, ax=ax2, label="Error")
+        if E is not None:
+            ax2 = axes[0, 1]
+            im2 = ax2.imshow(
+                E,
+                extent=[x.min(), x.max(), y.min(), y.max()],
+                origin="lower",
+                cmap=cmap_e,
+            )
+            self._attach_lod(ax2, im2, lambda Z, E: E)
+            ax2.set_title("Error")
+            fig.colorbar(im2, ax=ax2, label="Error")
 
         plt.tight_layout()
         plt.show()
@@ -188,6 +303,7 @@ class Gplot:
     ):
         """
         Plot an interactive map of estimated Z and its errors with a discrete color map
+        (Z only for grids without SIGMA)
 
         :param v_min: minimum Z value to map, defaults to None
         :type v_min: float, optional
@@ -196,22 +312,33 @@ class Gplot:
         :param nlevels: number of levels, defaults to 25
         :type nlevels: int, optional
         """
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 7), sharex=True, sharey=True)
+        fig, axes = plt.subplots(
+            1,
+            1 if self.E is None else 2,
+            figsize=(8 if self.E is None else 15, 7),
+            sharex=True,
+            sharey=True,
+            squeeze=False,
+        )
+        ax1 = axes[0, 0]
 
         if v_min is None:
             v_min = np.nanmin(self.Z)
         if v_max is None:
             v_max = np.nanmax(self.Z)
 
+        # Overview level matching the figure size (large grids)
+        x, y, Z, E = self._lod(ax1)
+
         # Draw Z Estimate
         # Panel 1: Z estimated
         # Generate exactly 25 slices between v_min and v_max
         levels_cuts = np.linspace(v_min, v_max, nlevels)
 
         c1 = ax1.contourf(
-            self.X,
-            self.Y,
-            self.Z,
+            x,
+            y,
+            Z,
             levels=levels_cuts,
             cmap="terrain",
             vmin=v_min,
@@ -223,14 +350,16 @@ class Gplot:
         ax1.set_aspect("equal")
 
         # Panel 2: Error (Sigma)
-        c2 = ax2.contourf(self.X, self.Y, self.E, levels=nlevels, cmap="magma")
-        fig.colorbar(c2, ax=ax2, label="Error")
-        ax2.set_title("Error")
-        ax2.set_aspect("equal")
+        if E is not None:
+            ax2 = axes[0, 1]
+            c2 = ax2.contourf(x, y, E, levels=nlevels, cmap="magma")
+            fig.colorbar(c2, ax=ax2, label="Error")
+            ax2.set_title("Error")
+            ax2.set_aspect("equal")
+            ax2.format_coord = self._format_coord
 
         # Interactivity: Display values ​​in the status bar
         ax1.format_coord = self._format_coord
-        ax2.format_coord = self._format_coord
 
         plt.tight_layout()
         plt.show()
@@ -321,20 +450,23 @@ class Gplot:
 
         fig, ax1 = plt.subplots(1, 1, figsize=(10, 10))
 
+        # Overview level matching the figure size (large grids)
+        x, y, Z, _ = self._lod(ax1)
+
         # 2. --- BACKGROUND LAYER: HILLSHADE ---
         if hillshade:
             from matplotlib.colors import LightSource
 
             # Limits
-            x0, x1 = np.nanmin(self.X), np.nanmax(self.X)
-            y0, y1 = np.nanmin(self.Y), np.nanmax(self.Y)
+            x0, x1 = np.nanmin(x), np.nanmax(x)
+            y0, y1 = np.nanmin(y), np.nanmax(y)
 
             # We define the light source
             ls = LightSource(azdeg=azimuth, altdeg=alt)
-            shaded = ls.hillshade(self.Z, vert_exag=1.0)
+            shaded = ls.hillshade(Z, vert_exag=1.0)
 
             # Orientation correction for shading
-            if self.Y[0, 0] > self.Y[-1, 0]:
+            if y[0] > y[-1]:
                 shaded = np.flipud(shaded)
 
             ax1.imshow(
@@ -348,16 +480,16 @@ class Gplot:
             # Water dough (optional)
             if modeHB:
                 ax1.contourf(
-                    self.X,
-                    self.Y,
-                    self.Z,
+                    x,
+                    y,
+                    Z,
                     levels=[-99999, sealevel],
                     colors=["#aaccff"],
                     alpha=0.3,
                 )
 
         # 3. --- Level Logic ---
-        z_rel = self.Z - sealevel
+        z_rel = Z - sealevel
         z_min, z_max = np.nanmin(z_rel), np.nanmax(z_rel)
         z_range = z_max - z_min
 
@@ -376,8 +508,8 @@ class Gplot:
         # 4. --- CONTOUR DRAWING ---
         # Ordinary
         ax1.contour(
-            self.X,
-            self.Y,
+            x,
+            y,
             z_rel,
             levels=[_ for _ in levels_thin if _ >= 0],
             colors=color_land,
@@ -385,8 +517,8 @@ class Gplot:
             alpha=0.4,
         )
         ax1.contour(
-            self.X,
-            self.Y,
+            x,
+            y,
             z_rel,
             levels=[_ for _ in levels_thin if _ < 0],
             colors=color_sea,
@@ -398,8 +530,8 @@ class Gplot:
         l_thick_land = [_ for _ in levels_thick if _ >= 0]
         if l_thick_land:
             c_land = ax1.contour(
-                self.X,
-                self.Y,
+                x,
+                y,
                 z_rel,
                 levels=l_thick_land,
                 colors=color_land,
@@ -411,8 +543,8 @@ class Gplot:
         l_thick_sea = [_ for _ in levels_thick if _ < 0]
         if l_thick_sea:
             c_sea = ax1.contour(
-                self.X,
-                self.Y,
+                x,
+                y,
                 z_rel,
                 levels=l_thick_sea,
                 colors=color_sea,
@@ -424,8 +556,8 @@ class Gplot:
         # Coastline (Z = 0) optionally more marked
         if modeHB:
             ax1.contour(
-                self.X,
-                self.Y,
+                x,
+                y,
                 z_rel,
                 levels=[0],
                 colors="k",
@@ -568,7 +700,11 @@ class Gplot:
     def esurf(self):
         """
         3D surface of the estimated Z errors
+
+        :raises ValueError: the grid has no SIGMA column
         """
+        if self.E is None:
+            raise ValueError("This grid has no SIGMA column (return_sigma=False).")
         fig = plt.figure(figsize=(10, 7))
         ax = fig.add_subplot(111, projection="3d")
         surf = ax.plot_surface(
@@ -833,19 +969,24 @@ class Gplot:
         if invertY:
             # self.Y = self.Y.max() - self.Y
             self.Z = np.flipud(self.Z)
-            self.E = np.flipud(self.E)
+            if self.E is not None:
+                self.E = np.flipud(self.E)
 
         # Z, E calibration
         z_max_val = np.nanmax(self.Z)
         depth = 2**16 if z_max_val > 255 else 255
 
         self.Z = ((hmax - hmin) / depth) * self.Z + hmin
-        self.E = ((hmax - hmin) / depth) * self.E
+        if self.E is not None:
+            self.E = ((hmax - hmin) / depth) * self.E
 
         # Coordinates of the lower-left corner of the grid
         xllcorner = center_x - (self.X.max() - self.X.min()) / 2
         yllcorner = center_y - (self.Y.max() - self.Y.min()) / 2
 
+        # The overview pyramid must be rebuilt with the calibrated values
+        self._pyramid = None
+
         # Grid calibration metadata
         self.calib_dic = {
             "CRS": "EPSG:3857",
@@ -935,7 +1076,9 @@ class Gplot:
         # Sampling Z and E (Error) from the grid
         for px, py in zip(x_pts, y_pts):
             z_values.append(self._interpolate_at(px, py, self.Z))
-            e_values.append(self._interpolate_at(px, py, self.E))
+            e_values.append(
+                np.nan if self.E is None else self._interpolate_at(px, py, self.E)
+            )
             # print(f"Sampling at X={px:.1f}, Y={py:.1f}")
 
         return {
@@ -1176,7 +1319,9 @@ class Gplot:
             _write_prj(f"{base}.asc")
 
         # Export SIGMA if requested
-        if paste_sigma:
+        if paste_sigma and self.E is None:
+            print("Warning: this grid has no SIGMA column, sigma file not exported")
+        elif paste_sigma:
             _write_file(f"{base}_sigma.asc", self.E)
             if (
                 self.calib_dic is not None
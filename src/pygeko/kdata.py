@@ -17,18 +17,22 @@ import seaborn as sns
 from scipy.spatial import KDTree
 from tqdm import tqdm
 
+from pygeko.catgck import load_gck, write_gck_header
 from pygeko.gplot import set_xy_axes_equal_3d
 from pygeko.models import models_bool
 from pygeko.utils import (
     _worker_tune,
-    cross_validation,
-    cross_validation_silent,
+    count_octants,
+    estimate_batch,
     fast_preview,
     get_octants,
     get_optimal_workers,
+    loo_cross_validation,
+    print_cv_summary,
     report_models,
     run_full_exploration,
     run_gik,
+    select_octant_balanced,
 )
 
 plt.rcParams["savefig.directory"] = os.getcwd()
@@ -50,8 +54,19 @@ class Kdata:
         must be a `.csv` filename containing the columns that we will use
         as X, Y, and Z values.
         """
-        self.dframe = pd.read_csv(*arg, **karg)
-        self.title = os.path.basename(arg[0])
+        self._setup(pd.read_csv(*arg, **karg), os.path.basename(arg[0]))
+
+    def _setup(self, dframe: pd.DataFrame, title: str):
+        """
+        Internal function to initialize the object state from a dataframe.
+
+        :param dframe: data
+        :type dframe: pd.DataFrame
+        :param title: data source name
+        :type title: str
+        """
+        self.dframe = dframe
+        self.title = title
 
         # Default column mapping
         self.x_col = "X"
@@ -60,6 +75,13 @@ class Kdata:
         self._nork = 1
         self._nvec = 12
         self.kdtree = None
+        self.fast_tree = False  # Unbalanced, non-compact KDTree: faster to build
+        self.octant_search = False  # Octant-balanced neighbor search
+        self.max_radius = None  # Maximum neighbor distance (original units)
+        self._xyz = None  # Cached (N, 3) X, Y, Z array, see self.xyz
+        self._xyz_key = None
+        self._xyz_src = None  # Arrays owning the X, Y, Z columns, see self._sync_data()
+        self._loo = None  # Cached leave-one-out neighborhoods, see self.loo_neighbors()
         self._scale = None  # To be initialized by self.init_neig()
         self.crossvaldata = None
         self._norm_params = None
@@ -69,6 +91,268 @@ class Kdata:
         self.rmse = None
         self.corr = None
 
+    @classmethod
+    def from_csv(
+        cls,
+        filename: str,
+        x_col: str = "X",
+        y_col: str = "Y",
+        z_col: str = "Z",
+        extra_cols: list = None,
+        dtype: str = "float64",
+        chunksize: int = 1_000_000,
+        engine: str = None,
+        **karg,
+    ) -> "Kdata":
+        """
+        Kdata object creation reading only the needed columns of a large CSV.
+
+        Only the X, Y, Z (plus `extra_cols`) columns are parsed, with an explicit
+        dtype, in chunks of `chunksize` rows, and they are stored as contiguous
+        NumPy arrays. With `engine="pyarrow"` the file is parsed by the
+        multithreaded pyarrow reader instead (it does not support chunks).
+
+        :param filename: `.csv` filename
+        :type filename: str
+        :param x_col: column to use as X, defaults to "X"
+        :type x_col: str, optional
+        :param y_col: column to use as Y, defaults to "Y"
+        :type y_col: str, optional
+        :param z_col: column to use as Z, defaults to "Z"
+        :type z_col: str, optional
+        :param extra_cols: other columns to keep, defaults to None
+        :type extra_cols: list, optional
+        :param dtype: dtype of the X, Y, Z columns, defaults to "float64"
+        :type dtype: str, optional
+        :param chunksize: rows per chunk, defaults to 1_000_000
+        :type chunksize: int, optional
+        :param engine: `pandas.read_csv` parser engine, defaults to None ("c")
+        :type engine: str, optional
+        :return: Kdata object
+        :rtype: Kdata
+        """
+        active = [x_col, y_col, z_col]
+        extra_cols = [c for c in (extra_cols or []) if c not in active]
+        usecols = active + extra_cols
+        dtypes = {c: dtype for c in active}
+
+        if engine == "pyarrow":
+            dframe = pd.read_csv(
+                filename, usecols=usecols, dtype=dtypes, engine="pyarrow", **karg
+            )
+            columns = {c: np.ascontiguousarray(dframe[c].values) for c in usecols}
+        else:
+            reader = pd.read_csv(
+                filename,
+                usecols=usecols,
+                dtype=dtypes,
+                chunksize=chunksize,
+                engine=engine,
+                **karg,
+            )
+            parts = {c: [] for c in usecols}
+            with reader:
+                for chunk in reader:
+                    for c in usecols:
+                        parts[c].append(chunk[c].values)
+            columns = {c: np.concatenate(parts[c]) for c in usecols}
+
+        return cls._from_dframe(
+            pd.DataFrame(columns), os.path.basename(filename), x_col, y_col, z_col
+        )
+
+    @classmethod
+    def _from_dframe(
+        cls, dframe: pd.DataFrame, title: str, x_col: str, y_col: str, z_col: str
+    ) -> "Kdata":
+        """
+        Internal function to build a Kdata object from a dataframe.
+
+        :param dframe: data
+        :type dframe: pd.DataFrame
+        :param title: data source name
+        :type title: str
+        :param x_col: column to use as X
+        :type x_col: str
+        :param y_col: column to use as Y
+        :type y_col: str
+        :param z_col: column to use as Z
+        :type z_col: str
+        :return: Kdata object
+        :rtype: Kdata
+        """
+        kd = cls.__new__(cls)
+        kd._setup(dframe, title)
+        kd.x_col = x_col
+        kd.y_col = y_col
+        kd.z_col = z_col
+        return kd
+
+    @classmethod
+    def from_parquet(
+        cls,
+        filename: str,
+        x_col: str = "X",
+        y_col: str = "Y",
+        z_col: str = "Z",
+        extra_cols: list = None,
+    ) -> "Kdata":
+        """
+        Kdata object creation from a Parquet file (requires pyarrow).
+
+        Only the X, Y, Z (plus `extra_cols`) columns are read, keeping their types.
+
+        :param filename: `.parquet` filename
+        :type filename: str
+        :param x_col: column to use as X, defaults to "X"
+        :type x_col: str, optional
+        :param y_col: column to use as Y, defaults to "Y"
+        :type y_col: str, optional
+        :param z_col: column to use as Z, defaults to "Z"
+        :type z_col: str, optional
+        :param extra_cols: other columns to keep, defaults to None
+        :type extra_cols: list, optional
+        :return: Kdata object
+        :rtype: Kdata
+        """
+        usecols = [x_col, y_col, z_col] + [
+            c for c in (extra_cols or []) if c not in (x_col, y_col, z_col)
+        ]
+        dframe = pd.read_parquet(filename, columns=usecols)
+        return cls._from_dframe(
+            dframe, os.path.basename(filename), x_col, y_col, z_col
+        )
+
+    @classmethod
+    def from_feather(
+        cls,
+        filename: str,
+        x_col: str = "X",
+        y_col: str = "Y",
+        z_col: str = "Z",
+        extra_cols: list = None,
+    ) -> "Kdata":
+        """
+        Kdata object creation from a Feather file (requires pyarrow).
+
+        Only the X, Y, Z (plus `extra_cols`) columns are read, keeping their types.
+
+        :param filename: `.feather` filename
+        :type filename: str
+        :param x_col: column to use as X, defaults to "X"
+        :type x_col: str, optional
+        :param y_col: column to use as Y, defaults to "Y"
+        :type y_col: str, optional
+        :param z_col: column to use as Z, defaults to "Z"
+        :type z_col: str, optional
+        :param extra_cols: other columns to keep, defaults to None
+        :type extra_cols: list, optional
+        :return: Kdata object
+        :rtype: Kdata
+        """
+        usecols = [x_col, y_col, z_col] + [
+            c for c in (extra_cols or []) if c not in (x_col, y_col, z_col)
+        ]
+        dframe = pd.read_feather(filename, columns=usecols)
+        return cls._from_dframe(
+            dframe, os.path.basename(filename), x_col, y_col, z_col
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        x,
+        y,
+        z,
+        title: str = "arrays",
+        x_col: str = "X",
+        y_col: str = "Y",
+        z_col: str = "Z",
+        **extra,
+    ) -> "Kdata":
+        """
+        Kdata object creation from in-memory arrays.
+
+        :param x: X values
+        :type x: array_like
+        :param y: Y values
+        :type y: array_like
+        :param z: Z values
+        :type z: array_like
+        :param title: data source name (used to name `.gck` files), defaults to "arrays"
+        :type title: str, optional
+        :param x_col: name of the X column, defaults to "X"
+        :type x_col: str, optional
+        :param y_col: name of the Y column, defaults to "Y"
+        :type y_col: str, optional
+        :param z_col: name of the Z column, defaults to "Z"
+        :type z_col: str, optional
+        :param extra: other columns as `name=array`
+        :return: Kdata object
+        :rtype: Kdata
+        """
+        columns = {x_col: np.asarray(x), y_col: np.asarray(y), z_col: np.asarray(z)}
+        columns.update({k: np.asarray(v) for k, v in extra.items()})
+        return cls._from_dframe(pd.DataFrame(columns), title, x_col, y_col, z_col)
+
+    @classmethod
+    def from_npz(
+        cls,
+        filename: str,
+        x_col: str = "X",
+        y_col: str = "Y",
+        z_col: str = "Z",
+        extra_cols: list = None,
+    ) -> "Kdata":
+        """
+        Kdata object creation from a NumPy `.npz` file with one array per column.
+
+        :param filename: `.npz` filename
+        :type filename: str
+        :param x_col: array to use as X, defaults to "X"
+        :type x_col: str, optional
+        :param y_col: array to use as Y, defaults to "Y"
+        :type y_col: str, optional
+        :param z_col: array to use as Z, defaults to "Z"
+        :type z_col: str, optional
+        :param extra_cols: other arrays to keep, defaults to None
+        :type extra_cols: list, optional
+        :return: Kdata object
+        :rtype: Kdata
+        """
+        with np.load(filename) as data:
+            extra = {c: data[c] for c in (extra_cols or [])}
+            return cls.from_arrays(
+                data[x_col],
+                data[y_col],
+                data[z_col],
+                title=os.path.basename(filename),
+                x_col=x_col,
+                y_col=y_col,
+                z_col=z_col,
+                **extra,
+            )
+
+    def to_parquet(self, filename: str):
+        """
+        Save the data to a Parquet file (requires pyarrow).
+
+        X, Y and Z are always written in original units, so the file can be used
+        to build a new Kdata and `restore()` a normalized analysis.
+
+        :param filename: Parquet filename base (without the .parquet extension)
+        :type filename: str
+        """
+        dframe = self.dframe
+        if self.normalized:
+            dframe = dframe.copy()
+            x, y, z, _ = self.denorm_coord(self.x, self.y, self.z)
+            dframe[self.x_col] = x
+            dframe[self.y_col] = y
+            dframe[self.z_col] = z
+        dframe.to_parquet(filename + ".parquet", index=False)
+        print(f"[OK] Saved: {filename + '.parquet'}")
+
     def clean_data(self, verbose: bool = True) -> int:
         """
         Removes rows containing NaN values in the active X, Y, and Z columns.
@@ -87,6 +371,8 @@ class Kdata:
         self.dframe.dropna(subset=cols_to_check, inplace=True)
 
         dropped_count = initial_count - len(self.dframe)
+        if dropped_count:
+            self.refresh()
 
         if verbose and dropped_count > 0:
             print(f"🧹 Clean-up: {dropped_count} rows containing NaNs were removed.")
@@ -172,35 +458,130 @@ class Kdata:
                 f"'{type(self).__name__}' has no '{nombre} attribute yet.'"
             )
 
+    @property
+    def xyz(self):
+        """
+        Cached C-contiguous (N, 3) float64 array with the X, Y, Z values.
+
+        The array is rebuilt when the column mapping or the number of rows
+        change, after `normalize()`, `clean_data()` and `restore()`, and when any
+        of the X, Y, Z columns of `dframe` is replaced (e.g.
+        `kd.dframe[kd.z_col] = new_z`), which is checked at the start of every
+        neighbor search and estimation. In-place edits of the values
+        (`kd.dframe.loc[...] = ...`) cannot be detected: call `refresh()` afterwards.
+
+        :return: X, Y, Z values
+        :rtype: numpy array
+        """
+        key = (self.x_col, self.y_col, self.z_col, len(self.dframe))
+        if self._xyz is None or self._xyz_key != key:
+            self._xyz = np.ascontiguousarray(
+                self.dframe[[self.x_col, self.y_col, self.z_col]].to_numpy(
+                    dtype=np.float64
+                )
+            )
+            self._xyz_key = key
+            self._xyz_src = self._xyz_source()
+        return self._xyz
+
+    def _xyz_source(self) -> tuple:
+        """
+        Internal function returning the arrays that own the memory of the X, Y
+        and Z columns of `dframe`.
+
+        :return: X, Y, Z owner arrays
+        :rtype: tuple
+        """
+        source = []
+        for col in (self.x_col, self.y_col, self.z_col):
+            a = self.dframe[col].to_numpy()
+            while isinstance(a.base, np.ndarray):
+                a = a.base
+            source.append(a)
+        return tuple(source)
+
+    def _sync_data(self):
+        """
+        Internal function to detect replaced X, Y, Z columns of `dframe` and drop
+        the stale caches: a new Z column only rebuilds `xyz`, new X or Y columns
+        also rebuild the neighborhoods and the KDTree (see `refresh()`).
+
+        The owner arrays are held in `_xyz_src`, so a replaced column cannot
+        reuse their memory and is always detected by identity. The check costs
+        a few dataframe lookups, so it is done at the start of the neighbor
+        searches and estimations and not on every `xyz` access.
+        """
+        if self._xyz is None:
+            return
+        source = self._xyz_source()
+        if self._xyz_src is None:  # Unpickled copy (pool worker)
+            self._xyz_src = source
+            return
+        changed = [a is not b for a, b in zip(self._xyz_src, source)]
+        if changed[0] or changed[1]:
+            self.refresh()
+        elif changed[2]:
+            self._xyz = None
+            self._xyz_key = None
+            self._xyz_src = None
+
+    def refresh(self):
+        """
+        Rebuild the cached X, Y, Z array, the leave-one-out neighborhoods and,
+        if it was already built, the KDTree. Call it after modifying the values
+        of `dframe` in place (replaced columns are detected automatically).
+        """
+        self._invalidate_xyz()
+        if self.kdtree is not None:
+            self.init_neig()
+
+    def _invalidate_xyz(self):
+        """
+        Internal function to drop the cached `xyz` array and neighborhoods.
+        """
+        self._xyz = None
+        self._xyz_key = None
+        self._xyz_src = None
+        self._loo = None
+
+    def __getstate__(self):
+        """
+        Pickled state (pool workers): the `_xyz_src` references are dropped,
+        they would duplicate the column data.
+        """
+        state = self.__dict__.copy()
+        state["_xyz_src"] = None
+        return state
+
     @property
     def x(self):
         """
         X values getter
 
-        :return: X values
+        :return: X values (view of `xyz`)
         :rtype: numpy array
         """
-        return self.dframe[self.x_col].values
+        return self.xyz[:, 0]
 
     @property
     def y(self):
         """
         Y values getter
 
-        :return: Y values
+        :return: Y values (view of `xyz`)
         :rtype: numpy array
         """
-        return self.dframe[self.y_col].values
+        return self.xyz[:, 1]
 
     @property
     def z(self):
         """
         Z values getter
 
-        :return: Z values
+        :return: Z values (view of `xyz`)
         :rtype: numpy array
         """
-        return self.dframe[self.z_col].values
+        return self.xyz[:, 2]
 
     @property
     def status(self):
@@ -271,6 +652,7 @@ class Kdata:
                 "xy_scale": xy_scale,
                 "z_scale": z_scale,
             }
+            self.refresh()
         else:
             print("Datasets already normalized. Nothing to do.")
 
@@ -340,19 +722,40 @@ class Kdata:
             )
         return x, y, z, e
 
-    def init_neig(self):
+    def init_neig(self, tree: KDTree = None):
         """
         Initialize the KDTree for efficient spatial searching and calculate scaling factors.
+
+        With `fast_tree=True` the tree is built unbalanced and without compacting
+        the nodes, which is much faster to build for large datasets at a small
+        cost in query time.
+
+        :param tree: previously built tree to reuse if it was built on the current X, Y values, defaults to None
+        :type tree: KDTree, optional
         """
         # Let's make sure there are no NaNs
+        self._sync_data()
         self.clean_data(verbose=False)
 
-        self.coordinates = np.array([self.x, self.y]).T
-        self.kdtree = KDTree(self.coordinates)
+        xyz = self.xyz
+        self.coordinates = xyz[:, :2]
+        if (
+            tree is not None
+            and tree.n == len(xyz)
+            and np.array_equal(tree.data, self.coordinates)
+        ):
+            self.kdtree = tree
+        else:
+            self.kdtree = KDTree(
+                self.coordinates,
+                balanced_tree=not self.fast_tree,
+                compact_nodes=not self.fast_tree,
+            )
+        self._loo = None
 
         # Automatic scale calculation to stabilize matrix inversion
-        self.x_range = self.x.max() - self.x.min()
-        self.y_range = self.y.max() - self.y.min()
+        self.x_range = xyz[:, 0].max() - xyz[:, 0].min()
+        self.y_range = xyz[:, 1].max() - xyz[:, 1].min()
         self._scale = max(self.x_range, self.y_range) / 10.0
 
     def findneig(self, ax, ay, n, trim=False):
@@ -362,6 +765,13 @@ class Kdata:
         :param trim: If True, excludes the first match (useful for cross-validation).
         :return: Tuple (indices, distances, octants, octant_count).
         """
+        if self.kdtree and (self.octant_search or self.max_radius):
+            neig, dis, octr, noct = self.query_neighbors(
+                [ax], [ay], n, trim=trim, workers=1
+            )
+            # Neighbors beyond max_radius are not returned
+            keep = neig[0] >= 0
+            return neig[0][keep], dis[0][keep], octr[0][keep], int(noct[0])
         if self.kdtree:
             dis, neig = self.kdtree.query([ax, ay], n + 1)
 
@@ -369,9 +779,8 @@ class Kdata:
             neig = neig.flatten()
 
             # We calculate octants ONLY of those neighbors
-            neighbor_x = self.x[neig]
-            neighbor_y = self.y[neig]
-            octr = get_octants(neighbor_x - ax, neighbor_y - ay)
+            neighbor_xy = self.xyz[neig]
+            octr = get_octants(neighbor_xy[:, 0] - ax, neighbor_xy[:, 1] - ay)
 
             if trim:
                 dis = dis[1:]
@@ -387,6 +796,100 @@ class Kdata:
         else:
             raise RuntimeError("KDTree not initialized!")
 
+    def search_radius(self) -> float:
+        """
+        `max_radius` in working units (np.inf if not set).
+
+        :return: maximum neighbor distance
+        :rtype: float
+        """
+        if not self.max_radius:
+            return np.inf
+        if self.normalized:
+            return self.max_radius * self._norm_params["xy_scale"]
+        return self.max_radius
+
+    def query_neighbors(self, xs, ys, n, trim=False, workers=-1):
+        """
+        Batched version of `findneig`: find the 'n' nearest neighbors of all the
+        points (xs, ys) with a single, multithreaded KDTree query.
+
+        With `octant_search=True` the 4*n nearest points are taken as candidates
+        and the neighbors are chosen octant by octant (see
+        `utils.select_octant_balanced`), which gives better-conditioned systems
+        and far fewer nodes rejected for lack of octant coverage.
+
+        With `max_radius` set, the points farther than that distance are not
+        used: their slots have index -1, distance inf and octant -1, and they
+        do not count as populated octants.
+
+        :param xs: X coordinates
+        :type xs: array_like
+        :param ys: Y coordinates
+        :type ys: array_like
+        :param n: number of neighbors
+        :type n: int
+        :param trim: If True, excludes the first match of each point (useful for cross-validation), defaults to False
+        :type trim: bool, optional
+        :param workers: query threads, -1 for all the cores. Use 1 inside process pools, defaults to -1
+        :type workers: int, optional
+        :return: Tuple (indices, distances, octants, octant_count), arrays of shape (M, n) and (M,)
+        :rtype: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        """
+        if not self.kdtree:
+            raise RuntimeError("KDTree not initialized!")
+        self._sync_data()
+
+        pts = np.column_stack((np.ravel(xs), np.ravel(ys))).astype(np.float64)
+        n_cand = min(4 * n, self.kdtree.n - trim) if self.octant_search else n
+        k = n_cand + 1 if trim else n_cand
+        dis, neig = self.kdtree.query(
+            pts, k, distance_upper_bound=self.search_radius(), workers=workers
+        )
+        dis = dis.reshape(len(pts), k)
+        neig = neig.reshape(len(pts), k)
+        if trim:
+            dis = dis[:, 1:]
+            neig = neig[:, 1:]
+
+        xyz = self.xyz
+        # Missing neighbors (beyond max_radius) come with index kdtree.n
+        missing = neig >= self.kdtree.n
+        if missing.any():
+            neig[missing] = -1
+        octr = get_octants(
+            xyz[neig, 0] - pts[:, 0, None], xyz[neig, 1] - pts[:, 1, None]
+        )
+        if missing.any():
+            octr[missing] = -1
+        if n_cand > n:
+            neig, dis, octr = select_octant_balanced(neig, dis, octr, n)
+        return neig, dis, octr, count_octants(octr)
+
+    def loo_neighbors(self):
+        """
+        Leave-one-out neighborhoods of all the data points, as used by the
+        cross-validation and GIK phases (same result as
+        `findneig(x[i], y[i], nvec, trim=True)` for every `i`).
+
+        The result is cached until `nvec`, `octant_search`, `max_radius`, the data
+        or the KDTree change, and can be embedded in `.gck` files with `save(embed_neig=True)`.
+
+        :return: Tuple (indices, octant_count), arrays of shape (N, nvec) and (N,)
+        :rtype: tuple[np.ndarray, np.ndarray]
+        """
+        self._sync_data()
+        key = (self._nvec, self.octant_search, self.search_radius())
+        if self._loo is not None and self._loo[0] == key:
+            return self._loo[1], self._loo[2]
+        xyz = self.xyz
+        neig, _, _, noct = self.query_neighbors(
+            xyz[:, 0], xyz[:, 1], self._nvec, trim=True
+        )
+
+        self._loo = (key, neig, noct)
+        return neig, noct
+
     def plot(self, cmap: str = "viridis"):
         """
         2D plot of objet data (tripcolor)
@@ -494,11 +997,11 @@ class Kdata:
         """
         Calculate the distance to the nearest neighbor for each point.
         """
-        coords = self.dframe[[self.x_col, self.y_col]].values
-        tree = KDTree(coords)
-        # We are looking for the 2 closest ones (the first is the point itself, d=0)
-        dist, _ = tree.query(coords, k=2)
-        nn_dist = dist[:, 1]
+        if self.kdtree is None:
+            self.init_neig()
+        # The closest one is the point itself (d=0), so we trim it
+        _, dist, _, _ = self.query_neighbors(self.x, self.y, 1, trim=True)
+        nn_dist = dist[:, 0]
 
         fig, ax = plt.subplots()
         ax.boxplot(nn_dist, vert=False)
@@ -607,6 +1110,7 @@ class Kdata:
         """
         # process = psutil.Process(os.getpid())
 
+        self._sync_data()
         if self.kdtree is None:
             self.init_neig()
 
@@ -631,12 +1135,11 @@ class Kdata:
 
         # tqdm.write(f"RAM after EXPLORATION: {process.memory_info().rss / 1024 / 1024:.2f} MB")
 
-        # 4. CROSSVAL Phase: Validate the winning model
+        # 4. CROSSVAL Phase: Summary of the winning model (already validated
+        # by run_full_exploration)
         if verbose:
             tqdm.write("\nValidating best model...")
-            actual, pred, err = cross_validation(self, self.zk_optimum)
-        else:
-            actual, pred, err = cross_validation_silent(self, self.zk_optimum)
+            print_cv_summary(self.crossvaldata[0]["cv"], len(self.xyz))
 
         # tqdm.write(f"RAM after CROSSVAL: {process.memory_info().rss / 1024 / 1024:.2f} MB")
 
@@ -669,12 +1172,7 @@ class Kdata:
             res = pool.apply(_worker_tune, (self._nork, self._nvec, self, True))
 
         # SYNCHRONIZATION: We bring the results from the child object to the current object
-        self.mae = res["mae"]
-        self.rmse = res["rmse"]
-        self.corr = res["corr"]
-        self.model_id = res["model_id"]
-        self.zk_optimum = (res["zk_optimum"],)
-        self.crossvaldata = res["crossvaldata"]
+        self._adopt_result(res)
 
         # Garbage collection
         gc.collect()
@@ -683,14 +1181,216 @@ class Kdata:
             plt.close("all")
             gc.collect()
 
-    def save(self, verbose=True):
+    def _adopt_result(self, res: dict):
+        """
+        Internal function to set the analysis results returned by `_worker_tune`
+        in the current object, without reading the `.gck` file.
+
+        :param res: worker result
+        :type res: dict
+        """
+        self._nork = res["nork"]
+        self._nvec = res["nvec"]
+        self.mae = res["mae"]
+        self.rmse = res["rmse"]
+        self.corr = res["corr"]
+        self.model_id = res["model_id"]
+        self.zk_optimum = res["zk_optimum"]
+        self.crossvaldata = res["crossvaldata"]
+
+    def _cv_entry(self, model: int = None) -> dict:
+        """
+        Internal function to get the cross-validation entry of a model.
+
+        :param model: model index, defaults to None (best model, `model_id`)
+        :type model: int, optional
+        :raises RuntimeError: no models available yet
+        :raises ValueError: model not found
+        :return: `crossvaldata` entry
+        :rtype: dict
+        """
+        if not self.crossvaldata:
+            raise RuntimeError("No models available: run analyze() or restore() first.")
+        if model is None:
+            model = self.model_id
+        try:
+            return next(m for m in self.crossvaldata if m["model_idx"] == model)
+        except StopIteration:
+            raise ValueError(f"Model index {model} not found in cross-validation data.")
+
+    def _model_zk(self, model: int = None):
+        """
+        Internal function to get the parameters of a model from the
+        cross-validation results.
+
+        :param model: model index, defaults to None (best model, `model_id`)
+        :type model: int, optional
+        :raises RuntimeError: no models available yet
+        :raises ValueError: model not found
+        :return: model parameters
+        :rtype: np.ndarray
+        """
+        return self._cv_entry(model)["zk"]
+
+    def cv_results(self, model: int = None) -> pd.DataFrame:
+        """
+        Per-point leave-one-out cross-validation results of a model, in
+        original units.
+
+        `analyze()` stores the per-point results of the best model only, those
+        of the other models (and of files saved by older versions) are
+        computed on demand. Only the best model ones are then kept in
+        `crossvaldata`, so its size does not grow with the number of models.
+
+        :param model: model index, defaults to None (best model, `model_id`)
+        :type model: int, optional
+        :return: X, Y, ACTUAL, PREDICTED, RESIDUAL, SIGMA, ZSCORE, NNEIG and NOCT of the validated points
+        :rtype: pd.DataFrame
+        """
+        entry = self._cv_entry(model)
+        zk = entry["zk"]
+        model = entry["model_idx"]
+        cv = entry.get("cv")
+        if cv is None:
+            if self.kdtree is None:
+                self.init_neig()
+            cv = loo_cross_validation(self, [zk])[0]
+            if model == self.model_id:
+                entry["cv"] = cv
+
+        xyz = self.xyz[cv["index"]]
+        x, y, actual, residual = self.denorm_coord(
+            xyz[:, 0], xyz[:, 1], cv["actual"], cv["residual"]
+        )
+        _, _, predicted, sigma = self.denorm_coord(0, 0, cv["predicted"], cv["sigma"])
+        return pd.DataFrame(
+            {
+                "X": x,
+                "Y": y,
+                "ACTUAL": actual,
+                "PREDICTED": predicted,
+                "RESIDUAL": residual,
+                "SIGMA": sigma,
+                "ZSCORE": cv["zscore"],
+                "NNEIG": cv["nneig"],
+                "NOCT": cv["noct"],
+            }
+        )
+
+    def plot_cv(self, model: int = None):
+        """
+        Cross-validation plots of a model: predicted vs actual values and
+        histogram of the standardized errors (residual / sigma).
+
+        :param model: model index, defaults to None (best model, `model_id`)
+        :type model: int, optional
+        """
+        df = self.cv_results(model)
+        if model is None:
+            model = self.model_id
+
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+        ax1.scatter(df["ACTUAL"], df["PREDICTED"], s=8, alpha=0.6)
+        lims = [df["ACTUAL"].min(), df["ACTUAL"].max()]
+        ax1.plot(lims, lims, "r--", lw=1)
+        ax1.set_xlabel(f"Actual {self.z_col}")
+        ax1.set_ylabel(f"Predicted {self.z_col}")
+        ax1.set_title(f"Cross-validation: model #{model}")
+
+        zscore = df["ZSCORE"].dropna()
+        ax2.hist(zscore, bins=30, color="skyblue", edgecolor="black")
+        ax2.set_xlabel("Standardized error")
+        ax2.set_title(f"Mean: {zscore.mean():.3f} | Std: {zscore.std():.3f}")
+
+        plt.tight_layout()
+        plt.show()
+        plt.close("all")
+        gc.collect()
+
+    def predict(
+        self,
+        xs,
+        ys,
+        model: int = None,
+        return_sigma: bool = True,
+        chunk_size: int = 4096,
+    ):
+        """
+        In-memory Kriging estimation at arbitrary target coordinates.
+
+        Coordinates are given and results returned in original units (the
+        normalization, if any, is handled internally). Uses the vectorized
+        engine `utils.estimate_batch()` and does not write any file.
+
+        :param xs: targets X coordinates
+        :type xs: array_like
+        :param ys: targets Y coordinates
+        :type ys: array_like
+        :param model: model index, defaults to None (best model)
+        :type model: int, optional
+        :param return_sigma: also return the Kriging errors, defaults to True
+        :type return_sigma: bool, optional
+        :param chunk_size: points per stacked solve, defaults to 4096
+        :type chunk_size: int, optional
+        :return: estimated Z (and errors if `return_sigma`), with the shape of xs, NaN where the estimation failed
+        :rtype: np.ndarray or tuple[np.ndarray, np.ndarray]
+        """
+        zk = self._model_zk(model)
+        if self.kdtree is None:
+            self.init_neig()
+
+        xs, ys = np.broadcast_arrays(
+            np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)
+        )
+        xn, yn, _, _ = self.norm_coord(xs, ys)
+        z, sigma = estimate_batch(
+            self, xn, yn, zk, return_sigma=return_sigma, chunk_size=chunk_size
+        )
+        _, _, z, sigma = self.denorm_coord(
+            0, 0, z, sigma if return_sigma else 0
+        )
+        z = z.reshape(xs.shape)
+        if return_sigma:
+            return z, sigma.reshape(xs.shape)
+        return z
+
+    def save(
+        self,
+        verbose=True,
+        embed=False,
+        embed_tree=False,
+        embed_neig=False,
+        compress=3,
+        tree_sidecar=False,
+    ):
         """
         Save the object as a `.gck` file with metadata and a summary of the configuration for quick identification.
+
+        By default the data is not stored, and `restore()` needs the original
+        `.csv`. With `embed=True` a self-contained (format 2) file is written
+        that also holds the X, Y, Z arrays in working units, so that it can
+        be loaded with `Kdata.from_gck()` without the `.csv`.
+
+        :param verbose: print status messages, defaults to True
+        :type verbose: bool, optional
+        :param embed: embed the X, Y, Z data, defaults to False
+        :type embed: bool, optional
+        :param embed_tree: also embed the KDTree (implies `embed`), defaults to False
+        :type embed_tree: bool, optional
+        :param embed_neig: also embed the leave-one-out neighborhoods (implies `embed`), defaults to False
+        :type embed_neig: bool, optional
+        :param compress: joblib compression level (0-9), with 0 the arrays are memory-mapped on restore, defaults to 3
+        :type compress: int, optional
+        :param tree_sidecar: also save the KDTree as an uncompressed `.kdt` file next to the `.gck`, defaults to False
+        :type tree_sidecar: bool, optional
         """
+        embed = embed or embed_tree or embed_neig
         filename = f"{(self.title).split('.')[0]}_{self._nork}_{self._nvec}.gck"
 
         # 1. Extract metadata (experiment ID, including normalization state)
         metadata = {
+            "format": 2 if embed else 1,
+            "compress": compress,
             "fecha_creacion": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "n_puntos": len(self.dframe) if hasattr(self, "dframe") else 0,
             "isnorm": getattr(self, "normalized", None),
@@ -711,11 +1411,34 @@ class Kdata:
         payload = {
             k: v
             for k, v in self.__dict__.items()
-            if k not in ["dframe", "kdtree", "coordinates", "Z"]
+            if k
+            not in ["dframe", "kdtree", "coordinates", "Z", "_xyz", "_xyz_key", "_xyz_src", "_loo"]
         }
+        checkpoint = {"metadata": metadata, "payload": payload}
 
-        # 3. Save the compressed package
-        joblib.dump({"metadata": metadata, "payload": payload}, filename, compress=3)
+        # 3. Optional embedded data (format 2)
+        if embed:
+            checkpoint["data"] = {
+                "columns": [self.x_col, self.y_col, self.z_col],
+                "xyz": self.xyz,
+            }
+            if embed_tree:
+                if self.kdtree is None:
+                    self.init_neig()
+                checkpoint["data"]["kdtree"] = self.kdtree
+            if embed_neig:
+                if self.kdtree is None:
+                    self.init_neig()
+                self.loo_neighbors()  # Fills the self._loo cache
+                checkpoint["data"]["loo"] = self._loo
+
+        # 4. Save the compressed package and its metadata header
+        joblib.dump(checkpoint, filename, compress=compress)
+        write_gck_header(filename, metadata, payload)
+        if tree_sidecar:
+            if self.kdtree is None:
+                self.init_neig()
+            joblib.dump(self.kdtree, filename[:-4] + ".kdt", compress=0)
         if verbose:
             tqdm.write(f"\n[OK] Saved: {filename}")
             tqdm.write(
@@ -726,6 +1449,10 @@ class Kdata:
         """
         Load the state stored in a `.gck` fileand rebuild the spatial search engine.
 
+        If the file embeds the data (see `save(embed=True)`), it replaces the
+        current dataframe and the KDTree and neighborhoods are taken from the
+        file when available instead of being recomputed.
+
         :param filename: gck filename to load
         :type filename: string
         """
@@ -736,8 +1463,12 @@ class Kdata:
             print(f"[Error] File not found: {filename}")
             return
 
-        # Load package
-        checkpoint = joblib.load(filename)
+        # Load package (memory-mapped if it was saved uncompressed)
+        checkpoint = load_gck(filename)
+
+        # KDTree sidecar (see save(tree_sidecar=True))
+        kdt_file = filename[:-4] + ".kdt"
+        tree = joblib.load(kdt_file) if os.path.exists(kdt_file) else None
         payload = checkpoint["payload"]
 
         # for k, v in payload.items():
@@ -755,6 +1486,21 @@ class Kdata:
 
         # Restore variables to the current object
         self.__dict__.update(payload)
+        self._invalidate_xyz()
+
+        data = checkpoint.get("data")
+        if data is not None:
+            # Self-contained file: data already in working units
+            self._load_embedded(data, tree)
+            print("\n[RESTORE] Configuration recovered:")
+            print(
+                f"          Model: {meta['params']['model_id']} | nork: {meta['params']['nork']} | nvec: {meta['params']['nvec']}"
+            )
+            print(f"          Original validation: MAE={meta['metricas']['MAE']}")
+            print(
+                f"          Data embedded: {meta['n_puntos']} points | KDTree {'loaded' if self.kdtree is data.get('kdtree', tree) else 'regenerated'}."
+            )
+            return
 
         # Data normalization
         if saved_norm_params is not None:
@@ -780,27 +1526,86 @@ class Kdata:
             self._norm_params = None
 
         # CRITICAL RECONSTRUCTION
-        # Since we didn't save the tree, we're rebuilding it on the fly
-        self.init_neig()
+        # If we didn't save the tree, we're rebuilding it on the fly
+        self.init_neig(tree)
 
         print("\n[RESTORE] Configuration recovered:")
         print(
             f"          Model: {meta['params']['model_id']} | nork: {meta['params']['nork']} | nvec: {meta['params']['nvec']}"
         )
         print(f"          Original validation: MAE={meta['metricas']['MAE']}")
-        print(f"          KDTree regenerated for {meta['n_puntos']} points.")
+        print(
+            f"          KDTree {'loaded' if self.kdtree is tree else 'regenerated'} for {meta['n_puntos']} points."
+        )
+
+    def _load_embedded(self, data: dict, tree: KDTree = None):
+        """
+        Internal function to set the data, KDTree and neighborhoods embedded in a
+        format 2 `.gck` file.
+
+        :param data: `data` section of the checkpoint
+        :type data: dict
+        :param tree: KDTree from a `.kdt` sidecar, used if none is embedded, defaults to None
+        :type tree: KDTree, optional
+        """
+        self.x_col, self.y_col, self.z_col = data["columns"]
+        xyz = np.ascontiguousarray(data["xyz"], dtype=np.float64)
+        self.dframe = pd.DataFrame(xyz, columns=data["columns"], copy=False)
+        self._xyz = xyz
+        self._xyz_key = (self.x_col, self.y_col, self.z_col, len(xyz))
+        self._xyz_src = self._xyz_source()
+
+        self.init_neig(data.get("kdtree", tree))
+
+        if "loo" in data:
+            self._loo = data["loo"]
+
+    @classmethod
+    def from_gck(cls, filename: str) -> "Kdata":
+        """
+        Kdata object creation from a self-contained `.gck` file
+        (see `save(embed=True)`), without the original `.csv`.
 
-    def tune(self, nvec_list, nork_list):
+        :param filename: gck filename to load
+        :type filename: str
+        :raises ValueError: if the file does not embed the data
+        :return: Kdata object
+        :rtype: Kdata
+        """
+        if not filename.endswith(".gck"):
+            filename += ".gck"
+        checkpoint = load_gck(filename)
+        if "data" not in checkpoint:
+            raise ValueError(
+                f"{filename} does not embed the data, use Kdata(csv).restore() instead."
+            )
+        kd = cls.__new__(cls)
+        kd._setup(pd.DataFrame(), os.path.basename(filename))
+        kd.__dict__.update(checkpoint["payload"])
+        kd._invalidate_xyz()
+        kdt_file = filename[:-4] + ".kdt"
+        tree = joblib.load(kdt_file) if os.path.exists(kdt_file) else None
+        kd._load_embedded(checkpoint["data"], tree)
+        return kd
+
+    def tune(self, nvec_list, nork_list, save=True):
         """
         Performs an automatic parameter scan and returns the best model.
 
+        The object is left configured with the best setting, taken directly
+        from the worker results.
+
         :param nvec_list: list of integers, e.g., [8, 12, 16, 20]
         :type nvec_list: list
         :param nork_list: list of integers, defaults to [1, 2]
         :type nork_list: list, optional
+        :param save: write a `.gck` file for every setting, defaults to True
+        :type save: bool, optional
         :return: list of dictionaries with tuning results
         :rtype: list
         """
+        if self.kdtree is None:
+            self.init_neig()
         results = []
         configs = [(nork, nvec) for nork in nork_list for nvec in nvec_list]
         print(f"Starting isolated scan of {len(configs)} combinations...")
@@ -811,7 +1616,7 @@ class Kdata:
         with mp.Pool(processes=get_optimal_workers(), maxtasksperchild=1) as pool:
             # Prepare the calls
             multiple_results = [
-                pool.apply_async(_worker_tune, (nk, nv, self, False))
+                pool.apply_async(_worker_tune, (nk, nv, self, False, save))
                 for nk, nv in configs
             ]
 
@@ -826,7 +1631,8 @@ class Kdata:
         df_tuning = pd.DataFrame(results)
 
         # Find the best (lowest MAE)
-        best = df_tuning.loc[df_tuning["mae"].idxmin()]
+        best_idx = df_tuning["mae"].idxmin()
+        best = df_tuning.loc[best_idx]
 
         print(f"\n\n{'=' * 40}")
         print(" TUNING RESULT")
@@ -837,12 +1643,7 @@ class Kdata:
         print(f"{'=' * 40}")
 
         # We leave the object configured with the best parameters
-        # self._execute_analysis(nork=int(best.nork), nvec=int(best.nvec))
-
-        self._nork = int(best.nork)
-        self._nvec = int(best.nvec)
-        filename = f"{(self.title).split('.')[0]}_{self._nork}_{self._nvec}.gck"
-        self.restore(filename)
+        self._adopt_result(results[best_idx])
         return df_tuning
 
     def plot_tuning_results(self, df_tuning):
@@ -4,11 +4,23 @@ pyGEKO Kgrid Module
 Handles grid definition and Kriging estimation.
 """
 
+from datetime import datetime
+
+import joblib
+import numpy as np
+
 from pygeko.kdata import Kdata
 from pygeko.utils import (
+    _write_grid,
+    build_grid_mask,
+    compute_grid_weights,
     export_grid,
+    export_grid_adaptive,
+    export_grid_ensemble,
+    export_grid_models,
     fast_preview,
     report_models,
+    save_operator,
 )
 
 
@@ -60,6 +72,14 @@ class Kgrid:
         # Model
         self._model = None
         self.zk_final = None
+        # Precomputed kriging weights (see compute_weights())
+        self.weights = None
+        self.sigma_map = None
+        # Storage dtype of the estimated Z and SIGMA ("float64" or "float32"),
+        # the Kriging systems are always solved in float64
+        self.dtype = "float64"
+        # Nodes to estimate (see set_mask()), None for the full window
+        self.mask = None
 
     @property
     def xmin(self):
@@ -112,6 +132,9 @@ class Kgrid:
         print("Grid:")
         print(f"bins = {self.bins}")
         print(f"hist = {self.hist}")
+        print(f"dtype = {self.dtype}")
+        if self.mask is not None:
+            print(f"mask = {int(self.mask.sum())} of {self.mask.size} nodes")
         if self.model:
             print(f"Model = {self.model}")
             print(f"   zk = {self.zk_final} ")
@@ -157,15 +180,105 @@ class Kgrid:
         )
         self.zk_final = final_model["zk"]
 
-    def estimate_grid(self, preview=False, filename="result"):
+    def set_mask(self, mask, buffer: float = 0.0, alpha: float = None):
+        """
+        Restrict the estimation to a part of the window. Masked-out nodes are
+        skipped before any neighbor search or Kriging work and are written as NaN.
+
+        :param mask: list of (x, y) polygon vertices (original units), "hull"
+            (convex hull of the data), "concave" (alpha shape of the data), a
+            boolean raster of shape (hist, bins) with True for the nodes to
+            estimate, or None to estimate the full window
+        :type mask: Union[list, str, np.ndarray]
+        :param buffer: grow the area by this distance (original units), defaults to 0.0
+        :type buffer: float, optional
+        :param alpha: maximum triangle edge of the "concave" hull (original
+            units), defaults to None (3 times the median Delaunay edge)
+        :type alpha: float, optional
+        """
+        if mask is None:
+            self.mask = None
+            return
+
+        kd = self.kdata
+        scale = kd._norm_params["xy_scale"] if kd.normalized else 1.0
+        if not isinstance(mask, (str, np.ndarray)) or (
+            isinstance(mask, np.ndarray) and mask.dtype != bool
+        ):
+            # Polygon vertices in working units
+            vx, vy = np.asarray(mask, dtype=float).T
+            vx, vy, _, _ = kd.norm_coord(vx, vy)
+            mask = np.column_stack((vx, vy))
+
+        self.mask = build_grid_mask(
+            np.linspace(self._xmin, self._xmax, self.bins),
+            np.linspace(self._ymin, self._ymax, self.hist),
+            mask,
+            data_xy=kd.xyz[:, :2],
+            buffer=buffer * scale,
+            alpha=None if alpha is None else alpha * scale,
+        )
+        print(f"Mask: {int(self.mask.sum())} of {self.mask.size} nodes to estimate.")
+
+    def estimate_grid(
+        self,
+        preview=False,
+        filename="result",
+        block=False,
+        nsub=3,
+        pyramid=False,
+        return_sigma=True,
+        models=None,
+    ):
         """
         Run the grid estimation using the parent Kdata model.
 
+        Z and SIGMA are stored with `Kgrid.dtype` (`"float32"` halves the
+        memory of the estimated layers and of the `.ovr` pyramid).
+
         :param preview: plot a contour map preview if True, defaults to False
         :type preview: bool, optional
         :param filename: grid result filename base, defaults to "result"
         :type filename: str, optional
+        :param block: estimate cell averages (block Kriging) instead of point
+            values, cells are centered at the grid nodes, defaults to False
+        :type block: bool, optional
+        :param nsub: block Kriging quadrature points per cell side, defaults to 3
+        :type nsub: int, optional
+        :param pyramid: also write an overview pyramid (`.ovr`) used by Gplot
+            to browse large grids, defaults to False
+        :type pyramid: bool, optional
+        :param return_sigma: compute and write the SIGMA column, False skips the
+            error variances and writes a Z-only grid, defaults to True
+        :type return_sigma: bool, optional
+        :param models: estimate these models of `Kdata.crossvaldata` in a single
+            pass (shared neighborhoods, stacked solves) and write one grid per
+            model instead of the selected model, defaults to None
+        :type models: list[int], optional
+        :raises ValueError: unknown model or `models` with block Kriging
         """
+        if models is not None:
+            if block:
+                raise ValueError("Multi-model estimation only supports point Kriging.")
+            zks = [self.kdata._model_zk(m) for m in models]
+            print(f"\n[GRID] Generating maps with Models {list(models)}...")
+            if preview:
+                fast_preview(self.kdata, zks[0])
+            export_grid_models(
+                self,
+                list(models),
+                zks,
+                [
+                    f"{filename}_{self.kdata.nork}_{self.kdata.nvec}_mod_{m}"
+                    for m in models
+                ],
+                res_x=self.bins,
+                res_y=self.hist,
+                pyramid=pyramid,
+                return_sigma=return_sigma,
+            )
+            return
+
         print(f"\n[GRID] Generating map with Model #{self.model}...")
         if preview:
             fast_preview(self.kdata, self.zk_final)
@@ -175,6 +288,288 @@ class Kgrid:
             filename=f"{filename}_{self.kdata.nork}_{self.kdata.nvec}_mod_{self.model}",
             res_x=self.bins,
             res_y=self.hist,
+            nsub=nsub if block else None,
+            pyramid=pyramid,
+            return_sigma=return_sigma,
+        )
+
+    def estimate_grid_ensemble(
+        self, top_k=3, models=None, filename="ensemble", pyramid=False
+    ):
+        """
+        Model-averaged grid estimation in a single pass.
+
+        The best `top_k` models of `Kdata.crossvaldata` (lowest RMSE), or the
+        given `models`, are kriged with shared neighborhoods and combined with
+        weights proportional to 1/RMSE^2. The `<filename>_<nork>_<nvec>_ens_<k>.grd`
+        file has the averaged Z_ESTIM, the pooled Kriging error SIGMA and the
+        between-model SPREAD (total uncertainty: sqrt(SIGMA^2 + SPREAD^2)).
+
+        :param top_k: number of best models to combine, defaults to 3
+        :type top_k: int, optional
+        :param models: explicit model numbers, instead of `top_k`, defaults to None
+        :type models: list[int], optional
+        :param filename: grid result filename base, defaults to "ensemble"
+        :type filename: str, optional
+        :param pyramid: also write an overview pyramid (`.ovr`), defaults to False
+        :type pyramid: bool, optional
+        :raises ValueError: unknown model
+        """
+        if models is None:
+            entries = sorted(self.kdata.crossvaldata, key=lambda r: r["rmse"])[:top_k]
+        else:
+            entries = [self.kdata._cv_entry(m) for m in models]
+        models = [r["model_idx"] for r in entries]
+        weights = 1.0 / np.array([r["rmse"] for r in entries]) ** 2
+        weights /= weights.sum()
+
+        print(f"\n[GRID] Generating ensemble map with Models {models}...")
+        for m, w in zip(models, weights):
+            print(f"   Model #{m}: weight {w:.4f}")
+        export_grid_ensemble(
+            self,
+            models,
+            [r["zk"] for r in entries],
+            weights,
+            f"{filename}_{self.kdata.nork}_{self.kdata.nvec}_ens_{len(models)}",
+            res_x=self.bins,
+            res_y=self.hist,
+            pyramid=pyramid,
+        )
+
+    def estimate_grid_adaptive(
+        self,
+        filename="result",
+        coarse=8,
+        sigma_tol=None,
+        grad_tol=None,
+        z_tol=None,
+        pyramid=False,
+    ):
+        """
+        Run the grid estimation with adaptive resolution.
+
+        Starts from a coarse grid and refines quadtree cells that contain data
+        points, or where the estimated SIGMA or the local Z gradient exceeds a
+        threshold, or where the kriged midpoint differs from the bilinear
+        value by more than `z_tol`. The rest of the nodes are filled by
+        bilinear interpolation. The output is a regular `bins` x `hist` grid,
+        as with `estimate_grid()`. With no tolerance given, every node is kriged.
+
+        :param filename: grid result filename base, defaults to "result"
+        :type filename: str, optional
+        :param coarse: initial node spacing (power of two), defaults to 8
+        :type coarse: int, optional
+        :param sigma_tol: SIGMA threshold (original units), defaults to None (not used)
+        :type sigma_tol: float, optional
+        :param grad_tol: Z gradient threshold (Z units per X/Y unit), defaults
+            to None (not used)
+        :type grad_tol: float, optional
+        :param z_tol: maximum midpoint difference between the kriged and the
+            bilinear Z (original units), defaults to None (the midpoint SIGMA)
+        :type z_tol: float, optional
+        :param pyramid: also write an overview pyramid (`.ovr`), defaults to False
+        :type pyramid: bool, optional
+        """
+        print(f"\n[GRID] Generating adaptive map with Model #{self.model}...")
+        export_grid_adaptive(
+            self,
+            self.zk_final,
+            filename=f"{filename}_{self.kdata.nork}_{self.kdata.nvec}_mod_{self.model}",
+            res_x=self.bins,
+            res_y=self.hist,
+            coarse=coarse,
+            sigma_tol=sigma_tol,
+            grad_tol=grad_tol,
+            z_tol=z_tol,
+            pyramid=pyramid,
+        )
+
+    def compute_weights(self, filename: str = None):
+        """
+        Precompute the kriging weights of the grid using the selected model.
+
+        The weights (lambdas) only depend on the data locations, `nvec`, `nork`
+        and the model, so they are stored as a sparse matrix W (grid nodes x data
+        points) together with the sigma map. New Z readings at the same data
+        locations can then be kriged with `estimate_from_weights()`.
+
+        :param filename: if given, also save the weights to `filename.kgw`, defaults to None
+        :type filename: str, optional
+        :raises ValueError: model must be set before computing the weights
+        """
+        if self.zk_final is None:
+            raise ValueError("Model must be set before computing the weights.")
+
+        print(f"\n[GRID] Computing weights with Model #{self.model}...")
+        self.weights, self.sigma_map = compute_grid_weights(
+            self, self.zk_final, res_x=self.bins, res_y=self.hist
+        )
+        if filename is not None:
+            self.save_weights(filename)
+
+    def save_weights(self, filename: str):
+        """
+        Save the precomputed weights and sigma map to a `.kgw` file.
+
+        :param filename: filename base (without the .kgw extension)
+        :type filename: str
+        :raises RuntimeError: weights not computed yet
+        """
+        if self.weights is None:
+            raise RuntimeError("Weights not computed! Run .compute_weights() first.")
+
+        if not filename.endswith(".kgw"):
+            filename += ".kgw"
+
+        metadata = {
+            "fecha_creacion": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "title": self.kdata.title,
+            "n_puntos": self.weights.shape[1],
+            "window": (self._xmin, self._xmax, self._ymin, self._ymax),
+            "bins": self.bins,
+            "hist": self.hist,
+            "nork": self.kdata.nork,
+            "nvec": self.kdata.nvec,
+            "model": self.model,
+            "zk": self.zk_final,
+        }
+        joblib.dump(
+            {"metadata": metadata, "weights": self.weights, "sigma": self.sigma_map},
+            filename,
+            compress=3,
+        )
+        print(f"[OK] Saved: {filename}")
+
+    def load_weights(self, filename: str):
+        """
+        Load weights and sigma map previously saved with `save_weights()`.
+
+        The stored grid definition must match this object and its Kdata.
+
+        :param filename: filename base (with or without the .kgw extension)
+        :type filename: str
+        :raises ValueError: the stored weights do not match the grid or the data
+        """
+        if not filename.endswith(".kgw"):
+            filename += ".kgw"
+
+        checkpoint = joblib.load(filename)
+        meta = checkpoint["metadata"]
+
+        if (meta["bins"], meta["hist"]) != (self.bins, self.hist) or not np.allclose(
+            meta["window"], (self._xmin, self._xmax, self._ymin, self._ymax)
+        ):
+            raise ValueError(f"Grid definition of {filename} does not match this Kgrid.")
+        if meta["n_puntos"] != len(self.kdata.x):
+            raise ValueError(
+                f"{filename} was computed for {meta['n_puntos']} points, "
+                f"Kdata has {len(self.kdata.x)}."
+            )
+
+        self.weights = checkpoint["weights"]
+        self.sigma_map = checkpoint["sigma"]
+        self._model = meta["model"]
+        self.zk_final = meta["zk"]
+        print(
+            f"[LOAD] Weights recovered: Model {meta['model']} | nork: {meta['nork']} | nvec: {meta['nvec']}"
+        )
+
+    def to_operator(self):
+        """
+        Linear kriging operator of the grid as a `scipy.sparse.csr_matrix`.
+
+        The operator has one row per grid node (row-major, X varies fastest)
+        and one column per data point, with `nvec` nonzeros per row (failed
+        nodes are empty rows). Since the weights of every node add up to one,
+        it maps Z values in original units directly to grid estimates, so it
+        can be applied, transposed or composed without pyGEKO.
+
+        The weights are computed with `compute_weights()` if needed.
+
+        :return: kriging operator
+        :rtype: scipy.sparse.csr_matrix
+        """
+        if self.weights is None:
+            self.compute_weights()
+        return self.weights
+
+    def export_operator(self, filename: str):
+        """
+        Save the kriging operator to an uncompressed `.kop` file that can be
+        memory-mapped and shared across processes with `utils.load_operator()`.
+
+        :param filename: filename base (without the .kop extension)
+        :type filename: str
+        """
+        W = self.to_operator()
+        kd = self.kdata
+        # Grid window in original units, to locate the operator rows
+        xmin, ymin, _, _ = kd.denorm_coord(self._xmin, self._ymin)
+        xmax, ymax, _, _ = kd.denorm_coord(self._xmax, self._ymax)
+        # Kriging errors in original units too (NaN for failed nodes)
+        _, _, _, sigma = kd.denorm_coord(0, 0, 0, self.sigma_map)
+        metadata = {
+            "fecha_creacion": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "title": kd.title,
+            "window": (xmin, xmax, ymin, ymax),
+            "bins": self.bins,
+            "hist": self.hist,
+            "nork": kd.nork,
+            "nvec": kd.nvec,
+            "model": self.model,
+            "zk": self.zk_final,
+            "sigma": sigma,
+        }
+        save_operator(W, filename, metadata)
+
+    def estimate_from_weights(self, z, filename: str = "result"):
+        """
+        Krige a new set of Z values with the precomputed weights (one sparse
+        product) and export the grid as `estimate_grid()` does.
+
+        :param z: new Z values in original units, ordered as the Kdata rows,
+            or the name of a Kdata column holding them
+        :type z: array_like or str
+        :param filename: grid result filename base, defaults to "result"
+        :type filename: str, optional
+        :raises RuntimeError: weights not computed yet
+        :raises ValueError: Z length does not match the number of data points
+        """
+        if self.weights is None:
+            raise RuntimeError("Weights not computed! Run .compute_weights() first.")
+
+        kd = self.kdata
+        if isinstance(z, str) and z == kd.z_col:
+            z_norm = kd.z  # Already in the working (normalized) units
+        else:
+            if isinstance(z, str):
+                z = kd.dframe[z].values
+            z = np.asarray(z, dtype=float)
+            _, _, z_norm, _ = kd.norm_coord(0.0, 0.0, z)
+
+        if len(z_norm) != self.weights.shape[1]:
+            raise ValueError(
+                f"Expected {self.weights.shape[1]} Z values, got {len(z_norm)}."
+            )
+
+        xi = np.linspace(self._xmin, self._xmax, self.bins)
+        yi = np.linspace(self._ymin, self._ymax, self.hist)
+
+        # Failed nodes have empty rows in W: restore their NaN
+        z_estim = self.weights @ z_norm
+        z_estim[np.isnan(self.sigma_map)] = np.nan
+
+        # _write_grid denormalizes in place: sigma_map must be copied
+        _write_grid(
+            self,
+            xi,
+            yi,
+            z_estim.reshape(self.hist, self.bins).astype(self.dtype),
+            self.sigma_map.reshape(self.hist, self.bins).astype(self.dtype),
+            self.zk_final,
+            f"{filename}_{kd.nork}_{kd.nvec}_mod_{self.model}",
+            extra_meta={"weights": "precomputed"},
         )
 
     def __repr__(self):
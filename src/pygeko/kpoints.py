@@ -0,0 +1,131 @@
+"""
+pyGEKO Kpoints Module
+-------------------
+Handles Kriging estimation at scattered target points.
+"""
+
+from pygeko.kdata import Kdata
+from pygeko.utils import export_points, report_models
+
+
+class KpointsCSV:
+    """Scattered target points read from a CSV or Parquet file."""
+
+    def __init__(
+        self,
+        kdata: "Kdata",
+        path: str,
+        x_col: str = "X",
+        y_col: str = "Y",
+        id_cols: list = None,
+        chunksize: int = 200_000,
+    ):
+        """Class constructor
+
+        The file is not loaded here: it is read in chunks of `chunksize` rows
+        during the estimation, so files with millions of points can be processed
+        with bounded memory.
+
+        :param kdata: Kdata object with the source points
+        :type kdata: ~pygeko.Kdata
+        :param path: `.csv` or `.parquet` (requires pyarrow) file with the target points, in original units
+        :type path: str
+        :param x_col: column with the X coordinates, defaults to "X"
+        :type x_col: str, optional
+        :param y_col: column with the Y coordinates, defaults to "Y"
+        :type y_col: str, optional
+        :param id_cols: columns copied unchanged to the output, defaults to None
+        :type id_cols: list, optional
+        :param chunksize: rows per chunk, defaults to 200_000
+        :type chunksize: int, optional
+        """
+        assert isinstance(kdata, Kdata)
+        self.kdata = kdata
+        self.path = path
+        self.x_col = x_col
+        self.y_col = y_col
+        self.id_cols = list(id_cols or [])
+        self.chunksize = chunksize
+        # Model
+        self._model = None
+        self.zk_final = None
+
+    @property
+    def models(self):
+        """
+        Print a detailed report of all tested models.
+        """
+        report_models(self.kdata)
+
+    @property
+    def model(self):
+        """Selected model getter"""
+        return self._model
+
+    @model.setter
+    def model(self, value: int):
+        """Selected model setter and logic to link with cross-validation results
+
+        :param value: number of the selected model
+        :type value: int
+        """
+        self._model = value
+        # Link the chosen model from kdata cross-validation
+        try:
+            final_model = next(
+                m for m in self.kdata.crossvaldata if m["model_idx"] == value
+            )
+            self.zk_final = final_model["zk"]
+        except StopIteration:
+            print(f"⚠️ Model index {value} not found in Kdata cross-validation.")
+
+    @property
+    def status(self):
+        """
+        Print the status of the object
+        """
+        print(f"Data from: {self.kdata.title}")
+        print(f"ntot = {self.kdata.shape[0]}")
+        print("Columns:")
+        print(f"   x_col = {self.kdata.x_col}")
+        print(f"   y_col = {self.kdata.y_col}")
+        print(f"   z_col = {self.kdata.z_col}")
+        if self.kdata.normalized:
+            print("Normalized (0-1000 range)")
+        else:
+            print("Raw (Original units)")
+        print(f"targets: {self.path}")
+        print(f"   x_col = {self.x_col}")
+        print(f"   y_col = {self.y_col}")
+        print(f"   id_cols = {self.id_cols}")
+        print(f"nork: {self.kdata.nork}")
+        print(f"nvec: {self.kdata.nvec}")
+        if self.model:
+            print(f"Model = {self.model}")
+            print(f"   zk = {self.zk_final} ")
+
+    def estimate_points(self, filename: str = "points", return_sigma: bool = True):
+        """
+        Krige every target point and write `<filename>_<nork>_<nvec>_mod_<model>.pts`
+        (CSV with X, Y, Z_ESTIM, SIGMA and the ID columns) and its `.hdr`.
+        Failed points have empty Z_ESTIM and SIGMA.
+
+        :param filename: output filename base, defaults to "points"
+        :type filename: str, optional
+        :param return_sigma: compute and write the SIGMA column, defaults to True
+        :type return_sigma: bool, optional
+        :raises ValueError: model must be set before estimation
+        """
+        if self.model is None or self.zk_final is None:
+            raise ValueError("Model must be set before estimation.")
+
+        if self.kdata.kdtree is None:
+            self.kdata.init_neig()
+
+        print(f"\n[POINTS] Kriging target points with model #{self.model}...")
+
+        full_name = f"{filename}_{self.kdata.nork}_{self.kdata.nvec}_mod_{self.model}"
+
+        export_points(
+            self, self.zk_final, filename=full_name, return_sigma=return_sigma
+        )
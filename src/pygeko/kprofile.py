@@ -200,12 +200,14 @@ class Kprofile:
             print(f"Model = {self.model}")
             print(f"   zk = {self.zk_final} ")
 
-    def estimate_profile(self, filename: str="profile"):
+    def estimate_profile(self, filename: str="profile", return_sigma: bool = True):
         """
         Run the profile estimation using the parent Kdata model.
 
         :param filename: output filename base, defaults to "profile"
         :type filename: str, optional
+        :param return_sigma: compute and write the SIGMA column, defaults to True
+        :type return_sigma: bool, optional
         :raises ValueError: model must be set before estimation
         """        
         if self.model is None or self.zk_final is None:
@@ -216,7 +218,9 @@ class Kprofile:
         # We build the filename according to your specification
         full_name = f"{filename}_{self.kdata.nork}_{self.kdata.nvec}_mod_{self.model}"
 
-        export_profile(self, self.zk_final, filename=full_name)
+        export_profile(
+            self, self.zk_final, filename=full_name, return_sigma=return_sigma
+        )
 
 
 class KprofileCSV(Kprofile):
@@ -276,7 +280,8 @@ class Pplot:
         self.X = self.df["X"].values
         self.Y = self.df["Y"].values
         self.Z = self.df["Z_ESTIM"].values
-        self.E = self.df["SIGMA"].values
+        # Z-only profiles (estimated with return_sigma=False) have no SIGMA
+        self.E = self.df["SIGMA"].values if "SIGMA" in self.df else None
 
         # --- Calculate cumulative distance along the path ---
         dx = np.diff(self.X)
@@ -339,7 +344,8 @@ class Pplot:
         depth = 2**16 if z_max_val > 255 else 255
 
         self.Z = ((hmax - hmin) / depth) * self.Z + hmin
-        self.E = ((hmax - hmin) / depth) * self.E
+        if self.E is not None:
+            self.E = ((hmax - hmin) / depth) * self.E
         self.calib_dic = {
             "hmin": hmin,
             "hmax": hmax,
@@ -374,7 +380,7 @@ class Pplot:
         temp_Z = temp_Z - sea_level if sea_level is not None else temp_Z
 
         # 1. Uncertainty and Elevation (same as before)
-        if show_error:
+        if show_error and self.E is not None:
             ax.fill_between(
                 self.dist,
                 temp_Z - self.E,
@@ -1,24 +1,201 @@
 import argparse
+import csv
+import json
 import os
-import joblib
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from pygeko.catgck import _json_default, read_gck_summary
 
 # from datetime import datetime
 
+INDEX_FILE = ".gck_index"
+"""Name of the per-directory summary cache written by `scan_gck_files`"""
 
-def check_gck_files(directory: str = ".", verbose: bool = False):
-    """Scan the directory for .gck files and display their contents.
+INDEX_VERSION = 1
+
+FIELDS = ["file", "isnorm", "date", "nork", "nvec", "mae", "rmse", "corr", "model"]
+"""Columns of the `lsgck` summary rows"""
+
+
+def _gck_row(path: str) -> dict:
+    """
+    Internal function to build the summary row of a `.gck` file.
+
+    :param path: `.gck` file path
+    :type path: str
+    :return: row with the `FIELDS` keys plus `status` ("ok", "old" or an error message)
+    :rtype: dict
+    """
+    row = dict.fromkeys(FIELDS)
+    row["file"] = os.path.basename(path)
+    try:
+        m, _ = read_gck_summary(path)
+    except Exception as e:
+        row["status"] = f"Error reading file: {str(e)[:20]}..."
+        return row
+
+    if not isinstance(m, dict):
+        row["status"] = "old"
+        return row
+
+    p = m.get("params", {})
+    res = m.get("metricas", {})
+    row.update(
+        {
+            "isnorm": m.get("isnorm", None),
+            "date": m.get("fecha_creacion", None),
+            "nork": p.get("nork"),
+            "nvec": p.get("nvec"),
+            "mae": res.get("MAE"),
+            "rmse": res.get("RMSE"),
+            "corr": res.get("Corr"),
+            "model": p.get("model_id"),
+            "status": "ok",
+        }
+    )
+    return row
+
+
+def scan_gck_files(
+    directory: str = ".", use_index: bool = True, workers: int = None
+) -> list[dict]:
+    """Scan the directory for .gck files in parallel and return their summary rows.
+
+    With `use_index=True` the rows are cached in a `.gck_index` file in the
+    directory, and only the files whose mtime or size changed are read again.
 
     :param directory: directory to scan, defaults to "."
     :type directory: str, optional
-    :param verbose: print additional information, defaults to False
-    :type verbose: bool, optional
+    :param use_index: use and refresh the `.gck_index` cache, defaults to True
+    :type use_index: bool, optional
+    :param workers: number of threads, defaults to None (ThreadPoolExecutor default)
+    :type workers: int, optional
+    :return: one row (dict) per file, sorted by filename
+    :rtype: list[dict]
     """
-    files = [f for f in os.listdir(directory) if f.endswith(".gck")]
+    stats = {}
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith(".gck") and entry.is_file():
+                st = entry.stat()
+                stats[entry.name] = (st.st_mtime_ns, st.st_size)
 
-    if not files:
-        print("No .gck files were found in this directory.")
-        return
+    index_path = os.path.join(directory, INDEX_FILE)
+    cached = {}
+    if use_index:
+        try:
+            with open(index_path) as f:
+                index = json.load(f)
+            if index.get("version") == INDEX_VERSION:
+                cached = index.get("files", {})
+        except (OSError, ValueError):
+            pass
+
+    rows = {}
+    stale = []
+    for name, (mtime, size) in stats.items():
+        entry = cached.get(name)
+        if entry and entry["mtime"] == mtime and entry["size"] == size:
+            rows[name] = entry["row"]
+        else:
+            stale.append(name)
 
+    if stale:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            paths = [os.path.join(directory, name) for name in stale]
+            for name, row in zip(stale, executor.map(_gck_row, paths)):
+                rows[name] = row
+
+    if use_index and (stale or len(cached) != len(stats)):
+        index = {
+            "version": INDEX_VERSION,
+            "files": {
+                name: {"mtime": stats[name][0], "size": stats[name][1], "row": row}
+                for name, row in rows.items()
+            },
+        }
+        try:
+            with open(index_path, "w") as f:
+                json.dump(index, f, default=_json_default)
+        except OSError:
+            pass  # Read-only directory: the index is only a cache
+
+    return [rows[name] for name in sorted(rows)]
+
+
+def select_rows(
+    rows: list[dict],
+    sort_by: str = None,
+    reverse: bool = False,
+    nork: int = None,
+    nvec: int = None,
+    max_mae: float = None,
+    max_rmse: float = None,
+) -> list[dict]:
+    """Filter and sort the rows returned by `scan_gck_files`.
+
+    Files that could not be summarized are dropped when any filter is used
+    and are sorted last.
+
+    :param rows: summary rows
+    :type rows: list[dict]
+    :param sort_by: one of `FIELDS`, defaults to None (by filename)
+    :type sort_by: str, optional
+    :param reverse: descending order, defaults to False
+    :type reverse: bool, optional
+    :param nork: keep only this nork, defaults to None
+    :type nork: int, optional
+    :param nvec: keep only this nvec, defaults to None
+    :type nvec: int, optional
+    :param max_mae: keep only MAE <= max_mae, defaults to None
+    :type max_mae: float, optional
+    :param max_rmse: keep only RMSE <= max_rmse, defaults to None
+    :type max_rmse: float, optional
+    :raises ValueError: unknown sort field
+    :return: selected rows
+    :rtype: list[dict]
+    """
+    if any(v is not None for v in (nork, nvec, max_mae, max_rmse)):
+
+        def keep(r):
+            if r["status"] != "ok":
+                return False
+            if nork is not None and r["nork"] != nork:
+                return False
+            if nvec is not None and r["nvec"] != nvec:
+                return False
+            if max_mae is not None and not (
+                isinstance(r["mae"], (int, float)) and r["mae"] <= max_mae
+            ):
+                return False
+            if max_rmse is not None and not (
+                isinstance(r["rmse"], (int, float)) and r["rmse"] <= max_rmse
+            ):
+                return False
+            return True
+
+        rows = [r for r in rows if keep(r)]
+
+    if sort_by is not None:
+        if sort_by not in FIELDS:
+            raise ValueError(f"sort_by must be one of {FIELDS}")
+        valid = [r for r in rows if r[sort_by] is not None]
+        missing = [r for r in rows if r[sort_by] is None]
+        rows = sorted(valid, key=lambda r: r[sort_by], reverse=reverse) + missing
+
+    return rows
+
+
+def _print_table(rows: list[dict], verbose: bool = False):
+    """
+    Internal function to print the rows as the `lsgck` table.
+
+    :param rows: summary rows
+    :type rows: list[dict]
+    :param verbose: print additional information, defaults to False
+    :type verbose: bool, optional
+    """
     # Table header
     if verbose:
         header = (
@@ -34,51 +211,106 @@ def check_gck_files(directory: str = ".", verbose: bool = False):
         print(header)
         print("-" * len(header))
 
-    # found_any = False
-    for f in sorted(files):
-        try:
-            # We only load the metadata to speed things up (if the file allows it)
-            # Note: joblib loads the entire file, but because it's compressed, it's faster
-            data = joblib.load(directory + "/" + f)
-
-            if isinstance(data, dict) and "metadata" in data:
-                m = data["metadata"]
-                p = m.get("params", {})
-                res = m.get("metricas", {})
-                # Extract information about normalization mode
-                isn=m.get("isnorm",None)
-                if isn is None:  # Pre v1.0.0dev1 gck file case
-                    isN = '?'
-                elif isn:        # v1.0.0dev1 onwards gck file case
-                    isN = 'Y'
-                else:
-                    isN = 'N'   
-
-
-                # Format date (day and month only)
-                fecha_str = m.get("fecha_creacion", "N/D").split(" ")[0][5:]
-                # One alternative 
-                # mae_str = f"{res.get('MAE', 0):.4f}" if isinstance(res.get('MAE'), (int, float)) else "N/A"
-                if verbose:
-                    print(
-                        f"{f:<30} | {isN:<1} | {fecha_str:<6} | {p.get('nork', '??'):<5} | {p.get('nvec', '??'):<5} "
-                        + f"| {res.get('MAE', '??'):8g} | {res.get('RMSE', '??'):8g} "
-                        + f"| {res.get('Corr', '??'):8g} | {p.get('model_id', '??'):<6}"
-                    )
-                else:
-                    print(
-                        f"{f:<30} | {isN:<1} | {fecha_str:<6} | {p.get('nork', '??'):<5} | {p.get('nvec', '??'):<5} "
-                        + f"| {res.get('MAE', '??'):8g} | {p.get('model_id', '??'):<6}"
-                    )
-                # found_any = True
-            else:
-                print(f"{f:<30} | [Old file or file without metadata]")
-        except Exception as e:
-            print(f"{f:<30} | [Error reading file: {str(e)[:20]}...]")
+    for r in rows:
+        f = r["file"]
+        if r["status"] == "old":
+            print(f"{f:<30} | [Old file or file without metadata]")
+            continue
+        if r["status"] != "ok":
+            print(f"{f:<30} | [{r['status']}]")
+            continue
+
+        # Extract information about normalization mode
+        isn = r["isnorm"]
+        if isn is None:  # Pre v1.0.0dev1 gck file case
+            isN = "?"
+        elif isn:  # v1.0.0dev1 onwards gck file case
+            isN = "Y"
+        else:
+            isN = "N"
+
+        # Format date (day and month only)
+        fecha_str = (r["date"] or "N/D").split(" ")[0][5:]
+
+        def g(v):
+            return f"{v:8g}" if isinstance(v, (int, float)) else f"{'??':<8}"
+
+        def s(v):
+            return "??" if v is None else v
+
+        if verbose:
+            print(
+                f"{f:<30} | {isN:<1} | {fecha_str:<6} | {s(r['nork']):<5} | {s(r['nvec']):<5} "
+                + f"| {g(r['mae'])} | {g(r['rmse'])} "
+                + f"| {g(r['corr'])} | {s(r['model']):<6}"
+            )
+        else:
+            print(
+                f"{f:<30} | {isN:<1} | {fecha_str:<6} | {s(r['nork']):<5} | {s(r['nvec']):<5} "
+                + f"| {g(r['mae'])} | {s(r['model']):<6}"
+            )
 
     print("=" * len(header) + "\n")
 
 
+def check_gck_files(
+    directory: str = ".",
+    verbose: bool = False,
+    sort_by: str = None,
+    reverse: bool = False,
+    nork: int = None,
+    nvec: int = None,
+    max_mae: float = None,
+    max_rmse: float = None,
+    fmt: str = "table",
+    use_index: bool = True,
+    workers: int = None,
+):
+    """Scan the directory for .gck files and display their contents.
+
+    :param directory: directory to scan, defaults to "."
+    :type directory: str, optional
+    :param verbose: print additional information, defaults to False
+    :type verbose: bool, optional
+    :param sort_by: one of `FIELDS`, defaults to None (by filename)
+    :type sort_by: str, optional
+    :param reverse: descending order, defaults to False
+    :type reverse: bool, optional
+    :param nork: show only this nork, defaults to None
+    :type nork: int, optional
+    :param nvec: show only this nvec, defaults to None
+    :type nvec: int, optional
+    :param max_mae: show only MAE <= max_mae, defaults to None
+    :type max_mae: float, optional
+    :param max_rmse: show only RMSE <= max_rmse, defaults to None
+    :type max_rmse: float, optional
+    :param fmt: output format: "table", "csv" or "json", defaults to "table"
+    :type fmt: str, optional
+    :param use_index: use and refresh the `.gck_index` cache, defaults to True
+    :type use_index: bool, optional
+    :param workers: number of threads, defaults to None
+    :type workers: int, optional
+    """
+    rows = scan_gck_files(directory, use_index=use_index, workers=workers)
+
+    if not rows:
+        if fmt == "table":
+            print("No .gck files were found in this directory.")
+        return
+
+    rows = select_rows(rows, sort_by, reverse, nork, nvec, max_mae, max_rmse)
+
+    if fmt == "csv":
+        writer = csv.DictWriter(sys.stdout, fieldnames=FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(r for r in rows if r["status"] == "ok")
+    elif fmt == "json":
+        json.dump(rows, sys.stdout, indent=2, default=_json_default)
+        print()
+    else:
+        _print_table(rows, verbose)
+
+
 def main():
     """
     Program entry point
@@ -102,14 +334,60 @@ def main():
         action="store_true",
         default=False,
     )
+    parser.add_argument(
+        "-s",
+        "--sort",
+        choices=FIELDS,
+        default=None,
+        help="sort by this column (default: file)",
+    )
+    parser.add_argument(
+        "-r", "--reverse", action="store_true", help="descending sort order"
+    )
+    parser.add_argument("--nork", type=int, default=None, help="show only this nork")
+    parser.add_argument("--nvec", type=int, default=None, help="show only this nvec")
+    parser.add_argument(
+        "--max-mae", type=float, default=None, help="show only MAE <= MAX_MAE"
+    )
+    parser.add_argument(
+        "--max-rmse", type=float, default=None, help="show only RMSE <= MAX_RMSE"
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=["table", "csv", "json"],
+        default="table",
+        help="output format (default: table)",
+    )
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help=f"do not use or update the {INDEX_FILE} cache",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None, help="number of reading threads"
+    )
 
     args = parser.parse_args()
 
     target_dir = os.path.abspath(args.dir)
 
     if os.path.isdir(target_dir):
-        print(f"Scanning directory: {target_dir}")
-        check_gck_files(target_dir, args.verbose)
+        if args.format == "table":
+            print(f"Scanning directory: {target_dir}")
+        check_gck_files(
+            target_dir,
+            args.verbose,
+            sort_by=args.sort,
+            reverse=args.reverse,
+            nork=args.nork,
+            nvec=args.nvec,
+            max_mae=args.max_mae,
+            max_rmse=args.max_rmse,
+            fmt=args.format,
+            use_index=not args.no_index,
+            workers=args.jobs,
+        )
     else:
         print(f"Error: The path '{target_dir}' is not a valid directory.")
 
@@ -11,8 +11,10 @@ os.environ["MKL_NUM_THREADS"] = "1"
 
 import datetime
 import platform
+import warnings
 from typing import TYPE_CHECKING, Optional, Tuple, Union  # noqa: F401
 
+import joblib
 import matplotlib.pyplot as plt
 import numpy as np
 from scipy.spatial.distance import pdist, squareform
@@ -26,15 +28,18 @@ if TYPE_CHECKING:
 
 plt.rcParams['savefig.directory'] = os.getcwd()
 
-def _worker_tune(nork, nvec, kd_instance, verbose):
+def _worker_tune(nork, nvec, kd_instance, verbose, save=True):
     """
     This function runs in a separate child process.
     Upon completion, all of its memory (the 300MB leak) is lost.
+    The results are returned in memory, the `.gck` file is only written
+    if `save` is True.
     """
     kd_instance._nork = nork
     kd_instance._nvec = nvec
     kd_instance._execute_analysis(verbose=verbose)
-    kd_instance.save(verbose=verbose)
+    if save:
+        kd_instance.save(verbose=verbose)
 
     return {
         "nork": nork,
@@ -73,42 +78,277 @@ def get_optimal_workers() -> int:
     return max(1, cpus - 1) if IS_PI else cpus
 
 
-def _process_row(y, xi, kd_obj, zk_vec) -> list[tuple]:
+_worker_kdata = None  # Kdata object of the pool workers, see kriging_pool()
+
+
+def _init_worker(kd_obj):
+    """
+    Pool initializer: keeps the Kdata object (with its KDTree) in the worker process
+
+    :param kd_obj: Kdata object
+    :type kd_obj: Kdata
+    """
+    global _worker_kdata
+    _worker_kdata = kd_obj
+
+
+def kriging_pool(kd_obj: "Kdata", max_workers: int = None) -> ProcessPoolExecutor:
+    """
+    Process pool whose workers receive the Kdata object once, at start-up
+    (inherited on fork, pickled once per worker otherwise), instead of once
+    per task. Tasks of the `_process_*` workers must then pass `kd_obj=None`.
+
+    :param kd_obj: Kdata object
+    :type kd_obj: Kdata
+    :param max_workers: number of processes, defaults to None (get_optimal_workers())
+    :type max_workers: int, optional
+    :return: process pool
+    :rtype: ProcessPoolExecutor
+    """
+    kd_obj._sync_data()  # Workers must not inherit stale caches
+    return ProcessPoolExecutor(
+        max_workers=max_workers or get_optimal_workers(),
+        initializer=_init_worker,
+        initargs=(kd_obj,),
+    )
+
+
+def _process_row(y, xi, kd_obj, zk_vec, return_sigma=True) -> list[tuple]:
     """Processes a complete row of the grid
 
     :param y: row Y value
     :type y: float
     :param xi: X values
     :type xi: numpy.ndarray
-    :param kd_obj: Kdata object
+    :param kd_obj: Kdata object, None to use the one of the pool worker
     :type kd_obj: Kdata
     :param zk_vec: model parameters
     :type zk_vec: list[float]
-    :return: estimated row
+    :param return_sigma: also compute the errors, defaults to True
+    :type return_sigma: bool, optional
+    :return: estimated row, (x, y, z, sigma) or (x, y, z) if not return_sigma
     :rtype: list[tuple]
     """
+    kd_obj = _worker_kdata if kd_obj is None else kd_obj
+    neig, _, _, noct = kd_obj.query_neighbors(
+        xi, np.full(len(xi), y), kd_obj.nvec, workers=1
+    )
     row_results = []
-    for x in xi:
-        z, s = estimate_at(kd_obj, x, y, zk=zk_vec)
+    for j, x in enumerate(xi):
+        z, s = estimate_at(
+            kd_obj,
+            x,
+            y,
+            zk=zk_vec,
+            neighborhood=(neig[j], noct[j]),
+            return_sigma=return_sigma,
+        )
 
         # If the estimate failed, we use np.nan to maintain the gap
         if z == -999.0:
-            row_results.append((x, y, np.nan, np.nan))
-        else:
-            row_results.append((x, y, z, s))
+            z, s = np.nan, np.nan
+        row_results.append((x, y, z, s) if return_sigma else (x, y, z))
+    return row_results
+
+def _process_row_block(
+    y, xi, kd_obj, zk_vec, dx, dy, nsub, return_sigma=True
+) -> list[tuple]:
+    """Processes a complete row of the grid with block Kriging
+
+    :param y: row Y value
+    :type y: float
+    :param xi: X values
+    :type xi: numpy.ndarray
+    :param kd_obj: Kdata object, None to use the one of the pool worker
+    :type kd_obj: Kdata
+    :param zk_vec: model parameters
+    :type zk_vec: list[float]
+    :param dx: cell size X
+    :type dx: float
+    :param dy: cell size Y
+    :type dy: float
+    :param nsub: quadrature points per cell side
+    :type nsub: int
+    :param return_sigma: also compute the errors, defaults to True
+    :type return_sigma: bool, optional
+    :return: estimated row, (x, y, z, sigma) or (x, y, z) if not return_sigma
+    :rtype: list[tuple]
+    """
+    kd_obj = _worker_kdata if kd_obj is None else kd_obj
+    neig, _, _, noct = kd_obj.query_neighbors(
+        xi, np.full(len(xi), y), kd_obj.nvec, workers=1
+    )
+    row_results = []
+    for j, x in enumerate(xi):
+        z, s = estimate_block_at(
+            kd_obj,
+            x,
+            y,
+            dx,
+            dy,
+            zk_vec,
+            nsub=nsub,
+            neighborhood=(neig[j], noct[j]),
+            return_sigma=return_sigma,
+        )
+
+        if z == -999.0:
+            z, s = np.nan, np.nan
+        row_results.append((x, y, z, s) if return_sigma else (x, y, z))
     return row_results
 
-def _process_chunk(xi_chunk, yi_chunk, kdata_obj, zk_vec):
+def _process_row_models(
+    y, xi, kd_obj, zks, return_sigma=True
+) -> tuple[np.ndarray, Optional[np.ndarray]]:
+    """Processes a complete row of the grid with several models at once
+
+    :param y: row Y value
+    :type y: float
+    :param xi: X values
+    :type xi: numpy.ndarray
+    :param kd_obj: Kdata object, None to use the one of the pool worker
+    :type kd_obj: Kdata
+    :param zks: vectors of model parameters
+    :type zks: list
+    :param return_sigma: also compute the errors, defaults to True
+    :type return_sigma: bool, optional
+    :return: estimated Z and errors (None if not return_sigma), shape (n_models, len(xi))
+    :rtype: tuple[np.ndarray, Optional[np.ndarray]]
+    """
+    kd_obj = _worker_kdata if kd_obj is None else kd_obj
+    return estimate_batch_models(
+        kd_obj, xi, np.full(len(xi), y), zks, return_sigma=return_sigma, workers=1
+    )
+
+def _process_row_ensemble(y, xi, kd_obj, zks, weights) -> np.ndarray:
+    """Processes a complete row of the grid with the model-averaged estimator
+
+    :param y: row Y value
+    :type y: float
+    :param xi: X values
+    :type xi: numpy.ndarray
+    :param kd_obj: Kdata object, None to use the one of the pool worker
+    :type kd_obj: Kdata
+    :param zks: vectors of model parameters
+    :type zks: list
+    :param weights: model weights (adding up to 1)
+    :type weights: numpy.ndarray
+    :return: weighted Z, pooled sigma and between-model spread, shape (3, len(xi))
+    :rtype: numpy.ndarray
+    """
+    z, s = _process_row_models(y, xi, kd_obj, zks)
+    w = weights[:, None]
+    z_mean = np.sum(w * z, axis=0)
+    spread = np.sqrt(np.sum(w * (z - z_mean) ** 2, axis=0))
+    sigma = np.sqrt(np.sum(w * s**2, axis=0))
+    return np.vstack((z_mean, sigma, spread))
+
+def _process_row_weights(y, xi, kd_obj, zk_vec) -> list:
+    """Processes a complete row of the grid keeping the kriging weights
+
+    :param y: row Y value
+    :type y: float
+    :param xi: X values
+    :type xi: numpy.ndarray
+    :param kd_obj: Kdata object, None to use the one of the pool worker
+    :type kd_obj: Kdata
+    :param zk_vec: model parameters
+    :type zk_vec: list[float]
+    :return: (neighbor indices, lambdas, sigma) for each node, None for failed nodes
+    :rtype: list
+    """
+    kd_obj = _worker_kdata if kd_obj is None else kd_obj
+    neig, _, _, noct = kd_obj.query_neighbors(
+        xi, np.full(len(xi), y), kd_obj.nvec, workers=1
+    )
+    return [
+        weights_at(kd_obj, x, y, zk=zk_vec, neighborhood=(neig[j], noct[j]))
+        for j, x in enumerate(xi)
+    ]
+
+def _process_chunk(xi_chunk, yi_chunk, kdata_obj, zk_vec, return_sigma=True):
     """
     Worker function to process a segment of the profile path.
+
+    `kdata_obj` can be None to use the Kdata object of the pool worker.
+    With `return_sigma=False` the points are (x, y, z) and the errors are not computed.
     """
+    kdata_obj = _worker_kdata if kdata_obj is None else kdata_obj
+    neig, _, _, noct = kdata_obj.query_neighbors(
+        xi_chunk, yi_chunk, kdata_obj.nvec, workers=1
+    )
     # This should call your kriging core for each pair in zip(xi_chunk, yi_chunk)
     results = []
-    for x, y in zip(xi_chunk, yi_chunk):
-        z, sigma = estimate_at(kdata_obj, x, y, zk_vec)
-        results.append([x, y, z, sigma])
+    for j, (x, y) in enumerate(zip(xi_chunk, yi_chunk)):
+        z, sigma = estimate_at(
+            kdata_obj,
+            x,
+            y,
+            zk_vec,
+            neighborhood=(neig[j], noct[j]),
+            return_sigma=return_sigma,
+        )
+        results.append([x, y, z, sigma] if return_sigma else [x, y, z])
     return results
 
+def count_octants(octr: np.ndarray) -> np.ndarray:
+    """Number of distinct octants in each row of an octant array.
+
+    :param octr: octants (0 to 7, -1 for missing neighbors), shape (M, n)
+    :type octr: np.ndarray
+    :return: populated octants per row, shape (M,)
+    :rtype: np.ndarray of ints
+    """
+    octr = np.sort(octr, axis=1)
+    # Missing neighbors (-1) sort first and are not an octant
+    return (
+        1
+        + np.count_nonzero(np.diff(octr, axis=1), axis=1)
+        - (octr[:, 0] < 0)
+    )
+
+
+def select_octant_balanced(
+    neig: np.ndarray, dis: np.ndarray, octr: np.ndarray, n: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Octant-balanced selection of `n` neighbors out of a larger candidate set.
+
+    The nearest `ceil(n/8)` candidates of every octant are taken first, then the
+    next `ceil(n/8)` of every octant and so on, by distance inside each level.
+    Fully vectorized over the rows.
+
+    :param neig: candidate indices sorted by distance, shape (M, K), K >= n
+    :type neig: np.ndarray
+    :param dis: candidate distances, shape (M, K)
+    :type dis: np.ndarray
+    :param octr: candidate octants, shape (M, K)
+    :type octr: np.ndarray
+    :param n: number of neighbors to select
+    :type n: int
+    :return: selected indices, distances and octants, shape (M, n)
+    :rtype: tuple[np.ndarray, np.ndarray, np.ndarray]
+    """
+    m, k = octr.shape
+    kper = -(-n // 8)
+
+    # Rank of each candidate inside its octant (candidates are sorted by distance)
+    order = np.argsort(octr, axis=1, kind="stable")
+    sorted_oct = np.take_along_axis(octr, order, axis=1)
+    pos = np.broadcast_to(np.arange(k), (m, k))
+    starts = np.where(np.diff(sorted_oct, axis=1, prepend=-1) != 0, pos, 0)
+    rank = np.empty_like(octr)
+    np.put_along_axis(rank, order, pos - np.maximum.accumulate(starts, axis=1), axis=1)
+    # Missing candidates (octant -1, beyond max_radius) go last
+    rank[octr < 0] = k
+
+    sel = np.lexsort((dis, rank // kper), axis=-1)[:, :n]
+    return (
+        np.take_along_axis(neig, sel, axis=1),
+        np.take_along_axis(dis, sel, axis=1),
+        np.take_along_axis(octr, sel, axis=1),
+    )
+
+
 def get_octants(ax: np.ndarray, ay: np.ndarray) -> np.ndarray:
     """Determine the octant (0 to 7) for given 2D vectors (ax, ay).
 
@@ -276,9 +516,9 @@ def assemble_kriging_system(
     dim = n_neighbors + n_monomials
 
     # Extract neighbors' coordinates
-    x_n = data_obj.x[neighbor_indices]
-    y_n = data_obj.y[neighbor_indices]
-    coords_n = np.column_stack((x_n, y_n))
+    coords_n = data_obj.xyz[neighbor_indices, :2]
+    x_n = coords_n[:, 0]
+    y_n = coords_n[:, 1]
 
     # 1. Build a Covariance Block (Neighbor Matrix)
     # We use pdist to calculate all mutual distances at once
@@ -333,14 +573,19 @@ def assemble_kriging_system(
     return A, b
 
 
-def estimate_at(
+def weights_at(
     data_obj: "Kdata",
     ax: float,
     ay: float,
     zk: list[float] = None,
     min_octants: int = 4,
-) -> tuple[float, float]:
-    """Performs Kriging estimation on a coordinate (ax, ay).
+    neighborhood: tuple = None,
+    return_sigma: bool = True,
+) -> Optional[tuple[np.ndarray, np.ndarray, float]]:
+    """Computes the Kriging weights (lambdas) of a coordinate (ax, ay).
+
+    The weights only depend on the data locations, `nvec`, `nork` and the
+    model `zk`, not on the Z values, so they can be reused for new Z readings.
 
     :param data_obj: Kdata object
     :type data_obj: "Kdata"
@@ -352,20 +597,27 @@ def estimate_at(
     :type zk: list[float], optional
     :param min_octants: minimum number of occupied octants by nvec, defaults to 4
     :type min_octants: int, optional
-    :return: estimated Z and error
-    :rtype: tuple[float, float]
+    :param neighborhood: precomputed (indices, octant_count) from `Kdata.query_neighbors()`, defaults to None
+    :type neighborhood: tuple, optional
+    :param return_sigma: also compute the error, defaults to True
+    :type return_sigma: bool, optional
+    :return: neighbor indices, lambdas and error (None if not return_sigma), or None if the estimation fails
+    :rtype: Optional[tuple[np.ndarray, np.ndarray, float]]
     """
 
     # 1. Finding neighbors using your findneig method
     # trim=False because we are estimating at a new point (outside the data)
     nvec = data_obj.nvec
     nork = data_obj.nork
-    neig, dists, octs, noct = data_obj.findneig(ax, ay, nvec, trim=False)
+    if neighborhood is None:
+        neig, dists, octs, noct = data_obj.findneig(ax, ay, nvec, trim=False)
+    else:
+        neig, noct = neighborhood
+        neig = neig[neig >= 0]  # Drop the neighbors beyond max_radius
 
     # 2. Quality control: Is there sufficient angular coverage?
     if noct < min_octants:
-        # If there are not enough octants, we return a null value (e.g., -999)
-        return -999.0, 0.0
+        return None
 
     # 3. Assemble the system A * x = b
     A, b = assemble_kriging_system((ax, ay), neig, data_obj, zk=zk, order=nork)
@@ -375,21 +627,415 @@ def estimate_at(
     success, weights = solve_linear_system(A, b)
 
     if not success:
-        return -999.0, 0.0
+        return None
 
-    # 5. Calculate the Z* estimate = Sum(weights_i * Z_i)
-    # We only use the first 'nvec' weights (the lambdas)
-    lambdas = weights[: len(neig)]
-    z_neighbors = data_obj.z[neig]
-    z_estim = np.sum(lambdas * z_neighbors)
+    if not return_sigma:
+        return neig, weights[: len(neig)], None
 
-    # 6. Calculate the error variance: sigma^2 = Sum(weights * b)
+    # 5. Calculate the error variance: sigma^2 = Sum(weights * b)
     # In Universal Kriging, the variance is the dot product of weights and b
     sigma_sq = np.dot(weights, b)
 
+    # We only use the first 'nvec' weights (the lambdas)
+    return neig, weights[: len(neig)], np.sqrt(max(0, sigma_sq))
+
+
+def estimate_at(
+    data_obj: "Kdata",
+    ax: float,
+    ay: float,
+    zk: list[float] = None,
+    min_octants: int = 4,
+    neighborhood: tuple = None,
+    return_sigma: bool = True,
+) -> tuple[float, float]:
+    """Performs Kriging estimation on a coordinate (ax, ay).
+
+    :param data_obj: Kdata object
+    :type data_obj: "Kdata"
+    :param ax: point X coordinate
+    :type ax: float
+    :param ay: point Y coordinate
+    :type ay: float
+    :param zk: Vector of 5 parameters. If None, a linear structure (GIK) is used, defaults to None
+    :type zk: list[float], optional
+    :param min_octants: minimum number of occupied octants by nvec, defaults to 4
+    :type min_octants: int, optional
+    :param neighborhood: precomputed (indices, octant_count) from `Kdata.query_neighbors()`, defaults to None
+    :type neighborhood: tuple, optional
+    :param return_sigma: also compute the error, defaults to True
+    :type return_sigma: bool, optional
+    :return: estimated Z and error (None if not return_sigma)
+    :rtype: tuple[float, float]
+    """
+    res = weights_at(
+        data_obj,
+        ax,
+        ay,
+        zk=zk,
+        min_octants=min_octants,
+        neighborhood=neighborhood,
+        return_sigma=return_sigma,
+    )
+
+    if res is None:
+        # If there are not enough octants, we return a null value (e.g., -999)
+        return -999.0, 0.0 if return_sigma else None
+
+    # Calculate the Z* estimate = Sum(weights_i * Z_i)
+    neig, lambdas, sigma = res
+    z_estim = np.sum(lambdas * data_obj.xyz[neig, 2])
+
+    return z_estim, sigma
+
+
+def estimate_block_at(
+    data_obj: "Kdata",
+    ax: float,
+    ay: float,
+    dx: float,
+    dy: float,
+    zk: list[float],
+    nsub: int = 3,
+    min_octants: int = 4,
+    neighborhood: tuple = None,
+    return_sigma: bool = True,
+) -> tuple[float, float]:
+    """Performs block Kriging of the cell of size (dx, dy) centered at (ax, ay).
+
+    The covariance between the neighbors and the cell is the average over
+    a `nsub` x `nsub` midpoint quadrature of the cell, so the neighborhood and
+    the matrix A are shared by all the sub-points and the cost stays close to
+    point Kriging. With `nsub=1` the result equals `estimate_at()`.
+
+    :param data_obj: Kdata object
+    :type data_obj: "Kdata"
+    :param ax: cell center X coordinate
+    :type ax: float
+    :param ay: cell center Y coordinate
+    :type ay: float
+    :param dx: cell size X
+    :type dx: float
+    :param dy: cell size Y
+    :type dy: float
+    :param zk: Vector of model five parameters
+    :type zk: list[float]
+    :param nsub: quadrature points per cell side, defaults to 3
+    :type nsub: int, optional
+    :param min_octants: minimum number of occupied octants by nvec, defaults to 4
+    :type min_octants: int, optional
+    :param neighborhood: precomputed (indices, octant_count) from `Kdata.query_neighbors()`, defaults to None
+    :type neighborhood: tuple, optional
+    :param return_sigma: also compute the block error, defaults to True
+    :type return_sigma: bool, optional
+    :return: estimated cell mean and block error (None if not return_sigma)
+    :rtype: tuple[float, float]
+    """
+    nork = data_obj.nork
+    failed = (-999.0, 0.0 if return_sigma else None)
+    if neighborhood is None:
+        neig, dists, octs, noct = data_obj.findneig(
+            ax, ay, data_obj.nvec, trim=False
+        )
+    else:
+        neig, noct = neighborhood
+        neig = neig[neig >= 0]  # Drop the neighbors beyond max_radius
+
+    if noct < min_octants:
+        return failed
+
+    # Matrix A only depends on the neighbors
+    A, b = assemble_kriging_system((ax, ay), neig, data_obj, zk=zk, order=nork)
+    n_neighbors = len(neig)
+
+    # Quadrature points of the cell
+    offsets = (np.arange(nsub) + 0.5) / nsub - 0.5
+    sx, sy = np.meshgrid(ax + offsets * dx, ay + offsets * dy)
+    sx = sx.ravel()
+    sy = sy.ravel()
+
+    # Block-averaged right side: covariances and monomials
+    scale = data_obj.scale
+    xyz_n = data_obj.xyz[neig]
+    x_n = xyz_n[:, 0]
+    y_n = xyz_n[:, 1]
+    d_sub = (
+        np.sqrt((x_n[:, None] - sx[None, :]) ** 2 + (y_n[:, None] - sy[None, :]) ** 2)
+        / scale
+    )
+    b[:n_neighbors] = get_generalized_covariance(d_sub, zk).mean(axis=1)
+    for i in range(len(b) - n_neighbors):
+        b[n_neighbors + i] = -np.mean(get_drift_monomial(sx, sy, i))
+
+    success, weights = solve_linear_system(A, b)
+
+    if not success:
+        return failed
+
+    lambdas = weights[:n_neighbors]
+    z_estim = np.sum(lambdas * xyz_n[:, 2])
+    if not return_sigma:
+        return z_estim, None
+
+    # Block variance: the point variance omits K(0), the block one uses the
+    # mean covariance inside the cell instead
+    d_block = squareform(pdist(np.column_stack((sx, sy)))) / scale
+    block_term = get_generalized_covariance(0.0, zk) - np.mean(
+        get_generalized_covariance(d_block, zk)
+    )
+    sigma_sq = np.dot(weights, b) + block_term
+
     return z_estim, np.sqrt(max(0, sigma_sq))
 
 
+def kriging_batch_geometry(
+    xt: np.ndarray,
+    yt: np.ndarray,
+    neig: np.ndarray,
+    data_obj: "Kdata",
+    order: int = 1,
+) -> tuple:
+    """Model-independent part of the stacked Kriging systems of M target points:
+    the scaled distances and the drift blocks, shared by all the `zk` models.
+
+    :param xt: targets X coordinates, shape (M,)
+    :type xt: np.ndarray
+    :param yt: targets Y coordinates, shape (M,)
+    :type yt: np.ndarray
+    :param neig: neighbor indices of each target, shape (M, n), -1 for missing neighbors
+    :type neig: np.ndarray
+    :param data_obj: The Kdata instance
+    :type data_obj: "Kdata"
+    :param order: Drift order (0: constant, 1: linear, 2: quadratic), defaults to 1
+    :type order: int, optional
+    :return: neighbor distances (M, n, n), target distances (M, n), drift
+        blocks of A (M, n, n_monomials) and b (M, n_monomials), missing neighbors (M, n)
+    :rtype: tuple
+    """
+    n_monomials = [1, 3, 6][order]
+    xyz = data_obj.xyz
+    x_n = xyz[neig, 0]
+    y_n = xyz[neig, 1]
+    scale = data_obj.scale
+
+    dist_matrix = (
+        np.sqrt(
+            (x_n[:, :, None] - x_n[:, None, :]) ** 2
+            + (y_n[:, :, None] - y_n[:, None, :]) ** 2
+        )
+        / scale
+    )
+    d_target = np.sqrt((x_n - xt[:, None]) ** 2 + (y_n - yt[:, None]) ** 2) / scale
+    mono_n = np.stack(
+        [get_drift_monomial(x_n, y_n, i) for i in range(n_monomials)], axis=-1
+    )
+    mono_t = np.stack(
+        [get_drift_monomial(xt, yt, i) for i in range(n_monomials)], axis=-1
+    )
+    return dist_matrix, d_target, mono_n, mono_t, neig < 0
+
+
+def assemble_kriging_batch(
+    xt: np.ndarray,
+    yt: np.ndarray,
+    neig: np.ndarray,
+    data_obj: "Kdata",
+    zk: list = None,
+    order: int = 1,
+    geometry: tuple = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Stacked version of `assemble_kriging_system` for M target points.
+
+    :param xt: targets X coordinates, shape (M,)
+    :type xt: np.ndarray
+    :param yt: targets Y coordinates, shape (M,)
+    :type yt: np.ndarray
+    :param neig: neighbor indices of each target, shape (M, n), -1 for missing neighbors
+    :type neig: np.ndarray
+    :param data_obj: The Kdata instance
+    :type data_obj: "Kdata"
+    :param zk: Vector of 5 parameters. If None, a linear structure (GIK) is used, defaults to None
+    :type zk: list[float], optional
+    :param order: Drift order (0: constant, 1: linear, 2: quadratic), defaults to 1
+    :type order: int, optional
+    :param geometry: precomputed `kriging_batch_geometry()` to reuse with several models, defaults to None
+    :type geometry: tuple, optional
+    :return: matrices A, shape (M, dim, dim), and vectors b, shape (M, dim)
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    if geometry is None:
+        geometry = kriging_batch_geometry(xt, yt, neig, data_obj, order=order)
+    dist_matrix, d_target, mono_n, mono_t, pad = geometry
+    m, n_neighbors = neig.shape
+    n_monomials = mono_t.shape[1]
+    dim = n_neighbors + n_monomials
+
+    def cov(h):
+        if zk is None:
+            # GIK mode: gamma(h) = h
+            return get_generalized_covariance_1(h)
+        return get_generalized_covariance(h, zk)
+
+    # Covariance blocks of the neighbors
+    A = np.zeros((m, dim, dim))
+    A[:, :n_neighbors, :n_neighbors] = cov(dist_matrix)
+    A[:, :n_neighbors, :n_neighbors] += np.eye(n_neighbors) * 1e-6
+
+    # Drift blocks and right side
+    b = np.zeros((m, dim))
+    b[:, :n_neighbors] = cov(d_target)
+    A[:, n_neighbors:, :n_neighbors] = -mono_n.transpose(0, 2, 1)
+    A[:, :n_neighbors, n_neighbors:] = -mono_n
+    b[:, n_neighbors:] = -mono_t
+
+    # Missing neighbors (index -1, beyond max_radius): identity rows and
+    # columns with b = 0, so their weights are exactly zero
+    if pad.any():
+        A[:, :n_neighbors, :][pad] = 0.0
+        A.transpose(0, 2, 1)[:, :n_neighbors, :][pad] = 0.0
+        mi, ii = np.nonzero(pad)
+        A[mi, ii, ii] = 1.0
+        b[mi, ii] = 0.0
+
+    return A, b
+
+
+def estimate_batch_models(
+    data_obj: "Kdata",
+    xs: np.ndarray,
+    ys: np.ndarray,
+    zks: list,
+    return_sigma: bool = True,
+    min_octants: int = 4,
+    chunk_size: int = 4096,
+    workers: int = -1,
+) -> tuple[np.ndarray, Optional[np.ndarray]]:
+    """Vectorized Kriging of many points with several models at once (working units).
+
+    The neighborhoods, distances and drift blocks of each chunk are computed
+    once (`kriging_batch_geometry()`) and the systems of all the models are
+    stacked into a single batched solve, so K models cost far less than K
+    separate passes.
+
+    :param data_obj: Kdata object
+    :type data_obj: "Kdata"
+    :param xs: X coordinates
+    :type xs: np.ndarray
+    :param ys: Y coordinates
+    :type ys: np.ndarray
+    :param zks: K vectors of model five parameters
+    :type zks: list
+    :param return_sigma: also compute the errors, defaults to True
+    :type return_sigma: bool, optional
+    :param min_octants: minimum number of occupied octants by nvec, defaults to 4
+    :type min_octants: int, optional
+    :param chunk_size: systems per stacked solve (bounds memory), defaults to 4096
+    :type chunk_size: int, optional
+    :param workers: neighbor query threads, use 1 inside process pools, defaults to -1
+    :type workers: int, optional
+    :return: estimated Z and errors (None if not return_sigma), shape (K, M), NaN for failed points
+    :rtype: tuple[np.ndarray, Optional[np.ndarray]]
+    """
+    data_obj._sync_data()
+    xs = np.ravel(np.asarray(xs, dtype=np.float64))
+    ys = np.ravel(np.asarray(ys, dtype=np.float64))
+    n_models = len(zks)
+    z_out = np.full((n_models, len(xs)), np.nan)
+    s_out = np.full((n_models, len(xs)), np.nan) if return_sigma else None
+    z_data = data_obj.xyz[:, 2]
+    nork = data_obj.nork
+    step = max(1, chunk_size // n_models)
+
+    for start in range(0, len(xs), step):
+        sl = slice(start, start + step)
+        neig, _, _, noct = data_obj.query_neighbors(
+            xs[sl], ys[sl], data_obj.nvec, workers=workers
+        )
+        ok = np.flatnonzero(noct >= min_octants)
+        if len(ok) == 0:
+            continue
+        neig = neig[ok]
+        xt = xs[sl][ok]
+        yt = ys[sl][ok]
+
+        geometry = kriging_batch_geometry(xt, yt, neig, data_obj, order=nork)
+        systems = [
+            assemble_kriging_batch(
+                xt, yt, neig, data_obj, zk=zk, order=nork, geometry=geometry
+            )
+            for zk in zks
+        ]
+        A = np.concatenate([s[0] for s in systems])
+        b = np.concatenate([s[1] for s in systems])
+        try:
+            weights = np.linalg.solve(A, b[..., None])[..., 0]
+        except np.linalg.LinAlgError:
+            weights = np.einsum(
+                "mij,mj->mi", np.linalg.pinv(A, rcond=1e-15), b
+            )
+
+        m, n_neighbors = neig.shape
+        weights = weights.reshape(n_models, m, -1)
+        z_out[:, start + ok] = np.einsum(
+            "kmi,mi->km", weights[:, :, :n_neighbors], z_data[neig]
+        )
+        if return_sigma:
+            sigma_sq = np.einsum("kmi,kmi->km", weights, b.reshape(n_models, m, -1))
+            s_out[:, start + ok] = np.sqrt(np.maximum(0, sigma_sq))
+
+    return z_out, s_out
+
+
+def estimate_batch(
+    data_obj: "Kdata",
+    xs: np.ndarray,
+    ys: np.ndarray,
+    zk: list[float],
+    return_sigma: bool = True,
+    min_octants: int = 4,
+    chunk_size: int = 4096,
+    workers: int = -1,
+) -> tuple[np.ndarray, Optional[np.ndarray]]:
+    """Vectorized Kriging of many points (working units).
+
+    Neighborhoods come from one `Kdata.query_neighbors()` call per chunk and
+    the systems of each chunk are assembled and solved as a stack
+    (`np.linalg.solve`, falling back to a batched pseudo-inverse if any
+    system of the chunk is singular). Same results as `estimate_at()` up to
+    rounding. Single-model case of `estimate_batch_models()`.
+
+    :param data_obj: Kdata object
+    :type data_obj: "Kdata"
+    :param xs: X coordinates
+    :type xs: np.ndarray
+    :param ys: Y coordinates
+    :type ys: np.ndarray
+    :param zk: Vector of model five parameters
+    :type zk: list[float]
+    :param return_sigma: also compute the errors, defaults to True
+    :type return_sigma: bool, optional
+    :param min_octants: minimum number of occupied octants by nvec, defaults to 4
+    :type min_octants: int, optional
+    :param chunk_size: points per stacked solve (bounds memory), defaults to 4096
+    :type chunk_size: int, optional
+    :param workers: neighbor query threads, use 1 inside process pools, defaults to -1
+    :type workers: int, optional
+    :return: estimated Z and errors (None if not return_sigma), NaN for failed points
+    :rtype: tuple[np.ndarray, Optional[np.ndarray]]
+    """
+    z, s = estimate_batch_models(
+        data_obj,
+        xs,
+        ys,
+        [zk],
+        return_sigma=return_sigma,
+        min_octants=min_octants,
+        chunk_size=chunk_size,
+        workers=workers,
+    )
+    return z[0], None if s is None else s[0]
+
+
 def generate_grid(
     data_obj: "Kdata",
     x_range: list,
@@ -468,8 +1114,11 @@ def fast_preview(
     Z_grid = np.zeros_like(X)
     S_grid = np.zeros_like(X)
 
-    # 2. Grid calculation
+    # 2. Grid calculation (all the neighborhoods in one multithreaded query)
     print(f"Interpolating {nx}x{ny} grid...")
+    neig, _, _, noct = kd_obj.query_neighbors(X, Y, kd_obj.nvec)
+    neig = neig.reshape(ny, nx, -1)
+    noct = noct.reshape(ny, nx)
     for i in range(ny):
         for j in range(nx):
             z, s = estimate_at(
@@ -477,6 +1126,7 @@ def fast_preview(
                 X[i, j],
                 Y[i, j],
                 zk=zk_vec,
+                neighborhood=(neig[i, j], noct[i, j]),
             )
             Z_grid[i, j] = z
             S_grid[i, j] = s
@@ -526,111 +1176,311 @@ def fast_preview(
 
 
 
-def cross_validation(
+def loo_cross_validation(
     kd_obj: "Kdata",
-    zk_vec: Union[list[float]],
-) -> tuple[list[float], list[float], list[float]]:
-    """Perform 'Leave-One-Out' Cross Validation of models
+    zks: list,
+    min_octants: int = 4,
+    chunk_size: int = 4096,
+) -> list[dict]:
+    """Single-pass 'Leave-One-Out' cross-validation of several models.
+
+    The leave-one-out neighborhoods (`Kdata.loo_neighbors()`), distances and
+    drift blocks are computed once and the systems of all the models are
+    solved as one stack, as in `estimate_batch_models()`.
+
+    Each result holds, for the validated points: `index` (data point),
+    `actual`, `predicted`, `residual` (actual - predicted), `sigma` (Kriging
+    error), `zscore` (residual / sigma, NaN if sigma is 0), `nneig` (number of
+    neighbors) and `noct` (occupied octants).
 
     :param kd_obj: Kdata object
     :type kd_obj: Kdata
-    :param zk_vec: Vector of model five parameters
-    :type zk_vec: Union[list[float]]
-    :return: _description_
-    :rtype: tuple[list[float], list[float], list[float]]
+    :param zks: K vectors of model five parameters
+    :type zks: list
+    :param min_octants: minimum number of occupied octants by nvec, defaults to 4
+    :type min_octants: int, optional
+    :param chunk_size: systems per stacked solve (bounds memory), defaults to 4096
+    :type chunk_size: int, optional
+    :return: one dict of arrays per model
+    :rtype: list[dict]
     """
-    nvec = kd_obj.nvec
     nork = kd_obj.nork
-    n_points = len(kd_obj.x)
-    actual = []
-    predicted = []
-    errors = []
-    sigmas = []
+    loo_neig, loo_noct = kd_obj.loo_neighbors()  # Also syncs the data
+    xyz = kd_obj.xyz
+    z = xyz[:, 2]
+    n_models = len(zks)
+    nneig = np.sum(loo_neig >= 0, axis=1)
+    ok = np.flatnonzero(loo_noct >= min_octants)
+    pred = np.full((n_models, len(ok)), np.nan)
+    sigma = np.full((n_models, len(ok)), np.nan)
+    step = max(1, chunk_size // max(1, n_models))
+
+    for start in range(0, len(ok), step):
+        idx = ok[start : start + step]
+        neig = loo_neig[idx]
+        xt = xyz[idx, 0]
+        yt = xyz[idx, 1]
+
+        geometry = kriging_batch_geometry(xt, yt, neig, kd_obj, order=nork)
+        systems = [
+            assemble_kriging_batch(
+                xt, yt, neig, kd_obj, zk=zk, order=nork, geometry=geometry
+            )
+            for zk in zks
+        ]
+        A = np.concatenate([s[0] for s in systems])
+        b = np.concatenate([s[1] for s in systems])
+        try:
+            weights = np.linalg.solve(A, b[..., None])[..., 0]
+        except np.linalg.LinAlgError:
+            weights = np.einsum("mij,mj->mi", np.linalg.pinv(A, rcond=1e-15), b)
+
+        m, n_neighbors = neig.shape
+        weights = weights.reshape(n_models, m, -1)
+        sl = slice(start, start + m)
+        pred[:, sl] = np.einsum("kmi,mi->km", weights[:, :, :n_neighbors], z[neig])
+        sigma_sq = np.einsum("kmi,kmi->km", weights, b.reshape(n_models, m, -1))
+        sigma[:, sl] = np.sqrt(np.maximum(0, sigma_sq))
 
-    tqdm.write(f"Starting Cross-Validation in {n_points} points...")
+    results = []
+    for k in range(n_models):
+        valid = np.isfinite(pred[k])
+        idx = ok[valid]
+        residual = z[idx] - pred[k, valid]
+        s_k = sigma[k, valid]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            zscore = np.where(s_k > 0, residual / s_k, np.nan)
+        results.append(
+            {
+                "index": idx,
+                "actual": z[idx].copy(),
+                "predicted": pred[k, valid],
+                "residual": residual,
+                "sigma": s_k,
+                "zscore": zscore,
+                "nneig": nneig[idx],
+                "noct": loo_noct[idx],
+            }
+        )
+    return results
 
-    for i in range(n_points):
-        tx, ty, tz = kd_obj.x[i], kd_obj.y[i], kd_obj.z[i]
 
-        # IMPORTANT: Set trim=True to prevent itself from being used as a neighbor
-        neig, dists, octs, noct = kd_obj.findneig(tx, ty, nvec, trim=True)
+def cv_metrics(cv: dict) -> tuple[float, float, float]:
+    """MAE, RMSE and correlation of a `loo_cross_validation()` result.
 
-        if noct >= 4:  # Minimum coverage
-            A, b = assemble_kriging_system(
-                (tx, ty), neig, kd_obj, zk=zk_vec, order=nork
-            )
-            success, weights = solve_linear_system(A, b)
+    :param cv: cross-validation result of one model
+    :type cv: dict
+    :return: MAE, RMSE and correlation coefficient
+    :rtype: tuple[float, float, float]
+    """
+    residual = cv["residual"]
+    mae = np.mean(np.abs(residual))
+    rmse = np.sqrt(np.mean(residual**2))
+    corr = np.corrcoef(cv["actual"], cv["predicted"])[0, 1]
+    return float(mae), float(rmse), float(corr)
+
+
+def cv_zscore_stats(cv: dict) -> tuple[float, float]:
+    """Mean and standard deviation of the standardized errors of a
+    `loo_cross_validation()` result.
+
+    :param cv: cross-validation result of one model
+    :type cv: dict
+    :return: mean and standard deviation, NaN if no point has a finite z-score
+    :rtype: tuple[float, float]
+    """
+    zscore = cv["zscore"][np.isfinite(cv["zscore"])]
+    if len(zscore) == 0:
+        return np.nan, np.nan
+    return float(zscore.mean()), float(zscore.std())
 
-            if success:
-                lambdas = weights[: len(neig)]
-                z_est = np.sum(lambdas * kd_obj.z[neig])
-                s2 = np.dot(weights, b)
 
-                actual.append(tz)
-                predicted.append(z_est)
-                errors.append(tz - z_est)
-                sigmas.append(np.sqrt(max(0, s2)))
+def print_cv_summary(cv: dict, n_points: int):
+    """Print the summary of a `loo_cross_validation()` result.
 
-    # Basic Statistics
-    mae = np.mean(np.abs(errors))
-    rmse = np.sqrt(np.mean(np.array(errors) ** 2))
-    correlation = np.corrcoef(actual, predicted)[0, 1]
+    The standardized errors (residual / sigma) should have a mean close to 0
+    and a standard deviation close to 1 if the model errors are realistic.
 
+    :param cv: cross-validation result of one model
+    :type cv: dict
+    :param n_points: total number of data points
+    :type n_points: int
+    """
+    mae, rmse, correlation = cv_metrics(cv)
     tqdm.write("\n--- CROSS-VALIDATION SUMMARY ---")
-    tqdm.write(f"Validated points: {len(actual)} / {n_points}")
+    tqdm.write(f"Validated points: {len(cv['actual'])} / {n_points}")
     tqdm.write(f"Mean Absolute Error (MAE): {mae:.4f}")
     tqdm.write(f"Root Mean Square Error (RMSE): {rmse:.4f}")
     tqdm.write(f"Correlation Coefficient: {correlation:.4f}")
+    zs_mean, zs_std = cv_zscore_stats(cv)
+    tqdm.write(f"Mean Standardized Error: {zs_mean:.4f}")
+    tqdm.write(f"Std. of Standardized Errors: {zs_std:.4f}")
 
-    return actual, predicted, errors
 
-
-def cross_validation_silent(
+def cross_validation(
     kd_obj: "Kdata",
     zk_vec: Union[list[float]],
-) -> tuple[list[float], list[float], list[float]]:
-    """Performs silent 'Leave-One-Out' cross-validation.
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Perform 'Leave-One-Out' Cross Validation of models
 
     :param kd_obj: Kdata object
     :type kd_obj: Kdata
     :param zk_vec: Vector of model five parameters
     :type zk_vec: Union[list[float]]
-    :return: _description_
-    :rtype: tuple[list[float], list[float], list[float]]
+    :return: actual values, predicted values and errors of the validated points
+    :rtype: tuple[np.ndarray, np.ndarray, np.ndarray]
     """
-    nvec = kd_obj.nvec
-    nork = kd_obj.nork
-    n_points = len(kd_obj.x)
-    actual = np.zeros(n_points)
-    predicted = np.zeros(n_points)
-    errors = np.zeros(n_points)
-    # sigmas = []
-    valid_idx = 0
-
-    for i in range(n_points):
-        tx, ty, tz = kd_obj.x[i], kd_obj.y[i], kd_obj.z[i]
+    n_points = len(kd_obj.xyz)
+    tqdm.write(f"Starting Cross-Validation in {n_points} points...")
+    cv = loo_cross_validation(kd_obj, [zk_vec])[0]
+    print_cv_summary(cv, n_points)
 
-        # IMPORTANT: Set trim=True to prevent itself from being used as a neighbor
-        neig, dists, octs, noct = kd_obj.findneig(tx, ty, nvec, trim=True)
+    return cv["actual"], cv["predicted"], cv["residual"]
 
-        if noct >= 4:  # Minimal coverage
-            A, b = assemble_kriging_system(
-                (tx, ty), neig, kd_obj, zk=zk_vec, order=nork
-            )
-            success, weights = solve_linear_system(A, b)
 
-            if success:
-                lambdas = weights[: len(neig)]
-                z_est = np.sum(lambdas * kd_obj.z[neig])
-                # s2 = np.dot(weights, b)
+def cross_validation_silent(
+    kd_obj: "Kdata",
+    zk_vec: Union[list[float]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Performs silent 'Leave-One-Out' cross-validation.
 
-                actual[valid_idx] = tz
-                predicted[valid_idx] = z_est
-                errors[valid_idx] = tz - z_est
-                valid_idx += 1
-                # sigmas.append(np.sqrt(max(0, s2)))
+    :param kd_obj: Kdata object
+    :type kd_obj: Kdata
+    :param zk_vec: Vector of model five parameters
+    :type zk_vec: Union[list[float]]
+    :return: actual values, predicted values and errors of the validated points
+    :rtype: tuple[np.ndarray, np.ndarray, np.ndarray]
+    """
+    cv = loo_cross_validation(kd_obj, [zk_vec])[0]
+    return cv["actual"], cv["predicted"], cv["residual"]
+
+
+def build_grid_mask(
+    xi: np.ndarray,
+    yi: np.ndarray,
+    mask,
+    data_xy: np.ndarray = None,
+    buffer: float = 0.0,
+    alpha: float = None,
+    chunk_rows: int = 256,
+) -> np.ndarray:
+    """
+    Boolean mask of the grid nodes to estimate (True inside).
+
+    `mask` can be a list of (x, y) polygon vertices, "hull" (convex hull of
+    the data), "concave" (alpha shape of the data: Delaunay triangles whose
+    longest edge is <= `alpha`) or a boolean raster of shape (ny, nx).
+    All distances are in the units of `xi` and `yi`.
+
+    :param xi: grid X values (nx)
+    :type xi: np.ndarray
+    :param yi: grid Y values (ny)
+    :type yi: np.ndarray
+    :param mask: polygon vertices, "hull", "concave" or boolean raster
+    :type mask: Union[list, str, np.ndarray]
+    :param data_xy: (N, 2) data coordinates for "hull" and "concave", defaults to None
+    :type data_xy: np.ndarray, optional
+    :param buffer: grow the masked area by this distance, defaults to 0.0
+    :type buffer: float, optional
+    :param alpha: maximum triangle edge of the "concave" hull, defaults to None
+        (3 times the median edge of the triangulation)
+    :type alpha: float, optional
+    :param chunk_rows: grid rows tested per block, defaults to 256
+    :type chunk_rows: int, optional
+    :raises ValueError: unknown mask type or raster shape not matching the grid
+    :return: mask (ny, nx)
+    :rtype: np.ndarray
+    """
+    from matplotlib.path import Path
+    from scipy.spatial import Delaunay
+
+    nx, ny = len(xi), len(yi)
+
+    if isinstance(mask, np.ndarray) and mask.dtype == bool:
+        if mask.shape != (ny, nx):
+            raise ValueError(f"Mask raster must have shape {(ny, nx)}, got {mask.shape}.")
+        grid = mask.copy()
+    else:
+        if isinstance(mask, str):
+            if mask not in ("hull", "concave"):
+                raise ValueError('Mask must be a polygon, "hull", "concave" or a boolean raster.')
+            tri = Delaunay(data_xy)
+            keep = np.ones(len(tri.simplices) + 1, dtype=bool)
+            keep[-1] = False  # find_simplex returns -1 outside the hull
+            if mask == "concave":
+                p = tri.points[tri.simplices]
+                edges = np.linalg.norm(p - np.roll(p, 1, axis=1), axis=2).max(axis=1)
+                if alpha is None:
+                    alpha = 3 * np.median(edges)
+                keep[:-1] = edges <= alpha
+
+            def inside(pts):
+                return keep[tri.find_simplex(pts)]
+
+        else:
+            path = Path(np.asarray(mask, dtype=float))
+
+            def inside(pts):
+                return path.contains_points(pts)
+
+        grid = np.empty((ny, nx), dtype=bool)
+        for j0 in range(0, ny, chunk_rows):
+            j1 = min(j0 + chunk_rows, ny)
+            pts = np.column_stack((np.tile(xi, j1 - j0), np.repeat(yi[j0:j1], nx)))
+            grid[j0:j1] = inside(pts).reshape(j1 - j0, nx)
+
+    if buffer > 0 and grid.any():
+        from scipy.ndimage import distance_transform_edt
+
+        dx = (xi[-1] - xi[0]) / max(nx - 1, 1) or 1.0
+        dy = (yi[-1] - yi[0]) / max(ny - 1, 1) or 1.0
+        grid = distance_transform_edt(~grid, sampling=(dy, dx)) <= buffer
+
+    return grid
 
-    return actual[:valid_idx], predicted[:valid_idx], errors[:valid_idx]
+
+def _grid_mask(
+    kg_obj: "Kgrid", xi: np.ndarray, yi: np.ndarray, chunk_rows: int = 256
+) -> Optional[np.ndarray]:
+    """
+    Internal function returning the nodes to estimate: the Kgrid mask, checked
+    against the grid size and, with `Kdata.max_radius`, reduced to the nodes
+    with at least 4 data points within that distance (a vectorized pre-screen
+    of the nodes that can not reach 4 populated octants).
+
+    :param kg_obj: Kgrid object
+    :type kg_obj: Kgrid
+    :param xi: grid X values
+    :type xi: np.ndarray
+    :param yi: grid Y values
+    :type yi: np.ndarray
+    :param chunk_rows: grid rows screened per query, defaults to 256
+    :type chunk_rows: int, optional
+    :raises ValueError: the mask does not match the grid size
+    :return: mask (res_y, res_x) or None
+    :rtype: Optional[np.ndarray]
+    """
+    res_x, res_y = len(xi), len(yi)
+    mask = kg_obj.mask
+    if mask is not None and mask.shape != (res_y, res_x):
+        raise ValueError("The grid size changed, call Kgrid.set_mask() again.")
+
+    kd = kg_obj.kdata
+    if kd.max_radius:
+        if kd.kdtree is None:
+            kd.init_neig()
+        kd._sync_data()
+        screen = np.empty((res_y, res_x), dtype=bool)
+        for j0 in range(0, res_y, chunk_rows):
+            j1 = min(j0 + chunk_rows, res_y)
+            pts = np.column_stack((np.tile(xi, j1 - j0), np.repeat(yi[j0:j1], res_x)))
+            counts = kd.kdtree.query_ball_point(
+                pts, kd.search_radius(), return_length=True, workers=-1
+            )
+            screen[j0:j1] = (counts >= 4).reshape(j1 - j0, res_x)
+        print(f"max_radius: {int((~screen).sum())} nodes without neighborhood skipped.")
+        mask = screen if mask is None else mask & screen
+    return mask
 
 
 def export_grid(
@@ -639,10 +1489,16 @@ def export_grid(
     filename: str = "RESULT",
     res_x: int = 100,
     res_y: int = 100,
+    nsub: int = None,
+    pyramid: bool = False,
+    return_sigma: bool = True,
 ):
     """
     Generate a grid and export it to a CSV file (X, Y, Z, Sigma). Multithreaded version.
 
+    With `return_sigma=False` the error variances are not computed and the
+    file only has the X, Y and Z_ESTIM columns.
+
     :param kg_obj: Kgrid object
     :type kg_obj: Kgrid
     :param zk_vec: Vector of model five parameters
@@ -653,9 +1509,14 @@ def export_grid(
     :type res_x: int, optional
     :param res_y: grid size Y, defaults to 100
     :type res_y: int, optional
+    :param nsub: if given, block Kriging of the grid cells with nsub x nsub
+        quadrature points instead of point Kriging, defaults to None
+    :type nsub: int, optional
+    :param pyramid: also write a decimated overview pyramid (`.ovr`), defaults to False
+    :type pyramid: bool, optional
+    :param return_sigma: compute and write the SIGMA column, defaults to True
+    :type return_sigma: bool, optional
     """
-    from pygeko.__about__ import __version__ as pygeko_version
-
     x_min, x_max = kg_obj.xmin, kg_obj.xmax
     y_min, y_max = kg_obj.ymin, kg_obj.ymax
 
@@ -663,48 +1524,333 @@ def export_grid(
     yi = np.linspace(y_min, y_max, res_y)
 
     filename1 = filename + ".grd"
-    filename2 = filename + ".hdr"
     print(f"Exporting {res_x}x{res_y} grid in parallel to {filename1}...")
 
-    # We use ProcessPoolExecutor to distribute the rows among the cores
-    all_results = []
+    # Masked nodes are skipped: only the active nodes of each row are sent
+    mask = _grid_mask(kg_obj, xi, yi)
+    rows = np.arange(res_y) if mask is None else np.flatnonzero(mask.any(axis=1))
+    cols = [xi if mask is None else xi[mask[j]] for j in rows]
+
+    # Row worker and its arguments: point or block Kriging
+    n = len(rows)
+    if nsub:
+        # Cells centered at the grid nodes
+        dx = (x_max - x_min) / max(res_x - 1, 1)
+        dy = (y_max - y_min) / max(res_y - 1, 1)
+        worker = _process_row_block
+        args = (yi[rows], cols, [None]*n, [zk_vec]*n, [dx]*n, [dy]*n, [nsub]*n)
+        extra_meta = {"block": f"{nsub}x{nsub}"}
+    else:
+        worker = _process_row
+        args = (yi[rows], cols, [None]*n, [zk_vec]*n)
+        extra_meta = {}
+    args += ([return_sigma] * n,)
+    if not return_sigma:
+        extra_meta["sigma"] = False
+    if mask is not None:
+        extra_meta["mask"] = f"{int(mask.sum())}/{res_x * res_y} nodes"
+
+    # Z and SIGMA are stored with the Kgrid dtype as the rows arrive, the
+    # systems are always solved in float64
+    dtype = np.dtype(getattr(kg_obj, "dtype", np.float64))
+    Z = np.full((res_y, res_x), np.nan, dtype=dtype)
+    S = np.full((res_y, res_x), np.nan, dtype=dtype) if return_sigma else None
+
+    # We use ProcessPoolExecutor to distribute the rows among the cores,
+    # the workers receive the Kdata object only once
     # with ProcessPoolExecutor(max_workers=3 if rpi5 else all) as executor:
-    with ProcessPoolExecutor(max_workers=get_optimal_workers()) as executor:
+    with kriging_pool(kg_obj.kdata) as executor:
         # executor.map returns the results in order
-        results_generator = list(tqdm(
-            executor.map(_process_row, yi, [xi]*len(yi), [kg_obj.kdata]*len(yi), [zk_vec]*len(yi)),
-            total=len(yi),
-            desc="Kriging"
-        ))
-        
-        # Unimos las listas de cada fila
-        all_results = [item for sublist in results_generator for item in sublist]
+        for j, row in zip(
+            rows, tqdm(executor.map(worker, *args), total=n, desc="Kriging")
+        ):
+            row = np.asarray(row, dtype=np.float64)
+            sel = slice(None) if mask is None else mask[j]
+            Z[j, sel] = row[:, 2]
+            if return_sigma:
+                S[j, sel] = row[:, 3]
+
+    _write_grid(kg_obj, xi, yi, Z, S, zk_vec, filename, extra_meta, pyramid)
+
+
+def _krige_grid_rows(
+    kg_obj: "Kgrid", xi: np.ndarray, yi: np.ndarray, worker, args: tuple, n_layers: int
+) -> tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Internal function running a vectorized row worker over the grid rows in the
+    Kriging pool. Masked nodes are not sent and fully masked rows are skipped.
+
+    `worker(y, xs, None, *args)` must return arrays (or None) that stack into
+    (n_layers, len(xs)).
+
+    :param kg_obj: Kgrid object
+    :type kg_obj: Kgrid
+    :param xi: grid X values
+    :type xi: np.ndarray
+    :param yi: grid Y values
+    :type yi: np.ndarray
+    :param worker: row worker
+    :type worker: callable
+    :param args: additional worker arguments, the same for every row
+    :type args: tuple
+    :param n_layers: number of output layers
+    :type n_layers: int
+    :return: layers (n_layers, res_y, res_x) with the Kgrid dtype, NaN for
+        masked or failed nodes, and the mask (or None)
+    :rtype: tuple[np.ndarray, Optional[np.ndarray]]
+    """
+    res_x, res_y = len(xi), len(yi)
+    mask = _grid_mask(kg_obj, xi, yi)
+    rows = np.arange(res_y) if mask is None else np.flatnonzero(mask.any(axis=1))
+    cols = [xi if mask is None else xi[mask[j]] for j in rows]
+    n = len(rows)
+
+    dtype = np.dtype(getattr(kg_obj, "dtype", np.float64))
+    layers = np.full((n_layers, res_y, res_x), np.nan, dtype=dtype)
+
+    with kriging_pool(kg_obj.kdata) as executor:
+        for j, res in zip(
+            rows,
+            tqdm(
+                executor.map(worker, yi[rows], cols, [None] * n, *[[a] * n for a in args]),
+                total=n,
+                desc="Kriging",
+            ),
+        ):
+            sel = slice(None) if mask is None else mask[j]
+            layers[:, j, sel] = np.concatenate(
+                [np.atleast_2d(a) for a in res if a is not None]
+            )
+    return layers, mask
+
+
+def export_grid_models(
+    kg_obj: "Kgrid",
+    models: list,
+    zks: list,
+    filenames: list,
+    res_x: int = 100,
+    res_y: int = 100,
+    pyramid: bool = False,
+    return_sigma: bool = True,
+):
+    """
+    Generate the grids of several models in a single pass and export one
+    `.grd` file per model. Multithreaded version.
+
+    Each row is kriged with `_process_row_models()`: the neighbor query,
+    distances and drift blocks are shared by all the models and their systems
+    are solved as one stack (`estimate_batch_models()`).
+
+    :param kg_obj: Kgrid object
+    :type kg_obj: Kgrid
+    :param models: model numbers (for the `.hdr` files)
+    :type models: list
+    :param zks: vectors of model five parameters, one per model
+    :type zks: list
+    :param filenames: filename bases, one per model
+    :type filenames: list
+    :param res_x: grid size X, defaults to 100
+    :type res_x: int, optional
+    :param res_y: grid size Y, defaults to 100
+    :type res_y: int, optional
+    :param pyramid: also write decimated overview pyramids (`.ovr`), defaults to False
+    :type pyramid: bool, optional
+    :param return_sigma: compute and write the SIGMA columns, defaults to True
+    :type return_sigma: bool, optional
+    """
+    xi = np.linspace(kg_obj.xmin, kg_obj.xmax, res_x)
+    yi = np.linspace(kg_obj.ymin, kg_obj.ymax, res_y)
+    n_models = len(zks)
+
+    print(f"Exporting {n_models} models of a {res_x}x{res_y} grid in parallel...")
+
+    layers, mask = _krige_grid_rows(
+        kg_obj,
+        xi,
+        yi,
+        _process_row_models,
+        (zks, return_sigma),
+        2 * n_models if return_sigma else n_models,
+    )
+    extra_meta = {"models": models}
+    if not return_sigma:
+        extra_meta["sigma"] = False
+    if mask is not None:
+        extra_meta["mask"] = f"{int(mask.sum())}/{res_x * res_y} nodes"
+
+    for k in range(n_models):
+        _write_grid(
+            kg_obj,
+            xi,
+            yi,
+            layers[k],
+            layers[n_models + k] if return_sigma else None,
+            zks[k],
+            filenames[k],
+            extra_meta,
+            pyramid,
+            model=models[k],
+        )
+
+
+def export_grid_ensemble(
+    kg_obj: "Kgrid",
+    models: list,
+    zks: list,
+    weights: np.ndarray,
+    filename: str,
+    res_x: int = 100,
+    res_y: int = 100,
+    pyramid: bool = False,
+):
+    """
+    Generate the model-averaged grid of several models in a single pass and
+    export it to a CSV file (X, Y, Z_ESTIM, SIGMA, SPREAD). Multithreaded version.
+
+    Z_ESTIM is the weighted mean of the model estimates, SPREAD their weighted
+    standard deviation (between-model spread) and SIGMA the pooled Kriging
+    error sqrt(sum(w * sigma^2)). The total uncertainty is sqrt(SIGMA^2 + SPREAD^2).
+
+    :param kg_obj: Kgrid object
+    :type kg_obj: Kgrid
+    :param models: model numbers (for the `.hdr` file)
+    :type models: list
+    :param zks: vectors of model five parameters, one per model
+    :type zks: list
+    :param weights: model weights, they must add up to 1
+    :type weights: np.ndarray
+    :param filename: filename base
+    :type filename: str
+    :param res_x: grid size X, defaults to 100
+    :type res_x: int, optional
+    :param res_y: grid size Y, defaults to 100
+    :type res_y: int, optional
+    :param pyramid: also write a decimated overview pyramid (`.ovr`), defaults to False
+    :type pyramid: bool, optional
+    """
+    xi = np.linspace(kg_obj.xmin, kg_obj.xmax, res_x)
+    yi = np.linspace(kg_obj.ymin, kg_obj.ymax, res_y)
+
+    print(f"Exporting ensemble of {len(zks)} models to {filename}.grd...")
+
+    layers, mask = _krige_grid_rows(
+        kg_obj, xi, yi, _process_row_ensemble, (zks, np.asarray(weights)), 3
+    )
+    extra_meta = {
+        "ensemble_models": list(models),
+        "ensemble_weights": [round(float(w), 4) for w in weights],
+    }
+    if mask is not None:
+        extra_meta["mask"] = f"{int(mask.sum())}/{res_x * res_y} nodes"
+
+    _write_grid(
+        kg_obj,
+        xi,
+        yi,
+        layers[0],
+        layers[1],
+        None,
+        filename,
+        extra_meta,
+        pyramid,
+        model="ensemble",
+        extra_layers={"SPREAD": layers[2]},
+    )
+
+
+def _write_grid(
+    kg_obj: "Kgrid",
+    xi: np.ndarray,
+    yi: np.ndarray,
+    Z: np.ndarray,
+    S: Optional[np.ndarray],
+    zk_vec: Union[list[float], np.ndarray],
+    filename: str,
+    extra_meta: dict = None,
+    pyramid: bool = False,
+    chunk_rows: int = 1024,
+    model: int = None,
+    extra_layers: dict = None,
+):
+    """
+    Denormalize a grid and write the `.grd` (X, Y, Z, Sigma or X, Y, Z) and `.hdr` files.
+
+    Z and S keep their dtype (see `Kgrid.dtype`), X and Y are always float64.
+    The `.grd` file is written in blocks of `chunk_rows` rows, so no
+    float64 (res_x * res_y, 4) copy of the grid is made.
+
+    :param kg_obj: Kgrid object
+    :type kg_obj: Kgrid
+    :param xi: grid X values (res_x)
+    :type xi: np.ndarray
+    :param yi: grid Y values (res_y)
+    :type yi: np.ndarray
+    :param Z: estimated Z (res_y, res_x), modified in place
+    :type Z: np.ndarray
+    :param S: estimated errors (res_y, res_x), modified in place, None for Z-only grids
+    :type S: Optional[np.ndarray]
+    :param zk_vec: Vector of model five parameters
+    :type zk_vec: Union[list[float], np.ndarray]
+    :param filename: filename base
+    :type filename: str
+    :param extra_meta: additional `key: value` entries for the `.hdr` file, defaults to None
+    :type extra_meta: dict, optional
+    :param pyramid: also write a decimated overview pyramid (`.ovr`), defaults to False
+    :type pyramid: bool, optional
+    :param chunk_rows: grid rows per written block, defaults to 1024
+    :type chunk_rows: int, optional
+    :param model: model number for the `.hdr` file, defaults to None (`kg_obj.model`)
+    :type model: int, optional
+    :param extra_layers: {column: (res_y, res_x) array} error-like layers written
+        after SIGMA and scaled like it, modified in place, defaults to None
+    :type extra_layers: dict, optional
+    """
+    from pygeko.__about__ import __version__ as pygeko_version
+
+    x_min, x_max = kg_obj.xmin, kg_obj.xmax
+    y_min, y_max = kg_obj.ymin, kg_obj.ymax
+    filename1 = filename + ".grd"
+    filename2 = filename + ".hdr"
+    res_y, res_x = Z.shape
 
-    # Convert to a NumPy array for block operations (if it isn't already)
-    results_array = np.array(all_results)
     if kg_obj.kdata.normalized:
         p = kg_obj.kdata._norm_params
-        # Apply denormalization to the entire columns
         # X and Y: Scale inversion and translation
-        results_array[:, 0] = (results_array[:, 0] / p["xy_scale"]) + p["xmin"]
-        results_array[:, 1] = (results_array[:, 1] / p["xy_scale"]) + p["ymin"]
-        # Z: Scale inversion and translation
-        results_array[:, 2] = (results_array[:, 2] / p["z_scale"]) + p["zmin"]
-        # SIGMA (E): Scale inversion only scale 
-        results_array[:, 3] = (results_array[:, 3] / p["z_scale"]) 
-
-    # Save results 
-    #with open(filename1, "w") as f: 
-        #f.write("X,Y,Z_ESTIM,SIGMA\n") 
-        # We use np.savetxt if we want maximum speed, 
-        # or this loop if you prefer to keep control of the format: 
-        #for row in results_array: 
-        #    f.write(f"{row[0]:.3f},{row[1]:.3f},{row[2]:.4f},{row[3]:.4f}\n")
+        xi = (xi / p["xy_scale"]) + p["xmin"]
+        yi = (yi / p["xy_scale"]) + p["ymin"]
+        # Z: Scale inversion and translation (in place, the dtype is kept)
+        Z /= p["z_scale"]
+        Z += p["zmin"]
+        # SIGMA (E): Scale inversion only scale
+        if S is not None:
+            S /= p["z_scale"]
+        for layer in (extra_layers or {}).values():
+            layer /= p["z_scale"]
 
     mode_str = "Normalized Mode" if kg_obj.kdata.normalized else "Raw Mode"
-    header = f"# Generated with pyGEKO {pygeko_version} ({mode_str})\nX,Y,Z_ESTIM,SIGMA"
-
-    np.savetxt(filename1, results_array, delimiter=",", header=header, comments="", fmt="%.3f,%.3f,%.4f,%.4f")
+    header = f"# Generated with pyGEKO {pygeko_version} ({mode_str})\nX,Y,Z_ESTIM"
+    fmt = "%.3f,%.3f,%.4f"
+    if S is not None:
+        header += ",SIGMA"
+        fmt += ",%.4f"
+    for name in extra_layers or {}:
+        header += f",{name}"
+        fmt += ",%.4f"
+
+    with open(filename1, "w") as f:
+        f.write(header + "\n")
+        for j0 in range(0, res_y, chunk_rows):
+            j1 = min(j0 + chunk_rows, res_y)
+            cols = [
+                np.tile(xi, j1 - j0),
+                np.repeat(yi[j0:j1], res_x),
+                Z[j0:j1].ravel(),
+            ]
+            if S is not None:
+                cols.append(S[j0:j1].ravel())
+            cols.extend(layer[j0:j1].ravel() for layer in (extra_layers or {}).values())
+            np.savetxt(f, np.column_stack(cols), delimiter=",", fmt=fmt)
     print(f"Export completed. Now writing metadata to {filename2}...")
     with open(filename2, "w") as f:
         f.write("type: GRID\n")
@@ -716,8 +1862,9 @@ def export_grid(
         f.write(f"ntot: {kg_obj.kdata.shape[0]}\n")
         f.write(f"nork: {kg_obj.kdata.nork}\n")
         f.write(f"nvec: {kg_obj.kdata.nvec}\n")
-        f.write(f"model: {kg_obj.model}\n")
-        f.write(f"zk: {zk_vec}\n")
+        f.write(f"model: {kg_obj.model if model is None else model}\n")
+        if zk_vec is not None:
+            f.write(f"zk: {zk_vec}\n")
         if kg_obj.kdata.normalized:
             f.write(f"xmin: {x_min/p['xy_scale']+p['xmin']}\n")
             f.write(f"xmax: {x_max/p['xy_scale']+p['xmin']}\n")
@@ -730,19 +1877,523 @@ def export_grid(
             f.write(f"ymax: {y_max}\n")
         f.write(f"bins: {res_x}\n")
         f.write(f"hist: {res_y}\n")
+        f.write(f"dtype: {Z.dtype.name}\n")
+        for key, val in (extra_meta or {}).items():
+            f.write(f"{key}: {val}\n")
         f.write(f"date: {datetime.datetime.now()}\n")
 
+    if pyramid:
+        levels = build_pyramid(xi, yi, Z, S)
+        write_pyramid(filename, levels)
+
     print("Completed.")
 
     print(f"Completed. Data saved to {filename1}")
 
+def compute_grid_weights(
+    kg_obj: "Kgrid",
+    zk_vec: Union[list[float], np.ndarray],
+    res_x: int = 100,
+    res_y: int = 100,
+) -> tuple:
+    """
+    Compute the kriging weights of every grid node as a sparse matrix W
+    (grid nodes x data points) plus the sigma map. Multithreaded version.
+
+    Since the weights do not depend on Z, any new Z vector measured at the same
+    data locations can be kriged with a single sparse product `W @ z`.
+
+    :param kg_obj: Kgrid object
+    :type kg_obj: Kgrid
+    :param zk_vec: Vector of model five parameters
+    :type zk_vec: Union[list[float], np.ndarray]
+    :param res_x: grid size X, defaults to 100
+    :type res_x: int, optional
+    :param res_y: grid size Y, defaults to 100
+    :type res_y: int, optional
+    :return: W (scipy.sparse.csr_matrix) and sigma (NaN for failed nodes)
+    :rtype: tuple[scipy.sparse.csr_matrix, np.ndarray]
+    """
+    from scipy.sparse import csr_matrix
+
+    xi = np.linspace(kg_obj.xmin, kg_obj.xmax, res_x)
+    yi = np.linspace(kg_obj.ymin, kg_obj.ymax, res_y)
+
+    print(f"Computing weights of {res_x}x{res_y} grid in parallel...")
+
+    # Masked nodes are skipped (empty rows of W)
+    mask = _grid_mask(kg_obj, xi, yi)
+    rows = np.arange(res_y) if mask is None else np.flatnonzero(mask.any(axis=1))
+    cols = [np.arange(res_x) if mask is None else np.flatnonzero(mask[j]) for j in rows]
+    n = len(rows)
+
+    with kriging_pool(kg_obj.kdata) as executor:
+        results_generator = list(tqdm(
+            executor.map(_process_row_weights, yi[rows], [xi[c] for c in cols], [None]*n, [zk_vec]*n),
+            total=n,
+            desc="Weights"
+        ))
+
+    # Build the CSR structure row by row (failed nodes are empty rows)
+    n_nodes = res_x * res_y
+    sigma = np.full(n_nodes, np.nan)
+    indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+    indices = []
+    data = []
+    for j, c, row in zip(rows, cols, results_generator):
+        for node, res in zip(j * res_x + c, row):
+            if res is not None:
+                neig, lambdas, sigma[node] = res
+                indices.append(neig)
+                data.append(lambdas)
+                indptr[node + 1] = len(neig)
+    np.cumsum(indptr, out=indptr)
+
+    indices = np.concatenate(indices) if indices else np.zeros(0, dtype=np.int64)
+    data = np.concatenate(data) if data else np.zeros(0)
+    W = csr_matrix((data, indices, indptr), shape=(n_nodes, len(kg_obj.kdata.x)))
+
+    return W, sigma
+
+
+def save_operator(W, filename: str, metadata: dict = None):
+    """
+    Save a sparse kriging operator uncompressed so that it can be memory-mapped.
+
+    The raw CSR arrays (data, indices, indptr) are stored with joblib without
+    compression, `load_operator()` can then page them in lazily and several
+    processes share the same OS page cache.
+
+    :param W: sparse operator
+    :type W: scipy.sparse.csr_matrix
+    :param filename: filename (`.kop` extension is added if missing)
+    :type filename: str
+    :param metadata: grid definition and model information, defaults to None
+    :type metadata: dict, optional
+    """
+    if not filename.endswith(".kop"):
+        filename += ".kop"
+
+    joblib.dump(
+        {
+            "metadata": metadata or {},
+            "shape": W.shape,
+            "data": np.ascontiguousarray(W.data),
+            "indices": np.ascontiguousarray(W.indices),
+            "indptr": np.ascontiguousarray(W.indptr),
+        },
+        filename,
+        compress=0,
+    )
+    print(f"[OK] Saved: {filename}")
+
+
+def load_operator(filename: str, mmap_mode: Optional[str] = "r") -> tuple:
+    """
+    Load a sparse kriging operator saved with `save_operator()`.
+
+    :param filename: filename (with or without the `.kop` extension)
+    :type filename: str
+    :param mmap_mode: numpy memory-map mode, None to load in memory, defaults to "r"
+    :type mmap_mode: str, optional
+    :return: operator and its metadata
+    :rtype: tuple[scipy.sparse.csr_matrix, dict]
+    """
+    from scipy.sparse import csr_matrix
+
+    if not filename.endswith(".kop"):
+        filename += ".kop"
+
+    op = joblib.load(filename, mmap_mode=mmap_mode)
+    W = csr_matrix((op["data"], op["indices"], op["indptr"]), shape=op["shape"], copy=False)
+    return W, op["metadata"]
+
+
+def estimate_points(
+    kd_obj: "Kdata",
+    xs: np.ndarray,
+    ys: np.ndarray,
+    zk_vec: Union[list[float], np.ndarray],
+    executor: ProcessPoolExecutor = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Krige a set of scattered points in parallel (working units).
+
+    :param kd_obj: Kdata object
+    :type kd_obj: Kdata
+    :param xs: X coordinates
+    :type xs: np.ndarray
+    :param ys: Y coordinates
+    :type ys: np.ndarray
+    :param zk_vec: Vector of model five parameters
+    :type zk_vec: Union[list[float], np.ndarray]
+    :param executor: pool created with `kriging_pool(kd_obj)` to reuse, a new one is created if None, defaults to None
+    :type executor: ProcessPoolExecutor, optional
+    :return: estimated Z and errors (NaN for failed points)
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    if len(xs) == 0:
+        return np.zeros(0), np.zeros(0)
+
+    num_workers = get_optimal_workers()
+    n_chunks = min(len(xs), 4 * num_workers)
+    indices = np.array_split(np.arange(len(xs)), n_chunks)
+    chunk_x = [xs[idx] for idx in indices]
+    chunk_y = [ys[idx] for idx in indices]
+    args = (chunk_x, chunk_y, [None]*n_chunks, [zk_vec]*n_chunks)
+
+    if executor is None:
+        with kriging_pool(kd_obj, num_workers) as pool:
+            results = list(pool.map(_process_chunk, *args))
+    else:
+        results = list(executor.map(_process_chunk, *args))
+
+    results_array = np.array([item for sublist in results for item in sublist])
+    z = results_array[:, 2]
+    sigma = results_array[:, 3]
+    failed = z == -999.0
+    z[failed] = np.nan
+    sigma[failed] = np.nan
+    return z, sigma
+
+
+def export_grid_adaptive(
+    kg_obj: "Kgrid",
+    zk_vec: Union[list[float], np.ndarray],
+    filename: str = "RESULT",
+    res_x: int = 100,
+    res_y: int = 100,
+    coarse: int = 8,
+    sigma_tol: float = None,
+    grad_tol: float = None,
+    z_tol: float = None,
+    pyramid: bool = False,
+):
+    """
+    Generate a grid with adaptive resolution and export it like `export_grid()`.
+
+    The grid nodes are first kriged every `coarse` nodes. Then each quadtree
+    cell is split, kriging its new nodes, where a corner failed, the cell
+    contains data points (the kriged surface honors them, so their peaks and
+    pits are not visible from the corners), the maximum SIGMA exceeds
+    `sigma_tol` or the Z gradient exceeds `grad_tol`. The midpoint of every
+    other cell is kriged and the cell is also split if it differs from the
+    bilinear value of the corners by more than `z_tol`. The nodes of the
+    remaining cells are filled by bilinear interpolation (Z and SIGMA).
+    The output is still a regular `res_x` x `res_y` grid.
+
+    Tolerances left to None are not used; with the three of them None no
+    node is interpolated (same result as `export_grid()`).
+
+    :param kg_obj: Kgrid object
+    :type kg_obj: Kgrid
+    :param zk_vec: Vector of model five parameters
+    :type zk_vec: Union[list[float], np.ndarray]
+    :param filename: filename base, defaults to "RESULT"
+    :type filename: str, optional
+    :param res_x: grid size X, defaults to 100
+    :type res_x: int, optional
+    :param res_y: grid size Y, defaults to 100
+    :type res_y: int, optional
+    :param coarse: initial node spacing (power of two), defaults to 8
+    :type coarse: int, optional
+    :param sigma_tol: SIGMA threshold (original units), defaults to None
+    :type sigma_tol: float, optional
+    :param grad_tol: Z gradient threshold (original Z units per X/Y unit), defaults to None
+    :type grad_tol: float, optional
+    :param z_tol: maximum difference between the kriged and the bilinear Z at
+        the cell midpoint (original units), defaults to None (the kriged SIGMA
+        of the midpoint)
+    :type z_tol: float, optional
+    :param pyramid: also write a decimated overview pyramid (`.ovr`), defaults to False
+    :type pyramid: bool, optional
+    """
+    kd = kg_obj.kdata
+    xi = np.linspace(kg_obj.xmin, kg_obj.xmax, res_x)
+    yi = np.linspace(kg_obj.ymin, kg_obj.ymax, res_y)
+    Z = np.full((res_y, res_x), np.nan)
+    S = np.full((res_y, res_x), np.nan)
+    kriged = np.zeros((res_y, res_x), dtype=bool)
+    mask = _grid_mask(kg_obj, xi, yi)
+
+    print(f"Exporting {res_x}x{res_y} adaptive grid in parallel to {filename}.grd...")
+
+    with kriging_pool(kd) as executor:
+
+        def krige_nodes(jj, ii):
+            """Krige the (row, col) nodes not kriged yet"""
+            nodes = np.unique(np.column_stack((jj, ii)), axis=0)
+            nodes = nodes[~kriged[nodes[:, 0], nodes[:, 1]]]
+            if mask is not None:
+                # Masked nodes stay NaN without kriging
+                out = ~mask[nodes[:, 0], nodes[:, 1]]
+                kriged[nodes[out, 0], nodes[out, 1]] = True
+                nodes = nodes[~out]
+            if len(nodes):
+                z, s = estimate_points(
+                    kd, xi[nodes[:, 1]], yi[nodes[:, 0]], zk_vec, executor
+                )
+                Z[nodes[:, 0], nodes[:, 1]] = z
+                S[nodes[:, 0], nodes[:, 1]] = s
+                kriged[nodes[:, 0], nodes[:, 1]] = True
+
+        # 1. Coarse level
+        ix = np.unique(np.r_[np.arange(0, res_x, coarse), res_x - 1])
+        iy = np.unique(np.r_[np.arange(0, res_y, coarse), res_y - 1])
+        jj, ii = np.meshgrid(iy, ix, indexing="ij")
+        krige_nodes(jj.ravel(), ii.ravel())
+
+        # Quadtree cells as (j0, j1, i0, i1) rows
+        j0, i0 = np.meshgrid(iy[:-1], ix[:-1], indexing="ij")
+        j1, i1 = np.meshgrid(iy[1:], ix[1:], indexing="ij")
+        cells = np.column_stack((j0.ravel(), j1.ravel(), i0.ravel(), i1.ravel()))
+
+        # 2. Thresholds in working units
+        dxn = (kg_obj.xmax - kg_obj.xmin) / max(res_x - 1, 1)
+        dyn = (kg_obj.ymax - kg_obj.ymin) / max(res_y - 1, 1)
+        interpolate = any(t is not None for t in (sigma_tol, grad_tol, z_tol))
+        if not interpolate:
+            print("No tolerance given: every node is kriged.")
+
+        # Data points per grid cell, as a summed-area table
+        xyz = kd.xyz
+        hist, _, _ = np.histogram2d(xyz[:, 1], xyz[:, 0], bins=(yi, xi))
+        sat = np.zeros((res_y, res_x))
+        sat[1:, 1:] = hist.cumsum(axis=0).cumsum(axis=1)
+
+        def has_data(c):
+            """Cells with data points inside"""
+            n = sat[c[:, 1], c[:, 3]] - sat[c[:, 0], c[:, 3]] - sat[c[:, 1], c[:, 2]] + sat[c[:, 0], c[:, 2]]
+            return n > 0
+
+        def cell_stats(c):
+            """Maximum SIGMA and Z gradient of the cells"""
+            corners = [(c[:, 0], c[:, 2]), (c[:, 0], c[:, 3]), (c[:, 1], c[:, 2]), (c[:, 1], c[:, 3])]
+            zc = np.column_stack([Z[j, i] for j, i in corners])
+            sc = np.column_stack([S[j, i] for j, i in corners])
+            diag = np.hypot((c[:, 3] - c[:, 2]) * dxn, (c[:, 1] - c[:, 0]) * dyn)
+            with np.errstate(invalid="ignore"):
+                grad = (zc.max(axis=1) - zc.min(axis=1)) / diag
+            return zc, sc.max(axis=1), grad
+
+        p = kd._norm_params if kd.normalized else {"xy_scale": 1.0, "z_scale": 1.0}
+        s_tol = np.inf if sigma_tol is None else sigma_tol * p["z_scale"]
+        g_tol = np.inf if grad_tol is None else grad_tol * p["z_scale"] / p["xy_scale"]
+
+        # 3. Refinement
+        while len(cells):
+            zc, s_max, grad = cell_stats(cells)
+            leaf = ((cells[:, 1] - cells[:, 0]) <= 1) & ((cells[:, 3] - cells[:, 2]) <= 1)
+            with np.errstate(invalid="ignore"):
+                refine = ~leaf & (
+                    (not interpolate)
+                    | np.isnan(zc).any(axis=1)
+                    | has_data(cells)
+                    | (s_max > s_tol)
+                    | (grad > g_tol)
+                )
+
+            # Midpoint check of the cells that would be interpolated
+            cand = np.flatnonzero(~leaf & ~refine)
+            if len(cand):
+                c = cells[cand]
+                jm = (c[:, 0] + c[:, 1]) // 2
+                im = (c[:, 2] + c[:, 3]) // 2
+                krige_nodes(jm, im)
+                t = (im - c[:, 2]) / (c[:, 3] - c[:, 2])
+                u = (jm - c[:, 0]) / (c[:, 1] - c[:, 0])
+                zb = np.einsum(
+                    "ij,ij->i",
+                    zc[cand],
+                    np.column_stack(((1 - t) * (1 - u), t * (1 - u), (1 - t) * u, t * u)),
+                )
+                tol = S[jm, im] if z_tol is None else z_tol * p["z_scale"]
+                with np.errstate(invalid="ignore"):
+                    bad = ~(np.abs(Z[jm, im] - zb) <= tol)  # NaN midpoints too
+                refine[cand[bad]] = True
+            fill = ~leaf & ~refine
+
+            # Bilinear fill of the smooth cells (kriged nodes are kept)
+            for (cj0, cj1, ci0, ci1), (z00, z01, z10, z11) in zip(cells[fill], zc[fill]):
+                t = (np.arange(ci0, ci1 + 1) - ci0) / (ci1 - ci0)
+                u = (np.arange(cj0, cj1 + 1) - cj0) / (cj1 - cj0)
+                T, U = np.meshgrid(t, u)
+                w = np.array([(1 - T) * (1 - U), T * (1 - U), (1 - T) * U, T * U])
+                block = np.s_[cj0 : cj1 + 1, ci0 : ci1 + 1]
+                s00, s01, s10, s11 = (S[cj0, ci0], S[cj0, ci1], S[cj1, ci0], S[cj1, ci1])
+                keep = kriged[block]
+                Z[block] = np.where(keep, Z[block], np.tensordot([z00, z01, z10, z11], w, 1))
+                S[block] = np.where(keep, S[block], np.tensordot([s00, s01, s10, s11], w, 1))
+
+            # Split the rest into (up to) four children
+            c = cells[refine]
+            jm = (c[:, 0] + c[:, 1]) // 2
+            im = (c[:, 2] + c[:, 3]) // 2
+            children = np.concatenate(
+                [
+                    np.column_stack((c[:, 0], jm, c[:, 2], im)),
+                    np.column_stack((c[:, 0], jm, im, c[:, 3])),
+                    np.column_stack((jm, c[:, 1], c[:, 2], im)),
+                    np.column_stack((jm, c[:, 1], im, c[:, 3])),
+                ]
+            )
+            # Drop degenerate children (splitting a cell one node wide or high)
+            children = children[(children[:, 1] > children[:, 0]) & (children[:, 3] > children[:, 2])]
+            children = np.unique(children, axis=0)
+            if len(children):
+                krige_nodes(
+                    np.r_[children[:, 0], children[:, 0], children[:, 1], children[:, 1]],
+                    np.r_[children[:, 2], children[:, 3], children[:, 2], children[:, 3]],
+                )
+            cells = children
+
+    if mask is not None:
+        Z[~mask] = np.nan
+        S[~mask] = np.nan
+        kriged &= mask
+    n_kriged = int(kriged.sum())
+    print(f"Adaptive grid: {n_kriged} of {res_x * res_y} nodes kriged.")
+
+    dtype = getattr(kg_obj, "dtype", np.float64)
+    _write_grid(
+        kg_obj,
+        xi,
+        yi,
+        Z.astype(dtype, copy=False),
+        S.astype(dtype, copy=False),
+        zk_vec,
+        filename,
+        extra_meta={"adaptive": f"{n_kriged}/{res_x * res_y} nodes kriged"},
+        pyramid=pyramid,
+    )
+
+
+def _block_nanmean(a: np.ndarray, f: int, axis: int) -> np.ndarray:
+    """NaN-aware mean of consecutive blocks of `f` elements along an axis
+    (the last block may be shorter).
+
+    :param a: input array
+    :type a: np.ndarray
+    :param f: block size
+    :type f: int
+    :param axis: axis to decimate
+    :type axis: int
+    :return: decimated array
+    :rtype: np.ndarray
+    """
+    n = a.shape[axis]
+    pad = [(0, 0)] * a.ndim
+    pad[axis] = (0, -n % f)
+    # Float input keeps its dtype (float32 grids give float32 levels)
+    a = a.astype(a.dtype if a.dtype.kind == "f" else np.float64)
+    a = np.pad(a, pad, constant_values=np.nan)
+    shape = a.shape[:axis] + (a.shape[axis] // f, f) + a.shape[axis + 1 :]
+    with warnings.catch_warnings():
+        # All-NaN blocks (unkriged areas) stay NaN
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        return np.nanmean(a.reshape(shape), axis=axis + 1)
+
+
+def build_pyramid(
+    x: np.ndarray,
+    y: np.ndarray,
+    Z: np.ndarray,
+    E: Optional[np.ndarray],
+    min_size: int = 256,
+) -> dict:
+    """
+    Build a decimated overview pyramid (2x, 4x, 8x...) of a grid.
+
+    Each level averages f x f blocks of nodes, levels are added while the
+    largest side of the decimated grid is at least `min_size` nodes.
+
+    :param x: grid X values (nx)
+    :type x: np.ndarray
+    :param y: grid Y values (ny)
+    :type y: np.ndarray
+    :param Z: estimated Z (ny, nx)
+    :type Z: np.ndarray
+    :param E: estimated errors (ny, nx), None for Z-only grids
+    :type E: Optional[np.ndarray]
+    :param min_size: minimum size of the coarsest level, defaults to 256
+    :type min_size: int, optional
+    :return: {factor: (x, y, Z, E)}
+    :rtype: dict
+    """
+    levels = {}
+    f = 2
+    while max(Z.shape) / f >= min_size:
+        levels[f] = (
+            _block_nanmean(x, f, 0),
+            _block_nanmean(y, f, 0),
+            _block_nanmean(_block_nanmean(Z, f, 0), f, 1),
+            None if E is None else _block_nanmean(_block_nanmean(E, f, 0), f, 1),
+        )
+        f *= 2
+    return levels
+
+
+def write_pyramid(filename: str, levels: dict):
+    """
+    Write an overview pyramid next to the grid as `filename.ovr` (NumPy `.npz` format).
+
+    Grids too small to have any level get no `.ovr` file (a previous one is removed).
+
+    :param filename: grid filename base
+    :type filename: str
+    :param levels: pyramid as returned by `build_pyramid()`
+    :type levels: dict
+    """
+    if not levels:
+        if os.path.exists(filename + ".ovr"):
+            os.remove(filename + ".ovr")
+        print("Grid too small for an overview pyramid, no .ovr file written.")
+        return
+    arrays = {}
+    for f, (x, y, Z, E) in levels.items():
+        arrays.update({f"x_{f}": x, f"y_{f}": y, f"z_{f}": Z})
+        if E is not None:
+            arrays[f"e_{f}"] = E
+    # File object: np.savez would append '.npz' to the name
+    with open(filename + ".ovr", "wb") as fobj:
+        np.savez(fobj, factors=np.array(sorted(levels), dtype=int), **arrays)
+    print(f"Overview pyramid ({len(levels)} levels) saved to {filename}.ovr")
+
+
+def read_pyramid(filename: str) -> Optional[dict]:
+    """
+    Read the overview pyramid written by `write_pyramid()`.
+
+    :param filename: grid filename base
+    :type filename: str
+    :return: {factor: (x, y, Z, E)} (E is None for Z-only grids) or None if there is no `.ovr` file
+    :rtype: Optional[dict]
+    """
+    if not os.path.exists(filename + ".ovr"):
+        return None
+    with np.load(filename + ".ovr") as data:
+        return {
+            int(f): (
+                data[f"x_{f}"],
+                data[f"y_{f}"],
+                data[f"z_{f}"],
+                data[f"e_{f}"] if f"e_{f}" in data else None,
+            )
+            for f in data["factors"]
+        }
+
+
 def export_profile(
     kp_obj: "Kprofile",
     zk_vec: np.ndarray,
     filename: str = "PROFILE",
+    return_sigma: bool = True,
 ):
     """
     Generate a profile and export it to a CSV file (X, Y, Z, Sigma). 
+    With `return_sigma=False` the errors are not computed and the SIGMA column is omitted.
     """
     from pygeko.__about__ import __version__ as pygeko_version
 
@@ -763,12 +2414,19 @@ def export_profile(
     chunk_y = [kp_obj._y[idx] for idx in indices]
 
     all_results = []
-    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+    with kriging_pool(kp_obj.kdata, num_workers) as executor:
         # We reuse _process_row by treating each chunk as a 'row'
         # Note: _process_row needs to handle cases where Y is also a vector 
         # or we can wrap it to process zip(x, y)
         results_generator = list(tqdm(
-            executor.map(_process_chunk, chunk_x, chunk_y, [kp_obj.kdata]*num_workers, [zk_vec]*num_workers),
+            executor.map(
+                _process_chunk,
+                chunk_x,
+                chunk_y,
+                [None] * num_workers,
+                [zk_vec] * num_workers,
+                [return_sigma] * num_workers,
+            ),
             total=num_workers,
             desc="Kriging Profile"
         ))
@@ -783,12 +2441,17 @@ def export_profile(
         results_array[:, 0] = (results_array[:, 0] / p["xy_scale"]) + p["xmin"]
         results_array[:, 1] = (results_array[:, 1] / p["xy_scale"]) + p["ymin"]
         results_array[:, 2] = (results_array[:, 2] / p["z_scale"]) + p["zmin"]
-        results_array[:, 3] = (results_array[:, 3] / p["z_scale"])
+        if return_sigma:
+            results_array[:, 3] = (results_array[:, 3] / p["z_scale"])
 
     # Save CSV (.prf)
     mode_str = "Normalized Mode" if kp_obj.kdata.normalized else "Raw Mode"
-    header = f"# Generated with pyGEKO {pygeko_version} ({mode_str})\nX,Y,Z_ESTIM,SIGMA"
-    np.savetxt(filename1, results_array, delimiter=",", header=header, comments="", fmt="%.3f,%.3f,%.4f,%.4f")
+    header = f"# Generated with pyGEKO {pygeko_version} ({mode_str})\nX,Y,Z_ESTIM"
+    fmt = "%.3f,%.3f,%.4f"
+    if return_sigma:
+        header += ",SIGMA"
+        fmt += ",%.4f"
+    np.savetxt(filename1, results_array, delimiter=",", header=header, comments="", fmt=fmt)
 
     # Save Metadata (.hdr)
     print(f"Export completed. Writing metadata to {filename2}...")
@@ -807,10 +2470,152 @@ def export_profile(
         f.write(f"zk: {zk_vec.tolist()}\n")
         f.write(f"n_points: {len(kp_obj._x)}\n")
         f.write(f"total_length: {kp_obj._total_length}\n")
+        if not return_sigma:
+            f.write("sigma: False\n")
         f.write(f"date: {datetime.datetime.now()}\n")
 
     print(f"Completed. Data saved to {filename1}")
 
+def _process_points(
+    xs, ys, kd_obj, zk_vec, return_sigma=True
+) -> tuple[np.ndarray, np.ndarray]:
+    """Processes a chunk of scattered points with the vectorized engine
+
+    :param xs: X values
+    :type xs: numpy.ndarray
+    :param ys: Y values
+    :type ys: numpy.ndarray
+    :param kd_obj: Kdata object, None to use the one of the pool worker
+    :type kd_obj: Kdata
+    :param zk_vec: model parameters
+    :type zk_vec: list[float]
+    :param return_sigma: also compute the errors, defaults to True
+    :type return_sigma: bool, optional
+    :return: estimated Z and errors (None if not return_sigma), NaN for failed points
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    kd_obj = _worker_kdata if kd_obj is None else kd_obj
+    return estimate_batch(
+        kd_obj, xs, ys, zk_vec, return_sigma=return_sigma, workers=1
+    )
+
+
+def _read_points(path: str, columns: list, chunksize: int):
+    """
+    Internal generator of the target points chunks of a CSV or Parquet file.
+
+    :param path: `.csv` or `.parquet` file
+    :type path: str
+    :param columns: columns to read
+    :type columns: list
+    :param chunksize: rows per chunk
+    :type chunksize: int
+    :return: dataframe chunks
+    :rtype: Iterator[pd.DataFrame]
+    """
+    import pandas as pd
+
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(
+            batch_size=chunksize, columns=columns
+        ):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunksize)
+
+
+def export_points(
+    kp_obj: "KpointsCSV",
+    zk_vec: np.ndarray,
+    filename: str = "POINTS",
+    return_sigma: bool = True,
+):
+    """
+    Krige all the target points of a KpointsCSV object and export them to a
+    CSV file (X, Y, Z_ESTIM, SIGMA and the ID columns). With `return_sigma=False`
+    the errors are not computed and the SIGMA column is omitted.
+
+    The input is read in chunks of `kp_obj.chunksize` rows, each chunk is
+    split among the pool workers and appended to the output, so memory use
+    does not depend on the number of points.
+    """
+    from pygeko.__about__ import __version__ as pygeko_version
+
+    kd = kp_obj.kdata
+    filename1 = filename + ".pts"
+    filename2 = filename + ".hdr"
+    print(f"Exporting points of {kp_obj.path} in parallel to {filename1}...")
+
+    num_workers = get_optimal_workers()
+    mode_str = "Normalized Mode" if kd.normalized else "Raw Mode"
+    columns = [kp_obj.x_col, kp_obj.y_col] + kp_obj.id_cols
+    n_points = 0
+    n_failed = 0
+
+    with open(filename1, "w") as f, kriging_pool(kd, num_workers) as executor:
+        f.write(f"# Generated with pyGEKO {pygeko_version} ({mode_str})\n")
+        first = True
+        for chunk in tqdm(
+            _read_points(kp_obj.path, columns, kp_obj.chunksize), desc="Kriging Points"
+        ):
+            xs = chunk[kp_obj.x_col].to_numpy(dtype=np.float64)
+            ys = chunk[kp_obj.y_col].to_numpy(dtype=np.float64)
+            xn, yn, _, _ = kd.norm_coord(xs, ys)
+
+            indices = np.array_split(np.arange(len(xs)), min(len(xs), 4 * num_workers))
+            results = list(
+                executor.map(
+                    _process_points,
+                    [xn[idx] for idx in indices],
+                    [yn[idx] for idx in indices],
+                    [None] * len(indices),
+                    [zk_vec] * len(indices),
+                    [return_sigma] * len(indices),
+                )
+            )
+            z = np.concatenate([r[0] for r in results])
+            sigma = np.concatenate([r[1] for r in results]) if return_sigma else 0.0
+            _, _, z, sigma = kd.denorm_coord(0, 0, z, sigma)
+
+            out = chunk[kp_obj.id_cols].copy()
+            out.insert(0, "X", np.round(xs, 3))
+            out.insert(1, "Y", np.round(ys, 3))
+            out.insert(2, "Z_ESTIM", np.round(z, 4))
+            if return_sigma:
+                out.insert(3, "SIGMA", np.round(sigma, 4))
+            out.to_csv(f, index=False, header=first)
+            first = False
+
+            n_points += len(xs)
+            n_failed += int(np.isnan(z).sum())
+
+    # Save Metadata (.hdr)
+    print(f"Export completed. Writing metadata to {filename2}...")
+    with open(filename2, "w") as f:
+        f.write("type: POINTS\n")
+        f.write(f"creator: pyGEKO v{pygeko_version} ({mode_str})\n")
+        f.write(f"file: {kd.title}\n")
+        f.write(f"x_col: {kd.x_col}\n")
+        f.write(f"y_col: {kd.y_col}\n")
+        f.write(f"z_col: {kd.z_col}\n")
+        f.write(f"ntot: {kd.shape[0]}\n")
+        f.write(f"targets: {kp_obj.path}\n")
+        f.write(f"id_cols: {kp_obj.id_cols}\n")
+        f.write(f"nork: {kd.nork}\n")
+        f.write(f"nvec: {kd.nvec}\n")
+        f.write(f"model: {kp_obj.model}\n")
+        f.write(f"zk: {np.asarray(zk_vec).tolist()}\n")
+        f.write(f"n_points: {n_points}\n")
+        f.write(f"n_failed: {n_failed}\n")
+        if not return_sigma:
+            f.write("sigma: False\n")
+        f.write(f"date: {datetime.datetime.now()}\n")
+
+    print(f"Completed. Data saved to {filename1}")
+
+
 def run_gik(kd_obj: "Kdata", verbose) -> Tuple[np.ndarray, np.ndarray]:
     """Generate the generalized increment database
 
@@ -820,9 +2625,11 @@ def run_gik(kd_obj: "Kdata", verbose) -> Tuple[np.ndarray, np.ndarray]:
     :return: X: Contribution matrix (N_increments, 5), Y: Vector of squared increments (N_increments)
     :rtype: tuple[np.ndarray, np.ndarray]
     """
-    nvec = kd_obj.nvec
     nork = kd_obj.nork
-    n_points = len(kd_obj.x)
+    xyz = kd_obj.xyz
+    z = xyz[:, 2]
+    n_points = len(xyz)
+    loo_neig, loo_noct = kd_obj.loo_neighbors()
     contributions = []
     squared_increments = []
 
@@ -830,10 +2637,11 @@ def run_gik(kd_obj: "Kdata", verbose) -> Tuple[np.ndarray, np.ndarray]:
         tqdm.write(f"Generating GIK's for {n_points} data points...")
 
     for i in range(n_points):
-        tx, ty, tz = kd_obj.x[i], kd_obj.y[i], kd_obj.z[i]
+        tx, ty, tz = xyz[i]
 
-        # 1. Find neighbors (using trim=True to create the increment)
-        neig, _, _, noct = kd_obj.findneig(tx, ty, nvec, trim=True)
+        # 1. Find neighbors (leave-one-out, to create the increment)
+        neig, noct = loo_neig[i], loo_noct[i]
+        neig = neig[neig >= 0]
 
         if noct < 4:
             continue
@@ -854,11 +2662,11 @@ def run_gik(kd_obj: "Kdata", verbose) -> Tuple[np.ndarray, np.ndarray]:
         indices = np.concatenate([[i], neig])
 
         # Value of the squared increment
-        inc_val = (tz - np.sum(lambdas * kd_obj.z[neig])) ** 2
+        inc_val = (tz - np.sum(lambdas * z[neig])) ** 2
 
         # 3. Calculate the contribution of each basis f_k(h) to this increment
         # C_k = Sum_a Sum_b (w_a * w_b * f_k(dist_ab))
-        coords = np.column_stack((kd_obj.x[indices], kd_obj.y[indices]))
+        coords = xyz[indices, :2]
         from scipy.spatial.distance import pdist, squareform
 
         dists = squareform(pdist(coords))
@@ -942,6 +2750,10 @@ def run_full_exploration(
 ) -> tuple[np.ndarray[float], int, float, float, float]:
     """Test all 22 models, perform cross-validation for each one and save the results to kd_obj.crossvaldata
 
+    The cross-validation of all the models is done in a single pass
+    (`loo_cross_validation()`). Every entry keeps the summary statistics and
+    only the best model keeps its per-point result in `cv`.
+
     :param kd_obj: Kdata object
     :type kd_obj: "Kdata"
     :param X_gik: Contribution matrix (N_increments, 5)
@@ -965,52 +2777,73 @@ def run_full_exploration(
         )
         tqdm.write("-" * 50)
 
+    # 1. GIK adjustment (Least squares to obtain zk) of every model
+    fitted = []
     for idx, mask in enumerate(models_array):
-        # 1. GIK adjustment (Least squares to obtain zk)
         mask_bool = mask.astype(bool)
         success, zk_sub = solve_linear_system(X_gik[:, mask_bool], Y_gik)
 
         if success:
             zk_full = np.zeros(5)
             zk_full[mask_bool] = zk_sub
+            fitted.append((idx, zk_full))
+
+    # 2. Cross-validation of all the models in a single pass
+    # (We calculate real metrics to compare models)
+    cvs = dict(
+        zip(
+            [idx for idx, _ in fitted],
+            loo_cross_validation(kd_obj, [zk for _, zk in fitted]),
+        )
+    )
+    zks = dict(fitted)
 
-            # 2. Cross-validation for this specific model
-            # (We calculate real metrics to compare models)
-            actual, pred, errs = cross_validation_silent(kd_obj, zk_full)
-
-            if len(actual) > 0:
-                mae = np.mean(np.abs(errs))
-                rmse = np.sqrt(np.mean(np.array(errs) ** 2))
-                corr = np.corrcoef(actual, pred)[0, 1]
-
-                # 3. Save to history
-                res = {
-                    "model_idx": idx,
-                    "mask": mask.copy(),  # Copia explícita
-                    "zk": zk_full.copy(),  # <--- MUY IMPORTANTE: copia física del array
-                    "mae": float(mae),  # Asegurar que son tipos nativos
-                    "rmse": float(rmse),
-                    "corr": float(corr),
-                    "success": True,
-                }
-                kd_obj.crossvaldata.append(res)
-
-                if verbose:
-                    tqdm.write(
-                        f"{idx:<4} | {mae:<10.4f} | {rmse:<10.4f} | {corr:<8.4f} | OK"
-                    )
-            else:
-                if verbose:
-                    tqdm.write(f"{idx:<4} | {'-':<10} | {'-':<10} | {'-':<8} | CV fail")
-        else:
+    for idx, mask in enumerate(models_array):
+        if idx not in cvs:
             if verbose:
                 tqdm.write(
                     f"{idx:<4} | {'-':<10} | {'-':<10} | {'-':<8} | Matrix error"
                 )
+            continue
+
+        cv = cvs[idx]
+        zk_full = zks[idx]
+        if len(cv["actual"]) > 0:
+            mae, rmse, corr = cv_metrics(cv)
+            zs_mean, zs_std = cv_zscore_stats(cv)
+
+            # 3. Save to history
+            res = {
+                "model_idx": idx,
+                "mask": mask.copy(),  # Copia explícita
+                "zk": zk_full.copy(),  # <--- MUY IMPORTANTE: copia física del array
+                "mae": mae,  # Asegurar que son tipos nativos
+                "rmse": rmse,
+                "corr": corr,
+                "zscore_mean": zs_mean,
+                "zscore_std": zs_std,
+                "n_valid": len(cv["actual"]),
+                "success": True,
+                "cv": cv,
+            }
+            kd_obj.crossvaldata.append(res)
+
+            if verbose:
+                tqdm.write(
+                    f"{idx:<4} | {mae:<10.4f} | {rmse:<10.4f} | {corr:<8.4f} | OK"
+                )
+        else:
+            if verbose:
+                tqdm.write(f"{idx:<4} | {'-':<10} | {'-':<10} | {'-':<8} | CV fail")
 
     # Sort by RMSE to suggest the best one at the end
     kd_obj.crossvaldata.sort(key=lambda x: x["rmse"])
 
+    # Per-point results are kept only for the best model (they grow with
+    # n_models x N), the others are recomputed on demand by Kdata.cv_results()
+    for res in kd_obj.crossvaldata[1:]:
+        del res["cv"]
+
     return (
         kd_obj.crossvaldata[0]["zk"],
         kd_obj.crossvaldata[0]["model_idx"],
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from pygeko import Kdata
+from pygeko.utils import (
+    assemble_kriging_system,
+    cv_metrics,
+    get_data_path,
+    loo_cross_validation,
+    solve_linear_system,
+)
+
+ZKS = [
+    np.array([0.0, -1.78e3, 3.98e-2, 0.0, -16.0]),
+    np.array([0.0, -449.0, 0.0, 0.0, -1.07]),
+    np.array([0.0, 0.0, 8.89e-3, 0.0, 0.0]),
+]
+
+
+def montebea(nork, nvec=14):
+    kd = Kdata(get_data_path("montebea.csv"))
+    kd.x_col, kd.y_col, kd.z_col = "easting", "northing", "heigth"
+    kd.nork = nork
+    kd.nvec = nvec
+    kd.normalize()
+    kd.init_neig()
+    return kd
+
+
+def reference_cv(kd, zk):
+    """Per-point lstsq loop of the former cross_validation_silent()"""
+    xyz = kd.xyz
+    loo_neig, loo_noct = kd.loo_neighbors()
+    pred = {}
+    for i in range(len(xyz)):
+        neig = loo_neig[i][loo_neig[i] >= 0]
+        if loo_noct[i] >= 4:
+            A, b = assemble_kriging_system(
+                (xyz[i, 0], xyz[i, 1]), neig, kd, zk=zk, order=kd.nork
+            )
+            success, weights = solve_linear_system(A, b)
+            if success:
+                pred[i] = np.sum(weights[: len(neig)] * xyz[neig, 2])
+    return pred
+
+
+@pytest.mark.parametrize("nork, rtol", [(0, 1e-6), (1, 1e-6), (2, 5e-3)])
+def test_engine_matches_per_point_loop(nork, rtol):
+    kd = montebea(nork)
+    cvs = loo_cross_validation(kd, ZKS)
+    for zk, cv in zip(ZKS, cvs):
+        ref = reference_cv(kd, zk)
+        assert list(cv["index"]) == sorted(ref)
+        expected = np.array([ref[i] for i in cv["index"]])
+        residual = kd.xyz[cv["index"], 2] - expected
+        assert np.allclose(cv["residual"], cv["actual"] - cv["predicted"])
+        mae, rmse, _ = cv_metrics(cv)
+        assert mae == pytest.approx(np.mean(np.abs(residual)), rel=rtol)
+        assert rmse == pytest.approx(np.sqrt(np.mean(residual**2)), rel=rtol)
+
+
+def test_crossvaldata_keeps_only_best_points(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # analyze() saves its .gck
+    kd = montebea(1)
+    kd.analyze(verbose=False)
+    best, others = kd.crossvaldata[0], kd.crossvaldata[1:]
+    assert best["model_idx"] == kd.model_id
+    assert len(best["cv"]["actual"]) == best["n_valid"]
+    assert all("cv" not in r and "zscore_std" in r for r in others)
+
+    other = others[0]
+    df = kd.cv_results(other["model_idx"])
+    assert len(df) == other["n_valid"]
+    assert "cv" not in other
+    _, _, _, e = kd.denorm_coord(0, 0, 0, 1.0)
+    rmse = np.sqrt(np.mean(df["RESIDUAL"] ** 2)) / e
+    assert rmse == pytest.approx(other["rmse"])
+
+
+def test_analyze_emits_no_runtime_warnings(tmp_path, monkeypatch):
+    import warnings
+
+    monkeypatch.chdir(tmp_path)
+    kd = montebea(1)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)
+        kd._execute_analysis(verbose=False)
+    assert all("zscore_mean" in r for r in kd.crossvaldata)
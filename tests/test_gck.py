@@ -0,0 +1,31 @@
+import os
+
+import numpy as np
+import pytest
+
+from pygeko import Kdata
+from pygeko.catgck import HEADER_EXT, load_gck
+from pygeko.utils import get_data_path
+
+
+@pytest.fixture
+def kd():
+    kd = Kdata(get_data_path("montebea.csv"))
+    kd.x_col, kd.y_col, kd.z_col = "easting", "northing", "heigth"
+    kd.nork = 1
+    kd.nvec = 14
+    kd.normalize()
+    return kd
+
+
+@pytest.mark.parametrize("compress, mapped", [(0, True), (3, False)])
+def test_load_gck_mmap_without_header(kd, tmp_path, monkeypatch, compress, mapped):
+    monkeypatch.chdir(tmp_path)
+    kd.save(verbose=False, embed=True, compress=compress)
+    filename = "montebea_1_14.gck"
+    os.remove(filename + HEADER_EXT)  # missing sidecar
+
+    xyz = load_gck(filename)["data"]["xyz"]
+    assert isinstance(xyz, np.memmap) == mapped
+    assert np.array_equal(xyz, kd.xyz)
+    assert not isinstance(load_gck(filename, mmap=False)["data"]["xyz"], np.memmap)
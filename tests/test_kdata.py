@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from pygeko import Kdata
+from pygeko.utils import get_data_path
+
+
+@pytest.fixture
+def kd():
+    kd = Kdata(get_data_path("montebea.csv"))
+    kd.x_col, kd.y_col, kd.z_col = "easting", "northing", "heigth"
+    kd.nork = 1
+    kd.nvec = 14
+    kd.init_neig()
+    return kd
+
+
+def test_replaced_z_column_is_detected(kd):
+    zk = np.array([0.0, -449.0, 0.0, 0.0, -1.07])
+    kd.crossvaldata = [{"model_idx": 0, "zk": zk}]
+    kd.model_id = 0
+    z0 = kd.predict([500.0], [700.0])[0]
+    tree, loo = kd.kdtree, kd.loo_neighbors()
+
+    kd.dframe[kd.z_col] = kd.dframe[kd.z_col] + 1000.0
+    assert kd.predict([500.0], [700.0])[0] == pytest.approx(z0 + 1000.0)
+    assert np.array_equal(kd.z, kd.dframe[kd.z_col].to_numpy())
+    # Only Z changed: KDTree and neighborhoods are kept
+    assert kd.kdtree is tree
+    assert kd.loo_neighbors()[0] is loo[0]
+
+
+def test_replaced_xy_column_rebuilds_tree(kd):
+    tree = kd.kdtree
+    kd.dframe[kd.x_col] = kd.dframe[kd.x_col] + 1.0
+    kd.loo_neighbors()
+    assert kd.kdtree is not tree
+    assert np.array_equal(kd.kdtree.data[:, 0], kd.dframe[kd.x_col].to_numpy())
+
+
+def test_refresh_after_in_place_edit(kd):
+    kd.dframe.loc[kd.dframe.index[0], kd.z_col] = -1.0
+    kd.refresh()
+    assert kd.z[0] == -1.0
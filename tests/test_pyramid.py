@@ -0,0 +1,38 @@
+import numpy as np
+
+from pygeko.utils import build_pyramid, read_pyramid, write_pyramid
+
+
+def test_pyramid_keeps_float32():
+    x = np.arange(600, dtype=np.float64)
+    y = np.arange(520, dtype=np.float64)
+    Z = np.random.default_rng(0).random((520, 600)).astype("float32")
+    levels = build_pyramid(x, y, Z, Z.copy())
+    assert list(levels) == [2]
+    xl, yl, Zl, El = levels[2]
+    assert (Zl.dtype, El.dtype) == (np.float32, np.float32)
+    assert (xl.dtype, yl.dtype) == (np.float64, np.float64)
+    assert np.allclose(Zl[0, 0], Z[:2, :2].mean())
+
+
+def test_pyramid_float64_and_z_only():
+    x = np.arange(600, dtype=np.float64)
+    y = np.arange(520, dtype=np.float64)
+    Z = np.ones((520, 600))
+    _, _, Zl, El = build_pyramid(x, y, Z, None)[2]
+    assert Zl.dtype == np.float64
+    assert El is None
+
+
+def test_small_grid_writes_no_pyramid(tmp_path, capsys):
+    x = np.arange(40, dtype=np.float64)
+    y = np.arange(30, dtype=np.float64)
+    Z = np.zeros((30, 40))
+    levels = build_pyramid(x, y, Z, Z)
+    assert levels == {}
+    base = str(tmp_path / "small")
+    open(base + ".ovr", "wb").close()  # stale pyramid of a previous grid
+    write_pyramid(base, levels)
+    assert not (tmp_path / "small.ovr").exists()
+    assert read_pyramid(base) is None
+    assert "too small" in capsys.readouterr().out